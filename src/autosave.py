@@ -0,0 +1,192 @@
+"""
+This file contains the background thread that periodically saves the changes made to the records
+of the HotelDatabase object to the sqlite3 database file without blocking the menu in main.py.
+
+All the changes made since the last flush are coalesced and written in a single transaction.
+To avoid seeing a change that is only partially applied, the HotelDatabase object is only locked
+while the rows to write are copied out of the records (the snapshot handoff). The rows are then
+written to the database file after the lock is released so the menu can continue to change the records.
+
+The only exception is when the whole table has to be rewritten after the records are reordered
+(e.g. after sorting) as the rewrite renumbers the ROWID of the records.
+"""
+
+# import standard libraries
+import sqlite3
+from threading import Thread, Event, Lock
+from time import perf_counter
+
+# import local python files
+from functions import DB_CONNECTION, query_save_state, get_db_file_version, prepare_changes, \
+                      write_changes_to_db_file, prepare_rewrite, write_new_db_file, renumber_records, \
+                      log_error
+
+# number of seconds between each flush of the changes to the database file
+AUTOSAVE_INTERVAL = 5.0
+
+class AutosaveThread(Thread):
+    """
+    Creates a daemon AutosaveThread object that flushes the changes
+    of the HotelDatabase object to the sqlite3 database file periodically.
+
+    Requires one argument:
+    - db (HotelDatabase): the HotelDatabase object which must not be in the SQL query mode
+
+    Optional argument:
+    - interval (float): the number of seconds between each flush, defaults to AUTOSAVE_INTERVAL
+
+    Call start() to start the thread and stop() to stop it after the final flush.
+    """
+    def __init__(self, db, interval:float=AUTOSAVE_INTERVAL) -> None:
+        super().__init__(name="AutosaveThread", daemon=True)
+        self.__db = db
+        self.__interval = interval
+        self.__stop_event = Event()
+
+        # to only allow one flush at a time, e.g. if flush() is called by the menu during a periodic flush
+        self.__flush_lock = Lock()
+
+        # if a flush fails after the records have been renumbered for a rewrite or the
+        # changes have been cleared, the next flush has to rewrite the whole table
+        self.__rewrite_required = False
+
+        # metrics of the flushes
+        self.__num_of_flushes = 0
+        self.__num_of_failed_flushes = 0
+        self.__total_rows_flushed = 0
+        self.__last_rows_per_flush = 0
+        self.__last_flush_latency = 0.0
+        self.__max_flush_latency = 0.0
+        self.__total_flush_latency = 0.0
+
+    def run(self) -> None:
+        """
+        Flush the changes every interval until the thread is stopped
+        """
+        while (not self.__stop_event.wait(self.__interval)):
+            try:
+                self.flush()
+            except (sqlite3.Error, OSError):
+                # log the error and try again on the next interval instead of stopping the thread
+                self.__num_of_failed_flushes += 1
+                log_error()
+
+    def stop(self) -> None:
+        """
+        Stop the thread and wait for the current flush (if any) to finish
+        """
+        self.__stop_event.set()
+        if (self.is_alive()):
+            self.join()
+
+    def flush(self) -> bool:
+        """
+        Write all the changes made since the last flush to the sqlite3 database file in a single transaction.
+
+        Returns True if the changes were written, False if there were no changes to write.
+        """
+        with self.__flush_lock:
+            startTime = perf_counter()
+            db = self.__db
+            # the connection is locked for the whole flush so that it is not used by another thread
+            # in the middle of the transaction (the HotelDatabase object is only locked for the handoff)
+            with DB_CONNECTION as con:
+                try:
+                    maxRowId, configTuple, dbVersion = query_save_state(con)
+                except (sqlite3.OperationalError):
+                    # the table is missing from the database file, hence it has to be rewritten
+                    maxRowId = configTuple = None
+                    dbVersion = get_db_file_version(con)
+
+                # the snapshot handoff where the rows are copied while the records cannot be changed
+                with db.lock:
+                    changes = None
+                    if (not self.__rewrite_required and maxRowId is not None):
+                        changes = prepare_changes(db, maxRowId, configTuple)
+
+                    if (changes is False):
+                        if (db.journal is not None and db.journal.num_of_entries > 0):
+                            # the journalled changes cancel out, e.g. a new record that was deleted
+                            db.journal.reset(dbVersion)
+                        return False
+
+                    if (changes is None):
+                        # the whole table has to be rewritten (e.g. after sorting) which renumbers 
+                        # the ROWID of the records, hence the rewrite is done while holding the lock 
+                        # as any changes journalled during the rewrite would refer to the new ROWIDs
+                        rows, rewriteConfigTuple = prepare_rewrite(db)
+                        write_new_db_file(rows, rewriteConfigTuple)
+                        renumber_records(db)
+                        db.clear_unsaved_changes()
+                        if (db.journal is not None):
+                            db.journal.reset(dbVersion + 1, maxRowId=len(rows))
+                        self.__rewrite_required = False
+                        self.__update_metrics(startTime, len(rows))
+                        return True
+
+                    db.clear_unsaved_changes()
+                    if (db.journal is not None):
+                        # the journal is only truncated after the changes are committed
+                        db.journal.rotate(dbVersion + 1)
+
+                    # if the write fails, the changes are no longer tracked,
+                    # hence the next flush will rewrite the whole table instead
+                    self.__rewrite_required = True
+
+                # write the rows to the database file without holding the lock
+                write_changes_to_db_file(con, changes)
+                self.__rewrite_required = False
+
+            if (db.journal is not None):
+                db.journal.discard_rotated()
+
+            self.__update_metrics(startTime, len(changes[0]) + len(changes[1]) + len(changes[2]))
+            return True
+
+    def __update_metrics(self, startTime:float, numOfRows:int) -> None:
+        """
+        Update the metrics after a successful flush
+
+        Requires two arguments:
+        - startTime (float): the perf_counter() value when the flush started
+        - numOfRows (int): the number of rows written in the flush
+        """
+        latency = perf_counter() - startTime
+        self.__num_of_flushes += 1
+        self.__total_rows_flushed += numOfRows
+        self.__last_rows_per_flush = numOfRows
+        self.__last_flush_latency = latency
+        self.__max_flush_latency = max(self.__max_flush_latency, latency)
+        self.__total_flush_latency += latency
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the metrics of the flushes in a dictionary with the following keys:
+        - "flushes": the number of successful flushes
+        - "failedFlushes": the number of flushes that failed
+        - "lastRowsPerFlush": the number of rows written in the last flush
+        - "avgRowsPerFlush": the average number of rows written per flush
+        - "lastFlushLatency": the number of seconds the last flush took
+        - "avgFlushLatency": the average number of seconds per flush
+        - "maxFlushLatency": the longest number of seconds a flush took
+        """
+        numOfFlushes = self.__num_of_flushes
+        return {
+            "flushes": numOfFlushes,
+            "failedFlushes": self.__num_of_failed_flushes,
+            "lastRowsPerFlush": self.__last_rows_per_flush,
+            "avgRowsPerFlush": (self.__total_rows_flushed / numOfFlushes) if (numOfFlushes) else 0,
+            "lastFlushLatency": self.__last_flush_latency,
+            "avgFlushLatency": (self.__total_flush_latency / numOfFlushes) if (numOfFlushes) else 0.0,
+            "maxFlushLatency": self.__max_flush_latency
+        }
+
+    @property
+    def rewrite_required(self) -> bool:
+        """
+        Return whether the next save has to rewrite the whole table as a flush has failed
+
+        Returns:
+        bool: True if the whole table has to be rewritten
+        """
+        return self.__rewrite_required
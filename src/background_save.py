@@ -0,0 +1,184 @@
+"""
+This file contains the background save (like Redis' BGSAVE) which writes the records of the HotelDatabase object
+to a new sqlite3 database file in a forked child process so that the menu does not have to wait for the save.
+
+When the process is forked, the child process gets a copy-on-write copy of the parent's memory, i.e. the pages
+are shared until either process writes to them. Hence, the child process sees the records exactly as they were
+when the process was forked (a consistent snapshot) without the records being copied or locked for the whole save,
+and the parent process can continue to change the records while the child process writes the new database file.
+
+The child process writes the new database file to BGSAVE_FILE_PATH (through a temporary file) and the parent process
+replaces the sqlite3 database file with it once the child process has exited successfully. The parent process does
+the replacement instead of the child process as the parent process has to close its connection to the old database file
+first so that its write-ahead log is not applied to the new database file. If the program is terminated before that,
+the new database file will replace the old one upon the next startup (see promote_background_save() in functions.py).
+
+The journal is rotated when the process is forked so that the changes made during the save are journalled separately:
+- if the records are still in the order of their ROWID, the new database file keeps the ROWID of the records and
+  is given the version after the rotated journal (v + 1), i.e. the same as the old database file after the rotated
+  journal is replayed. Hence, the new journal is replayed on top of either of them if the program is terminated.
+- otherwise (e.g. after sorting), the records have to be renumbered in the new database file, hence the new journal
+  refers to the new ROWIDs and is started on version v + 2 so that it is never replayed on top of the old database file.
+  The changes made during such a save will be lost if the program is terminated before the save has finished.
+
+Background saves are only supported on systems with os.fork() (not Windows), the records are saved synchronously otherwise.
+"""
+
+# import standard libraries
+import os, signal, sqlite3
+
+# import local python files
+from functions import DB_CONNECTION, DB_FILE_PATH, BGSAVE_FILE_PATH, check_if_db_file_exists, \
+                      check_if_db_file_is_normalised, query_save_state, prepare_changes, prepare_rewrite, \
+                      get_record_rows, renumber_records, write_db_tables, save_db_file, log_error
+
+def write_background_save(rows:list, configTuple:tuple, normalisedSchema:bool, dbVersion:int) -> None:
+    """
+    Write the rows to a new sqlite3 database file which will then be renamed to BGSAVE_FILE_PATH.
+
+    Run in the child process with its own connection as the parent's connection cannot be used after forking.
+
+    Requires four arguments:
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+    - configTuple (tuple): the HotelDatabase object's configuration (sorting order and descending flag)
+    - normalisedSchema (bool): whether the old database file uses the normalised schema
+    - dbVersion (int): the version to give the new database file
+    """
+    tempFilePath = BGSAVE_FILE_PATH.with_name(BGSAVE_FILE_PATH.name + ".tmp")
+    tempFilePath.unlink(missing_ok=True)
+
+    con = sqlite3.connect(tempFilePath)
+    try:
+        write_db_tables(con, rows, configTuple, normalisedSchema=normalisedSchema, dbVersion=dbVersion)
+    finally:
+        con.close()
+    os.replace(tempFilePath, BGSAVE_FILE_PATH)
+
+class BackgroundSave:
+    """
+    Creates a BackgroundSave object to check on the child process that is writing the new database file.
+
+    Use start_background_save() instead of creating the object directly.
+
+    Requires two arguments:
+    - pid (int): the process ID of the child process
+    - db (HotelDatabase)
+    """
+    def __init__(self, pid:int, db) -> None:
+        self.__pid = pid
+        self.__db = db
+        self.__result = None
+
+    def poll(self, block:bool=False):
+        """
+        Check if the child process has exited and replace the sqlite3 database file with
+        the new database file if it was written successfully. If the child process failed,
+        the records are saved synchronously instead.
+
+        Optional argument:
+        - block (bool): to wait for the child process to exit if True, defaults to False
+
+        Returns None if the child process is still running, True if the background save succeeded,
+        or False if it failed.
+        """
+        if (self.__result is not None):
+            return self.__result
+
+        pid, status = os.waitpid(self.__pid, 0 if (block) else os.WNOHANG)
+        if (pid == 0):
+            return None
+
+        db = self.__db
+        if (os.waitstatus_to_exitcode(status) == 0 and BGSAVE_FILE_PATH.is_file()):
+            # close the connection first so that the write-ahead log is checkpointed into the old database file
+            with DB_CONNECTION:
+                DB_CONNECTION.close()
+                os.replace(BGSAVE_FILE_PATH, DB_FILE_PATH)
+            if (db.journal is not None):
+                db.journal.discard_rotated()
+            self.__result = True
+        else:
+            # the records in the parent process may have been renumbered, hence the whole table has to be rewritten
+            BGSAVE_FILE_PATH.unlink(missing_ok=True)
+            save_db_file(db, printSuccessMsg=False, fullRewrite=True)
+            self.__result = False
+        return self.__result
+
+    def wait(self) -> bool:
+        """
+        Wait for the child process to exit, e.g. before saving the records when exiting the program
+
+        Returns True if the background save succeeded, False if it failed.
+        """
+        return self.poll(block=True)
+
+    @property
+    def pid(self) -> int:
+        """
+        Returns the process ID of the child process
+        """
+        return self.__pid
+
+def start_background_save(db):
+    """
+    Fork a child process to save all the records of the HotelDatabase object to a new sqlite3 database file.
+
+    The records are saved synchronously instead if os.fork() is not supported, the HotelDatabase object is in
+    the SQL query mode, or the database file does not exist yet.
+
+    Requires one argument:
+    - db (HotelDatabase)
+
+    Returns the BackgroundSave object of the child process or None if the records were saved synchronously
+    or there were no changes to save.
+    """
+    if (not hasattr(os, "fork") or db.sql_query_mode or not check_if_db_file_exists() or BGSAVE_FILE_PATH.is_file()):
+        save_db_file(db, printSuccessMsg=False)
+        return None
+
+    normalisedSchema = check_if_db_file_is_normalised()
+    with db.lock:
+        try:
+            with DB_CONNECTION as con:
+                maxRowId, configTuple, dbVersion = query_save_state(con)
+        except (sqlite3.OperationalError, sqlite3.DatabaseError):
+            save_db_file(db, printSuccessMsg=False, fullRewrite=True)
+            return None
+
+        # gives the newly added records a ROWID (if they do not have one yet)
+        changes = prepare_changes(db, maxRowId, configTuple)
+        if (changes is False):
+            if (db.journal is not None and db.journal.num_of_entries > 0):
+                # the journalled changes cancel out, e.g. a new record that was deleted
+                db.journal.reset(dbVersion)
+            return None
+        renumberRecords = (changes is None)
+
+        pid = os.fork()
+        if (pid == 0):
+            # child process: let the parent handle the interrupt (e.g. CTRL + C) so that the save can finish
+            exitCode = 1
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                if (renumberRecords):
+                    rows, rewriteConfigTuple = prepare_rewrite(db)
+                    write_background_save(rows, rewriteConfigTuple, normalisedSchema, dbVersion + 2)
+                else:
+                    write_background_save(get_record_rows(db.get_array()), (db.sort_order, db.descending_flag), \
+                                          normalisedSchema, dbVersion + 1)
+                exitCode = 0
+            except:
+                log_error()
+            finally:
+                # exit without running the parent's cleanup (e.g. atexit handlers and flushing the copied buffers)
+                os._exit(exitCode)
+
+        # parent process
+        db.clear_unsaved_changes()
+        if (renumberRecords):
+            renumber_records(db)
+            if (db.journal is not None):
+                db.journal.rotate(dbVersion + 2, maxRowId=len(db))
+        elif (db.journal is not None):
+            db.journal.rotate(dbVersion + 1)
+    return BackgroundSave(pid, db)
@@ -1,24 +1,28 @@
 # import python standard libraries
 from random import randint, sample
 
-def is_sorted(arr:list, reverse:bool=False) -> bool:
+# import local python files
+from field_keys import PACKAGE_NAME_KEY
+
+def is_sorted(arr:list, reverse:bool=False, key=PACKAGE_NAME_KEY) -> bool:
     """
     Checks if the array is sorted.
     
     Function is used for bogosort and bozosort.
     
-    Requires two arguments:
+    Requires three arguments:
     - arr: the array to be checked
     - reverse: if True, the array will be sorted in a descending order (default: False)
+    - key: the key extractor of the field to check by, see field_keys.py (default: PACKAGE_NAME_KEY)
     """
     for i in range(len(arr) - 1):
-        if (not reverse and arr[i].get_package_name() > arr[i + 1].get_package_name()):
+        if (not reverse and key(arr[i]) > key(arr[i + 1])):
             return False
-        elif (reverse and arr[i].get_package_name() < arr[i + 1].get_package_name()):
+        elif (reverse and key(arr[i]) < key(arr[i + 1])):
             return False
     return True
 
-def bogo_sort(arr:list, variant:bool=False, reverse:bool=False) -> int:
+def bogo_sort(arr:list, variant:bool=False, reverse:bool=False, key=PACKAGE_NAME_KEY) -> int:
     """
     Randomly shuffles the array until it is sorted by package name.
     
@@ -26,11 +30,12 @@ def bogo_sort(arr:list, variant:bool=False, reverse:bool=False) -> int:
     Worst Time Complexity: O(inf) as this algorithm has no upper bound
     Average Time Complexity: O(n*n!)
 
-    Requires three arguments:
+    Requires four arguments:
     - arr: the array to be sorted
     - variant: if True, the array will be sorted using bozosort, a variant of bogosort
         - Bozosort works by randomly swapping two elements in the array until it is sorted by package name.
     - reverse: if True, the array will be sorted in a descending order (default: False)
+    - key: the key extractor of the field to sort by, see field_keys.py (default: PACKAGE_NAME_KEY)
     
     Returns the number of shuffling/swappings done to sort the array.
     
@@ -41,7 +46,7 @@ def bogo_sort(arr:list, variant:bool=False, reverse:bool=False) -> int:
         - https://www.youtube.com/shorts/xsoJsd48lZQ?feature=share
     """
     c = 0
-    while (not is_sorted(arr, reverse=reverse)):
+    while (not is_sorted(arr, reverse=reverse, key=key)):
         if (not variant):
             # shuffle the whole array (bogo sort)
             for i in range(len(arr)):
@@ -1,4 +1,7 @@
-def gnome_sort(arr:list, reverse:bool=False) -> None:
+# import local python files
+from field_keys import PAX_NUM_KEY
+
+def gnome_sort(arr:list, reverse:bool=False, key=PAX_NUM_KEY) -> None:
     """
     ⣿⣿⣿⣿⣿⠟⠉⠁⠄⠄⠄⠈⠙⠿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿\n
     ⣿⣿⣿⣿⠏⠄⠄⠄⠄⠄⠄⠄⠄⠄⠸⢿⣿⣿⣿⣿⣿⣿⣿⣿\n
@@ -37,9 +40,10 @@ def gnome_sort(arr:list, reverse:bool=False) -> None:
     - GNOME SORT: How (NOT) To Sort Your Arrays.
         - https://youtu.be/pMjAllOR3eY
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr: the array to be sorted
     - reverse: if True, sorts in descending order (defaults to False)
+    - key: the key extractor of the field to sort by, see field_keys.py (defaults to PAX_NUM_KEY)
     
     Best Time Complexity: O(n)
     Worst Time Complexity: O(n^2)
@@ -54,7 +58,7 @@ def gnome_sort(arr:list, reverse:bool=False) -> None:
 
         if (not reverse): 
             # ascending order
-            if (arr[i - 1].get_pax_num() <= arr[i].get_pax_num()):
+            if (key(arr[i - 1]) <= key(arr[i])):
                 # if the current element is greater than or equal to the previous element,
                 # increment i to check the next element since it's in the correct order
                 i += 1
@@ -65,7 +69,7 @@ def gnome_sort(arr:list, reverse:bool=False) -> None:
                 i -= 1
         else: 
             # descending order
-            if (arr[i - 1].get_pax_num() >= arr[i].get_pax_num()):
+            if (key(arr[i - 1]) >= key(arr[i])):
                 # if the current element is smaller than or equal to the previous element,
                 # increment i to check the next element since it's in the correct order
                 i += 1
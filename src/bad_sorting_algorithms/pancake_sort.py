@@ -1,3 +1,6 @@
+# import local python files
+from field_keys import PACKAGE_NAME_KEY
+
 def flip(arr:list, i:int) -> None:
     """
     Flip the elements in the array (used to reverse arr[0..i])
@@ -12,7 +15,7 @@ def flip(arr:list, i:int) -> None:
         start += 1
         i -= 1
 
-def find_max_or_min(arr:list, n:int, reverse:bool=False, mode:str="packageName") -> int:
+def find_max_or_min(arr:list, n:int, reverse:bool=False, key=PACKAGE_NAME_KEY) -> int:
     """
     To find the index of the maximum or minimum element in arr[0..n-1]
     
@@ -20,22 +23,26 @@ def find_max_or_min(arr:list, n:int, reverse:bool=False, mode:str="packageName")
     - arr (list): The array of elements to find the maximum or minimum element in
     - n (int): The size of the array
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    - mode (str): The mode of sorting (Default: "packageName")
+    - key (function): The key extractor of the field to compare, see field_keys.py (Default: PACKAGE_NAME_KEY)
     """
     if (not reverse):
         maxIdx = 0
+        maxKey = key(arr[0])
         for i in range(0, n):
-            if (arr[i].get_val(mode) > arr[maxIdx].get_val(mode)):
-                maxIdx = i
+            iKey = key(arr[i])
+            if (iKey > maxKey):
+                maxIdx, maxKey = i, iKey
         return maxIdx
     else:
         minIdx = 0
+        minKey = key(arr[0])
         for i in range(0, n):
-            if (arr[i].get_val(mode) < arr[minIdx].get_val(mode)):
-                minIdx = i
+            iKey = key(arr[i])
+            if (iKey < minKey):
+                minIdx, minKey = i, iKey
         return minIdx
 
-def pancake_sort(arr:list, reverse:bool=False, mode:str="packageName") -> None:
+def pancake_sort(arr:list, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None:
     """
     Do a pancake sort on the database by package name.
     There will be O(n) number of flips performed to sort the array.
@@ -44,7 +51,7 @@ def pancake_sort(arr:list, reverse:bool=False, mode:str="packageName") -> None:
     Requires three arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    - mode (str): The mode of sorting (Default: "packageName")
+    - key (function): The key extractor of the field to sort by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Best time complexity: O(n) when the array is already sorted and no flips are needed.
     Worst time complexity: O(n^2)
@@ -58,7 +65,7 @@ def pancake_sort(arr:list, reverse:bool=False, mode:str="packageName") -> None:
     for currSize in range(len(arr)-1, 0, -1):
         # get the index of the maximum or minimum value from the array based on the descending order argument
         # in arr[0..currSize+1]
-        idxToFlip = find_max_or_min(arr, currSize + 1, reverse=reverse, mode=mode)
+        idxToFlip = find_max_or_min(arr, currSize + 1, reverse=reverse, key=key)
         if (idxToFlip != currSize):
             # flip the maximum or minimum value to index 0
             flip(arr, idxToFlip)
@@ -2,6 +2,9 @@
 from time import sleep
 from threading import Timer
 
+# import local python files
+from field_keys import PAX_NUM_KEY
+
 def add_to_list(el, arr:list) -> None:
     """
     Adds the element to the list.
@@ -14,7 +17,7 @@ def add_to_list(el, arr:list) -> None:
     """
     arr.append(el)
 
-def sleep_sort(arr:list, reverse:bool=False) -> list:
+def sleep_sort(arr:list, reverse:bool=False, key=PAX_NUM_KEY) -> list:
     """
     Creates different threads for each elements and 
     each thread sleeps for an amount of time proportional to the element's value.
@@ -27,9 +30,10 @@ def sleep_sort(arr:list, reverse:bool=False) -> list:
     
     Space Complexity: O(n)
     
-    Requires two arguments:
+    Requires three arguments:
     - arr: the array to be sorted
     - reverse: if True, the array will be sorted in a descending order (default: False)
+    - key: the key extractor of the field (in seconds to sleep) to sort by, see field_keys.py (default: PAX_NUM_KEY)
     
     Returns the new sorted array.
     
@@ -42,16 +46,16 @@ def sleep_sort(arr:list, reverse:bool=False) -> list:
     maxEl = arr[0] # initialise the first element to be the maximum element
     for el in arr:
         # if the current element is greater than the maximum element
-        if (maxEl.get_pax_num() < el.get_pax_num()): 
+        if (key(maxEl) < key(el)): 
             # set the current element as the maximum element
             maxEl = el
 
         # create a thread for each element with the interval proportional to the element's value
         # and add the element to the list by calling the add_to_list function
-        Timer(el.get_pax_num(), add_to_list, (el, newArr)).start()
+        Timer(key(el), add_to_list, (el, newArr)).start()
 
     # wait for all threads to finish
-    sleep(maxEl.get_pax_num() + 1)
+    sleep(key(maxEl) + 1)
     if (not reverse):
         # return sorted array (in ascending order)
         return newArr
@@ -1,4 +1,7 @@
-def slow_sort(arr:list, i:int, j:int, reverse:bool=False) -> None:
+# import local python files
+from field_keys import COST_IN_CENTS_KEY
+
+def slow_sort(arr:list, i:int, j:int, reverse:bool=False, key=COST_IN_CENTS_KEY) -> None:
     """
     Based on the principle of multiply and surrender which is the opposite of divide and conquer.
     
@@ -16,11 +19,12 @@ def slow_sort(arr:list, i:int, j:int, reverse:bool=False) -> None:
     - Move the highest element to the end of the array
     - Repeat the process from the top excluding the highest elements at the end for the remaining elements
     
-    Requires four arguments:
+    Requires five arguments:
     - arr: the array to be sorted
     - i: the starting index of the array
     - j: the ending index of the array
     - reverse: if True, the array will be sorted in a descending order (default: False)
+    - key: the key extractor of the field to sort by, see field_keys.py (default: COST_IN_CENTS_KEY)
     
     References:
     - Slow Sort Visualisation
@@ -33,19 +37,19 @@ def slow_sort(arr:list, i:int, j:int, reverse:bool=False) -> None:
     mid = (i + j) // 2
 
     # recursively sort the left half
-    slow_sort(arr, i, mid, reverse=reverse)
+    slow_sort(arr, i, mid, reverse=reverse, key=key)
 
     # recursively sort the right half
-    slow_sort(arr, mid + 1, j, reverse=reverse)
+    slow_sort(arr, mid + 1, j, reverse=reverse, key=key)
 
     if (not reverse):
         # swap the elements if jth element is greater than the mid element
-        if (arr[j].get_cost_per_pax() < arr[mid].get_cost_per_pax()):
+        if (key(arr[j]) < key(arr[mid])):
             arr[j], arr[mid] = arr[mid], arr[j]
     else:
         # swap the elements if jth element is less than the mid element
-        if (arr[j].get_cost_per_pax() > arr[mid].get_cost_per_pax()):
+        if (key(arr[j]) > key(arr[mid])):
             arr[j], arr[mid] = arr[mid], arr[j]
 
     # recursively sort the whole array again except the last jth element as it is the maximum element
-    slow_sort(arr, i, j - 1, reverse=reverse)
\ No newline at end of file
+    slow_sort(arr, i, j - 1, reverse=reverse, key=key)
\ No newline at end of file
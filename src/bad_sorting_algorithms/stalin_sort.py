@@ -1,4 +1,7 @@
-def stalin_sort(arr:list, reverse:bool=False) -> list:
+# import local python files
+from field_keys import CUSTOMER_NAME_KEY
+
+def stalin_sort(arr:list, reverse:bool=False, key=CUSTOMER_NAME_KEY) -> list:
     """
     ⡿⠄⢀⣼⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⠞⠛⠁⠄⡼⣿⣿⣿\n
     ⣿⡇⠄⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠙⣦⠐⠠⡥⣿⣿\n
@@ -27,9 +30,10 @@ def stalin_sort(arr:list, reverse:bool=False) -> list:
     
     Space Complexity: O(n)
 
-    Requires two arguments:
+    Requires three arguments:
     - arr: the array to be sorted
     - reverse: if True, the array will be sorted in a descending order (default: False)
+    - key: the key extractor of the field to sort by, see field_keys.py (default: CUSTOMER_NAME_KEY)
     
     Returns the new sorted array.
     
@@ -40,16 +44,17 @@ def stalin_sort(arr:list, reverse:bool=False) -> list:
     if (len(arr) <= 1):
         return arr
 
-    temp = arr[0]
+    tempKey = key(arr[0])
     newArr = []
     for el in arr:
+        elKey = key(el)
         if (not reverse):
-            if (el.get_customer_name() >= temp.get_customer_name()):
+            if (elKey >= tempKey):
                 newArr.append(el)
-                temp = el
+                tempKey = elKey
         else:
-            if (el.get_customer_name() <= temp.get_customer_name()):
+            if (elKey <= tempKey):
                 newArr.append(el)
-                temp = el
+                tempKey = elKey
 
     return newArr
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+This file is not part of the main program.
+However, it is used to measure the memory used per booking record (in bytes)
+when the records are loaded into a HotelDatabase object.
+
+The memory is measured with tracemalloc which traces every allocation made by Python,
+hence the records are generated before tracing starts and only the RecordData objects
+and the HotelDatabase's array and indexes are measured, i.e. the record index, the AVL tree of the 
+customer names (including its linkedlists), the sorted indexes of the other fields, the cost aggregates,
+and the radix trie and n-gram indexes of the names.
+
+Usage:
+    python benchmark_memory.py [--num-of-records N] [--columnar]
+"""
+
+# import local python files
+from hotel_record import HotelDatabase, RecordData
+from functions import PACKAGE_NAME_PRESETS, CUSTOMER_NAME_PRESETS
+
+# import standard libraries
+import gc, argparse, tracemalloc
+from random import choice, randint
+from sys import exit as sysExit
+
+# default number of records to measure
+BENCHMARK_NUM_OF_RECORDS = 1000000
+
+def generate_rows(numOfRecords:int) -> list:
+    """
+    Returns an array of randomly generated rows in the same order as the HotelDatabase's bulk_load rows,
+    (packageName, customerName, paxNum, costInCents, rowId)
+
+    The names are picked from the presets, hence most of the records have the same names
+    like the records generated by create_records.py.
+
+    Requires one argument:
+    - numOfRecords (int)
+    """
+    return [(choice(PACKAGE_NAME_PRESETS), choice(CUSTOMER_NAME_PRESETS), randint(1, 9), randint(5000, 100000), rowId) \
+            for rowId in range(1, numOfRecords + 1)]
+
+def measure(func, *args) -> tuple:
+    """
+    Call the function and measure the memory allocated by it that is still in use afterwards
+
+    Requires one argument:
+    - func (function)
+
+    Returns a tuple of (return value of the function, number of bytes allocated, peak number of bytes allocated)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        currentSize, peakSize = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, currentSize, peakSize
+
+def create_records(rows:list) -> list:
+    """
+    Returns an array of RecordData objects created from the rows
+    """
+    return [RecordData.from_row(*row) for row in rows]
+
+def create_db(rows:list, columnar:bool=False) -> HotelDatabase:
+    """
+    Returns a HotelDatabase object with the rows loaded into its array and indexes
+    (or into its columns in the columnar mode)
+    """
+    db = HotelDatabase(columnar=columnar)
+    db.bulk_load(rows)
+    return db
+
+def main() -> int:
+    """
+    This program helps to measure the memory used per booking record!
+    """
+    parser = argparse.ArgumentParser(description="Measure the memory used per booking record of Waffle Hotel's staycation booking records.")
+    parser.add_argument("--num-of-records", dest="numOfRecords", type=int, default=BENCHMARK_NUM_OF_RECORDS,
+                        help=f"the number of records to generate, defaults to {BENCHMARK_NUM_OF_RECORDS}")
+    parser.add_argument("--columnar", action="store_true",
+                        help="also measure the HotelDatabase object in the columnar mode")
+    args = parser.parse_args()
+    if (args.numOfRecords < 1):
+        parser.error("--num-of-records must be at least 1")
+
+    numOfRecords = args.numOfRecords
+    print(f"Generating {numOfRecords} records...")
+    rows = generate_rows(numOfRecords)
+
+    records, recordsSize, _ = measure(create_records, rows)
+    del records
+    print(f"RecordData objects only: {recordsSize / numOfRecords:.1f} bytes per booking ({recordsSize / 1024 ** 2:.1f}MB)")
+
+    db, dbSize, dbPeakSize = measure(create_db, rows)
+    del db
+    print(f"HotelDatabase (array and indexes): {dbSize / numOfRecords:.1f} bytes per booking ({dbSize / 1024 ** 2:.1f}MB)")
+    print(f"Peak while loading: {dbPeakSize / numOfRecords:.1f} bytes per booking ({dbPeakSize / 1024 ** 2:.1f}MB)")
+
+    if (args.columnar):
+        db, dbSize, dbPeakSize = measure(create_db, rows, True)
+        del db
+        print(f"HotelDatabase (columnar mode): {dbSize / numOfRecords:.1f} bytes per booking ({dbSize / 1024 ** 2:.1f}MB)")
+        print(f"Peak while loading: {dbPeakSize / numOfRecords:.1f} bytes per booking ({dbPeakSize / 1024 ** 2:.1f}MB)")
+    return 0
+
+if (__name__ == "__main__"):
+    sysExit(main())
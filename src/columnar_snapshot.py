@@ -0,0 +1,325 @@
+"""
+This file contains the functions to write and read the columnar snapshot of the HotelDatabase object.
+
+Unlike the sqlite3 database file which stores the records row by row, the snapshot stores each field
+of the records as a column so that it can be memory-mapped and read without parsing every row:
+- number of pax, cost per pax (in cents), and ROWID are stored as packed integer arrays
+- package names and customer names are dictionary-encoded, i.e. each unique name is stored once
+  in a string table and each record only stores the integer code (index) of its name
+- the order of the records sorted by customer name is precomputed and stored
+  so that the AVL tree can be built without sorting the customer names
+- the orders of the records sorted by package name, cost per pax, and number of pax are also stored
+  so that the sorted views of the records can be restored without sorting them again
+
+File layout (all integers are little-endian and each section starts at a multiple of 8 bytes):
+- header: magic bytes, version, number of records, number of package names, number of customer names,
+          descending flag, length of the sort order string, followed by the offset of each section
+- sort order string (utf-8)
+- package names string table: (number of package names + 1) uint32 offsets, followed by the utf-8 bytes
+- customer names string table: same as the package names string table
+- package name codes: uint32 array
+- customer name codes: uint32 array
+- number of pax: uint32 array
+- cost per pax in cents: int64 array
+- ROWID: int64 array
+- customer name order: uint32 array of the indexes of the records sorted by customer name
+- package name order, cost per pax order, number of pax order: same as the customer name order
+"""
+
+# import standard libraries
+import mmap, os, pathlib, struct, sys
+from array import array
+from typing import Union
+
+SNAPSHOT_MAGIC = b"WHSNAP01"
+SNAPSHOT_VERSION = 2
+
+# magic, version, number of records, number of package names, number of customer names,
+# descending flag, length of the sort order string
+HEADER_FORMAT = "<8sIQQQII"
+
+# sections after the header in the order that they are written
+SECTIONS = ("sortOrder", "packageNames", "customerNames", "packageCodes", "customerCodes", \
+            "paxNum", "costPerPax", "rowId", "customerOrder", "packageOrder", "costPerPaxOrder", "paxNumOrder")
+
+# the array typecode of each integer column section
+COLUMN_TYPECODES = {
+    "packageCodes": "I",
+    "customerCodes": "I",
+    "paxNum": "I",
+    "costPerPax": "q",
+    "rowId": "q",
+    "customerOrder": "I",
+    "packageOrder": "I",
+    "costPerPaxOrder": "I",
+    "paxNumOrder": "I"
+}
+
+# the field that each order section is sorted by
+ORDER_SECTIONS = {
+    "customerOrder": "customerName",
+    "packageOrder": "packageName",
+    "costPerPaxOrder": "costPerPax",
+    "paxNumOrder": "paxNum"
+}
+
+class SnapshotError(Exception):
+    """
+    Errors in the columnar snapshot file such as an invalid header or a different version
+    """
+    pass
+
+def align(offset:int) -> int:
+    """
+    Returns the offset rounded up to the next multiple of 8 so that every
+    section can be cast to an array of integers without copying
+
+    Requires one argument:
+    - offset (int)
+    """
+    return (offset + 7) & ~7
+
+def to_little_endian(arr:array) -> bytes:
+    """
+    Returns the bytes of the array in little-endian byte order
+
+    Requires one argument:
+    - arr (array)
+    """
+    if (sys.byteorder == "big"):
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+def encode_string_table(strings:list) -> bytes:
+    """
+    Encode the strings into a string table which consists of (n + 1) uint32 offsets
+    followed by all the strings encoded in utf-8 so that the ith string is
+    the bytes between the ith and (i+1)th offset.
+
+    Requires one argument:
+    - strings (list)
+    """
+    encodedStrings = [string.encode("utf-8") for string in strings]
+    offsets = array("I", [0])
+    for encodedString in encodedStrings:
+        offsets.append(offsets[-1] + len(encodedString))
+    return to_little_endian(offsets) + b"".join(encodedStrings)
+
+def dictionary_encode(values:list) -> tuple:
+    """
+    Dictionary-encode the values by giving each unique value an integer code
+
+    Requires one argument:
+    - values (list)
+
+    Returns a tuple of (array of the unique values, array of the code of each value)
+    """
+    codeDict = {}
+    codes = array("I")
+    for value in values:
+        code = codeDict.get(value)
+        if (code is None):
+            code = codeDict[value] = len(codeDict)
+        codes.append(code)
+    return list(codeDict), codes
+
+def get_sorted_order(values:list) -> array:
+    """
+    Returns the indexes of the values in ascending order of the values.
+
+    The sort is stable so that records with the same value will be in the same order as the array,
+    e.g. like in the AVL tree's linkedlists for records with the same customer name.
+
+    Requires one argument:
+    - values (list)
+    """
+    return array("I", sorted(range(len(values)), key=values.__getitem__))
+
+def write_snapshot(db, filePath:pathlib.Path) -> None:
+    """
+    Write the records of the HotelDatabase object in their current order to the columnar snapshot file.
+
+    The snapshot is written to a temporary file first and then renamed
+    to the file path so that a partially written snapshot will never be read.
+
+    Note: The records must have been saved to the sqlite3 database file first as their ROWID is stored.
+
+    Requires two arguments:
+    - db (HotelDatabase)
+    - filePath (pathlib.Path): the path of the snapshot file
+    """
+    records = db.get_array()
+    columns = {
+        "packageName": [record.get_package_name() for record in records],
+        "customerName": [record.get_customer_name() for record in records],
+        "paxNum": array("I", [record.get_pax_num() for record in records]),
+        "costPerPax": array("q", [record.get_cost_in_cents() for record in records])
+    }
+    packageNames, packageCodes = dictionary_encode(columns["packageName"])
+    customerNames, customerCodes = dictionary_encode(columns["customerName"])
+
+    sortOrder = db.sort_order.encode("utf-8")
+    sectionBytes = {
+        "sortOrder": sortOrder,
+        "packageNames": encode_string_table(packageNames),
+        "customerNames": encode_string_table(customerNames),
+        "packageCodes": to_little_endian(packageCodes),
+        "customerCodes": to_little_endian(customerCodes),
+        "paxNum": to_little_endian(columns["paxNum"]),
+        "costPerPax": to_little_endian(columns["costPerPax"]),
+        "rowId": to_little_endian(array("q", [record.get_row_id() for record in records]))
+    }
+    for section, field in ORDER_SECTIONS.items():
+        sectionBytes[section] = to_little_endian(get_sorted_order(columns[field]))
+
+    # calculate the offset of each section after the header
+    headerSize = struct.calcsize(HEADER_FORMAT) + (8 * len(SECTIONS))
+    offsets = []
+    offset = align(headerSize)
+    for section in SECTIONS:
+        offsets.append(offset)
+        offset = align(offset + len(sectionBytes[section]))
+
+    tempFilePath = filePath.with_name(filePath.name + ".tmp")
+    with open(tempFilePath, "wb") as f:
+        f.write(struct.pack(HEADER_FORMAT, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(records), len(packageNames), \
+                            len(customerNames), int(db.descending_flag), len(sortOrder)))
+        f.write(struct.pack(f"<{len(SECTIONS)}Q", *offsets))
+        for section, sectionOffset in zip(SECTIONS, offsets):
+            f.write(b"\0" * (sectionOffset - f.tell())) # padding for the alignment
+            f.write(sectionBytes[section])
+    os.replace(tempFilePath, filePath)
+
+class ColumnarSnapshot:
+    """
+    Creates a read-only ColumnarSnapshot object that memory-maps the columnar snapshot file.
+
+    The integer columns are memoryviews of the mapped file, hence only the pages of the file
+    that are accessed will be read from the disk. Only the string tables are decoded
+    upon initialisation as they only contain the unique names.
+
+    Requires one argument:
+    - filePath (pathlib.Path): the path of the snapshot file
+
+    Can be used as a context manager to close the memory-mapped file afterwards.
+    """
+    def __init__(self, filePath:pathlib.Path) -> None:
+        with open(filePath, "rb") as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, self.__len, numOfPackages, numOfCustomers, descendingFlag, sortOrderLen = \
+                struct.unpack_from(HEADER_FORMAT, self.__mmap, 0)
+        except (struct.error):
+            self.close()
+            raise SnapshotError("The snapshot file is too small to be a valid snapshot.")
+
+        if (magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION):
+            self.close()
+            raise SnapshotError("The snapshot file has an invalid header or is from a different version.")
+
+        offsets = struct.unpack_from(f"<{len(SECTIONS)}Q", self.__mmap, struct.calcsize(HEADER_FORMAT))
+        self.__offsets = dict(zip(SECTIONS, offsets))
+        self.__view = memoryview(self.__mmap)
+        self.__columns = {section: self.__get_column(section) for section in COLUMN_TYPECODES}
+
+        self.descending_flag = bool(descendingFlag)
+        self.sort_order = bytes(self.__view[offsets[0]:offsets[0] + sortOrderLen]).decode("utf-8")
+        self.package_names = self.__decode_string_table("packageNames", numOfPackages)
+        self.customer_names = self.__decode_string_table("customerNames", numOfCustomers)
+
+    def __get_column(self, section:str) -> Union[memoryview, array]:
+        """
+        Returns the integer column as a memoryview of the memory-mapped file without copying it
+        (or as a copied array on big-endian systems as the bytes have to be swapped)
+
+        Requires one argument:
+        - section (str): the name of the column section, e.g. "paxNum"
+        """
+        typecode = COLUMN_TYPECODES[section]
+        start = self.__offsets[section]
+        end = start + (self.__len * array(typecode).itemsize)
+        column = self.__view[start:end].cast(typecode)
+        if (sys.byteorder == "big"):
+            column = array(typecode, column)
+            column.byteswap()
+        return column
+
+    def __decode_string_table(self, section:str, numOfStrings:int) -> list:
+        """
+        Decode the string table into an array of strings
+
+        Requires two arguments:
+        - section (str): the name of the string table section, e.g. "packageNames"
+        - numOfStrings (int): the number of strings in the string table
+        """
+        start = self.__offsets[section]
+        offsetsEnd = start + ((numOfStrings + 1) * 4)
+        offsets = array("I", bytes(self.__view[start:offsetsEnd]))
+        if (sys.byteorder == "big"):
+            offsets.byteswap()
+
+        return [bytes(self.__view[offsetsEnd + offsets[i]:offsetsEnd + offsets[i + 1]]).decode("utf-8") \
+                for i in range(numOfStrings)]
+
+    def get_column(self, section:str) -> Union[memoryview, array]:
+        """
+        Returns the integer column, e.g. "paxNum", "costPerPax" (in cents), "rowId",
+        "packageCodes", "customerCodes", or one of the order sections, e.g. "customerOrder"
+
+        Requires one argument:
+        - section (str): the name of the column
+        """
+        return self.__columns[section]
+
+    def iter_rows(self):
+        """
+        Generator to yield the records in the same order as the HotelDatabase's bulk_load rows,
+        (packageName, customerName, paxNum, costInCents, rowId)
+        """
+        columns = self.__columns
+        yield from zip(
+            map(self.package_names.__getitem__, columns["packageCodes"]),
+            map(self.customer_names.__getitem__, columns["customerCodes"]),
+            columns["paxNum"],
+            columns["costPerPax"],
+            columns["rowId"]
+        )
+
+    def __getitem__(self, index:int) -> tuple:
+        if (index < 0):
+            index += self.__len
+
+        if (index < 0 or index >= self.__len):
+            raise IndexError("ColumnarSnapshot index out of range")
+
+        columns = self.__columns
+        return (
+            self.package_names[columns["packageCodes"][index]],
+            self.customer_names[columns["customerCodes"][index]],
+            columns["paxNum"][index],
+            columns["costPerPax"][index],
+            columns["rowId"][index]
+        )
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def close(self) -> None:
+        """
+        Close the memory-mapped file
+        """
+        if (hasattr(self, "_ColumnarSnapshot__columns")):
+            # release the memoryviews before closing the memory-mapped file
+            for column in self.__columns.values():
+                if (isinstance(column, memoryview)):
+                    column.release()
+            self.__view.release()
+        self.__mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,8 +1,13 @@
+# import standard libraries
+from operator import methodcaller
+
 # import local python files
 if (__package__ is None or __package__ == ""):
-    from AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node
+    from AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node, \
+                                         build_balanced_tree
 else:
-    from .AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node
+    from .AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node, \
+                                          build_balanced_tree
 
 class AVLTree:
     """
@@ -29,20 +34,25 @@ class AVLTree:
     Useful websites that visualises the AVL tree rotations:
     - https://www.cs.usfca.edu/%7Egalles/visualization/AVLtree.html
     - https://visualgo.net/en/bst?mode=AVL
+    
+    Optional argument:
+    - key (function): the key extractor of the data to order the tree by (e.g. PACKAGE_NAME_KEY from field_keys.py), 
+                      defaults to the customer name of the data
     """
-    def __init__(self):
+    def __init__(self, key=methodcaller("get_customer_name")):
         self.root = None
+        self.key = key
 
     def tree_sort(self, reverse:bool=False) -> list:
         """
-        Returns a sorted array of the tree by customer name
+        Returns a sorted array of the tree by its key (e.g. customer name)
         
         Best Time complexity: O(n)
         Worst Time complexity: O(n)
         Average Time complexity: O(n)
         
         Note: It is O(n) in this case as in the HotelDatabase object, the AVLTree object is automatically
-        updated every time the user adds, changes, or deletes a customer name.
+        updated every time the user adds, changes, or deletes a record.
         Hence, removing the need to insert the nodes into the tree when sorting using tree sort.
         
         Space complexity: O(m + n)
@@ -65,30 +75,70 @@ class AVLTree:
             for data in node.data.convert_to_array():
                 sortedArr.append(data)
 
-        # return the sorted list of RecordData objects by customer name
+        # return the sorted list of RecordData objects by the key
         return sortedArr
 
-    def move_node(self, data) -> None:
+    def move_node(self, data, oldKey) -> None:
         """
-        Used when the user has changed the customer name in one of the nodes in the tree.
+        Used when the user has changed the key (e.g. customer name) of the data in one of the nodes in the tree.
         Hence, there will be a need to delete the old data in the linkedlist that may result 
         in deletion of the tree node if there is only one data in the linkedlist.
-        Since, there is a new customer name, we will have to insert a node into the root with a new key.
+        Since, there is a new key, we will have to insert a node into the root with a new key.
         
-        Requires one argument:
+        Requires two arguments:
         - data (RecordData): The data of the node to be deleted from the linkedlist
+        - oldKey: The key of the data before it was changed
         """
-        self.delete(data)
+        self.root = delete_node(self.root, oldKey, data)
         self.insert(data)
 
     def search(self, target:str):
         return search_node(self.root, target)
 
     def insert(self, data) -> None:
-        self.root = insert_node(self.root, data)
+        self.root = insert_node(self.root, self.key(data), data)
+
+    def bulk_insert(self, dataArr:list, isSorted:bool=False) -> None:
+        """
+        Insert an array of data into the tree in one pass.
+        
+        If the tree is empty, the data will be grouped by key (e.g. customer name) and the tree will be built 
+        directly from the sorted keys without the recursive insertion and rotations.
+        Otherwise, each data will be inserted into the tree one by one.
+        
+        Time complexity: O(n + k log k) if the tree is empty, otherwise O(n log n)
+        Where n is the number of data and k is the number of unique keys
+        (O(n) if the tree is empty and the data is already sorted by the key)
+        
+        Requires one argument:
+        - dataArr (list): The array of data (RecordData) to be inserted into the tree
+        
+        Optional argument:
+        - isSorted (bool): True if the dataArr is already sorted by the key
+                           so that the keys do not have to be sorted, defaults to False
+        """
+        if (self.root is not None):
+            for data in dataArr:
+                self.insert(data)
+            return
+
+        # group the data by key while preserving the order of the data in the array
+        groups = {}
+        getKey = self.key
+        for data in dataArr:
+            key = getKey(data)
+            if (key in groups):
+                groups[key].append(data)
+            else:
+                groups[key] = [data]
+
+        # the dictionary preserves the insertion order, hence the keys 
+        # are already in sorted order if the data is sorted by the key
+        keys = list(groups) if (isSorted) else sorted(groups)
+        self.root = build_balanced_tree(keys, groups, 0, len(keys) - 1)
 
     def delete(self, data) -> None:
-        self.root = delete_node(self.root, data)
+        self.root = delete_node(self.root, self.key(data), data)
 
     def visualise_tree(self, root, indent:str="", rightChildNode:bool=True) -> None:
         """
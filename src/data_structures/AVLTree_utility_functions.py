@@ -14,20 +14,23 @@ and the class for the AVL tree nodes.
 
 class TreeNode:
     """
-    Creates a TreeNode object with the given data
+    Creates a TreeNode object with the given key and data
 
-    Requires one argument:
+    Requires two arguments:
+    key: the key of the node (e.g. customer name)
     data: the data to be added to the node
     
-    Will create a doubly linked list to store all occurrences of the key (customer name)
+    Will create a doubly linked list to store all occurrences of the key (e.g. customer name)
     to prevent duplicate keys in the BST.
     """
-    def __init__(self, data):
-        self.key = data.get_customer_name()
+    __slots__ = ("key", "left", "right", "height", "data")
+
+    def __init__(self, key, data):
+        self.key = key
         self.left = None
         self.right = None
         self.height = 1 # Initialise height to 1 since a node has a height of 1 by itself
-        self.data = DoublyLinkedList() # to store data of the same customer name
+        self.data = DoublyLinkedList() # to store data of the same key
 
         self.data.add_to_back(data)
 
@@ -128,7 +131,7 @@ def search_node(root:TreeNode, target:str) -> Union[DoublyLinkedList, int]:
 
     Requires two arguments:
     - root (TreeNode): The root node of the tree/subtree
-    - target (string): The target value to search for (customer name)
+    - target (string): The target value to search for (e.g. customer name)
     """
     # If the target is less than the current node, search the left subtree
     if (target < root.key):
@@ -147,7 +150,7 @@ def search_node(root:TreeNode, target:str) -> Union[DoublyLinkedList, int]:
         # a linkedlist of hotel record objects
         return root.data 
 
-def insert_node(root:TreeNode, data) -> TreeNode:
+def insert_node(root:TreeNode, key, data) -> TreeNode:
     """
     Insert a node into the tree or append the data to the linkedlist in the node
     
@@ -155,21 +158,22 @@ def insert_node(root:TreeNode, data) -> TreeNode:
     Worst Time complexity: O(log n)
     Average Time complexity: O(log n)
     
-    Requires two arguments:
+    Requires three arguments:
     - root (TreeNode): The root node of the tree/subtree
+    - key: The key of the data (e.g. customer name)
     - data (RecordData): The data of the node to be inserted into the tree
     """
     # If the tree is empty, return a new node as the root
     # or if we have reached the child of a leaf node, change the child to 
     # the new node with the data inserted instead of pointing to None
     if (root is None):
-        return TreeNode(data)
+        return TreeNode(key, data)
     # If the data key is less than the current node, insert the node to the left subtree
-    elif (data.get_customer_name() < root.key):
-        root.left = insert_node(root.left, data)
+    elif (key < root.key):
+        root.left = insert_node(root.left, key, data)
     # If the data key is greater than the current node, insert the node to the right subtree
-    elif (data.get_customer_name() > root.key):
-        root.right = insert_node(root.right, data)
+    elif (key > root.key):
+        root.right = insert_node(root.right, key, data)
     # If the data key is equal to the current node, append the data to the linkedlist in the node
     else:
         root.data.add_to_back(data)
@@ -184,7 +188,7 @@ def insert_node(root:TreeNode, data) -> TreeNode:
     # If the balance factor is greater than 1, the tree needs to be balanced
     if (balanceFactor > 1):
         # If the data key is less than the left child, rotate right
-        if (data.get_customer_name() < root.left.key):
+        if (key < root.left.key):
             # e.g. of left left case
             #             5 (bf:  2-0 = 2)
             #            /
@@ -243,7 +247,7 @@ def insert_node(root:TreeNode, data) -> TreeNode:
     # If the balance factor is less than -1, the tree needs to be balanced
     if (balanceFactor < -1):
         # If the data key is greater than the right child, rotate left
-        if (data.get_customer_name() > root.right.key):
+        if (key > root.right.key):
             # e.g. of right right case
             # 5 (bf:  0-2 = -2)
             #  \
@@ -301,7 +305,7 @@ def insert_node(root:TreeNode, data) -> TreeNode:
 
     return root
 
-def delete_node(root:TreeNode, data) -> TreeNode:
+def delete_node(root:TreeNode, key, data=None) -> TreeNode:
     """
     Delete a node from the tree and balance the tree if the node is deleted
     
@@ -309,26 +313,31 @@ def delete_node(root:TreeNode, data) -> TreeNode:
     Worst Time complexity: O(log n)
     Average Time complexity: O(log n)
     
-    Requires two argument:
+    Requires two arguments:
     - root (TreeNode): The root node of the tree/subtree
-    - data (RecordData): The data of the node to be deleted from the linkedlist
+    - key: The key of the data (e.g. customer name)
+    
+    Optional argument:
+    - data (RecordData): The data to be deleted from the linkedlist in the node,
+                         defaults to None to delete the whole node regardless of its linkedlist
     """
     # if the root is None, return None.
     # This will happen if the node to be deleted is not in the tree
     if (root is None):
         return root
     # If the target is smaller than the current node, search the left subtree
-    elif (data.get_customer_name() < root.key):
-        root.left = delete_node(root.left, data)
+    elif (key < root.key):
+        root.left = delete_node(root.left, key, data)
     # If the target is greater than the current node, search the right subtree
-    elif (data.get_customer_name() > root.key):
-        root.right = delete_node(root.right, data)
+    elif (key > root.key):
+        root.right = delete_node(root.right, key, data)
     # target found!
     else:
         # if the node has more than one object inside the linkedlist, delete the target object from the linkedlist
-        if (len(root.data) > 1):
-            root.data.remove_node(data)
-            return root
+        if (data is not None):
+            if (root.data.remove_node(data) == -1 or not root.data.is_empty()):
+                # the data is not in the node or there are other data with the same key
+                return root
 
         # if the node has only one or no child, replace the node with its child or None
         # and delete the node that is to be deleted from the tree
@@ -370,7 +379,7 @@ def delete_node(root:TreeNode, data) -> TreeNode:
         root.key = temp.key
         root.data = temp.data
 
-        # Delete the inorder successor
+        # Delete the inorder successor node (whose data has been moved to this node)
         root.right = delete_node(root.right, temp.key)
 
     # if the tree had only one node, just return it as there is no need to balance the tree
@@ -429,4 +438,37 @@ def inorder_return_node(root:TreeNode, arr:list, reverse:bool=False) -> list:
     else:
         inorder_return_node(root.left, arr, reverse)
         arr.append(root)
-        inorder_return_node(root.right, arr, reverse)
\ No newline at end of file
+        inorder_return_node(root.right, arr, reverse)
+
+def build_balanced_tree(keys:list, groups:dict, l:int, r:int) -> Union[TreeNode, None]:
+    """
+    Build a height-balanced tree from the sorted keys in keys[l..r] without any rotations
+    by using the middle key as the root of each subtree.
+    
+    Time complexity: O(n) where n is the number of keys
+    
+    Requires four arguments:
+    - keys (list): The sorted array of unique keys (e.g. customer names)
+    - groups (dict): The dictionary of keys to an array of data with the same key
+    - l (int): The index of the first key in the subtree
+    - r (int): The index of the last key in the subtree
+    """
+    if (l > r):
+        return None
+
+    mid = (l + r) // 2
+    dataArr = groups[keys[mid]]
+
+    # create the node with the first data and add the rest of the data 
+    # with the same key to the linkedlist in the node
+    root = TreeNode(keys[mid], dataArr[0])
+    for i in range(1, len(dataArr)):
+        root.data.add_to_back(dataArr[i])
+
+    root.left = build_balanced_tree(keys, groups, l, mid - 1)
+    root.right = build_balanced_tree(keys, groups, mid + 1, r)
+
+    # since both subtrees have the same number of keys (or differ by one),
+    # their heights will differ by at most one and the tree will be balanced
+    root.height = 1 + max(get_height(root.left), get_height(root.right))
+    return root
@@ -0,0 +1,162 @@
+# import standard libraries
+from hashlib import blake2b
+from math import ceil, log
+
+LN_2 = log(2)
+
+class BloomFilter:
+    """
+    This is a Bloom filter of names (e.g. customer names) that answers whether a name is definitely not
+    in the set or might be in the set, using a bit array of m bits and k hash functions per name.
+
+    Adding a name sets its k bits and a name is definitely not in the set if any of its k bits is not set,
+    hence a lookup for a name that is not in the set can skip the search (e.g. the AVL tree or the SQL query)
+    and the filter only returns a false positive (the search is still done) at about the false positive rate.
+
+    For n names and a false positive rate p, the optimal number of bits is m = -n ln(p) / (ln 2)^2
+    and the optimal number of hash functions is k = (m / n) ln 2, e.g. about 9.6 bits and 7 hash functions
+    per name for p = 1%. The k positions are derived from one hash with double hashing (h1 + i * h2).
+
+    Names cannot be removed as their bits might be shared with other names, hence the filter should be rebuilt
+    (see rebuild()) when more names than its capacity were added (the false positive rate would be higher).
+
+    The names are matched case-insensitively (the keys are lowercased).
+
+    Requires 1 argument:
+    - capacity (int): the expected number of names
+
+    Optional argument:
+    - falsePositiveRate (float): the false positive rate when the filter has capacity names (between 0 and 1 exclusive),
+                                 defaults to 0.01 (1%)
+
+    References:
+    - https://en.wikipedia.org/wiki/Bloom_filter
+    - https://www.eecs.harvard.edu/~michaelm/postscripts/rsa2008.pdf (double hashing)
+    """
+    def __init__(self, capacity:int, falsePositiveRate:float=0.01):
+        if (not 0 < falsePositiveRate < 1):
+            raise ValueError("The false positive rate must be between 0 and 1 (exclusive)!")
+
+        self.falsePositiveRate = falsePositiveRate
+
+        # the number of lookups with might_contain() and the number of lookups
+        # that were short-circuited (the name was definitely not in the set)
+        self.numOfLookups = 0
+        self.numOfShortCircuits = 0
+        self.rebuild((), capacity)
+
+    def rebuild(self, names, capacity:int=None) -> None:
+        """
+        Clear the filter, resize it for the capacity, and add the names
+        (e.g. after loading the records or when the filter is full)
+
+        The lookup counters are kept.
+
+        Time complexity: O(m + n * k)
+
+        Requires 1 argument:
+        - names (iterable)
+
+        Optional argument:
+        - capacity (int): the expected number of names, defaults to None for the number of names given
+        """
+        names = list(names)
+        capacity = max(1, capacity if (capacity is not None) else len(names))
+        numOfBits = max(8, ceil(-capacity * log(self.falsePositiveRate) / (LN_2 * LN_2)))
+
+        self.capacity = capacity
+        self.numOfItems = 0
+        self.__num_of_bits = numOfBits
+        self.__num_of_hashes = max(1, round(numOfBits / capacity * LN_2))
+        self.__bits = bytearray((numOfBits + 7) // 8)
+        for name in names:
+            self.add(name)
+
+    def __get_positions(self, name:str):
+        """
+        Returns a generator of the k bit positions of the name
+
+        Requires 1 argument:
+        - name (str)
+        """
+        digest = blake2b(name.lower().encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1 # odd so that the positions do not repeat as often
+        numOfBits = self.__num_of_bits
+        return ((h1 + i * h2) % numOfBits for i in range(self.__num_of_hashes))
+
+    def add(self, name:str) -> None:
+        """
+        Add the name to the filter
+
+        Time complexity: O(k)
+
+        Requires 1 argument:
+        - name (str)
+        """
+        bits = self.__bits
+        isNewName = False
+        for position in self.__get_positions(name):
+            byteIndex, mask = position >> 3, 1 << (position & 7)
+            if (not bits[byteIndex] & mask):
+                bits[byteIndex] |= mask
+                isNewName = True
+
+        # a name whose bits were all set already is not counted
+        # (it was either added before or is a false positive)
+        if (isNewName):
+            self.numOfItems += 1
+
+    def might_contain(self, name:str) -> bool:
+        """
+        Returns False if the name is definitely not in the filter or True if it might be
+        and updates the lookup counters
+
+        Time complexity: O(k)
+
+        Requires 1 argument:
+        - name (str)
+        """
+        self.numOfLookups += 1
+        if (name in self):
+            return True
+        self.numOfShortCircuits += 1
+        return False
+
+    def is_full(self) -> bool:
+        """
+        Returns True if more names than the capacity were added
+        """
+        return (self.numOfItems > self.capacity)
+
+    def __contains__(self, name:str) -> bool:
+        bits = self.__bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.__get_positions(name))
+
+    def __len__(self) -> int:
+        return self.numOfItems
+
+# test codes for the Bloom filter
+if (__name__ == "__main__"):
+    from random import choice, randint
+    def random_name() -> str:
+        return "".join(choice("abcdefghijklmnopqrstuvwxyz") for _ in range(randint(5, 12)))
+
+    names = {random_name() for _ in range(10000)}
+    bloomFilter = BloomFilter(len(names), 0.01)
+    for name in names:
+        bloomFilter.add(name)
+
+    # no false negatives
+    assert all(bloomFilter.might_contain(name.upper()) for name in names)
+
+    otherNames = [name for name in (random_name() for _ in range(100000)) if (name not in names)]
+    falsePositives = sum(bloomFilter.might_contain(name) for name in otherNames)
+    print(f"False positive rate: {falsePositives / len(otherNames):.4f} (expected about 0.01)")
+    print("Number of lookups:", bloomFilter.numOfLookups)
+    print("Number of lookups short-circuited:", bloomFilter.numOfShortCircuits)
+    assert falsePositives / len(otherNames) < 0.02
+
+    bloomFilter.rebuild(list(names)[:10])
+    assert bloomFilter.capacity == 10 and all(name in bloomFilter for name in list(names)[:10])
+    print("All tests passed!")
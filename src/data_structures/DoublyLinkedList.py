@@ -9,6 +9,8 @@ class Node:
     Requires one argument:
     data: the data to be added to the node
     """
+    __slots__ = ("data", "next", "prev") # a node is created for every record in the AVL tree
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -35,6 +37,8 @@ class DoublyLinkedList:
     - Introduction to Doubly Linked List
         - https://youtu.be/e9NG_a6Z0mg
     """
+    __slots__ = ("head", "tail", "size") # a linked list is created for every unique customer name in the AVL tree
+
     def __init__(self):
         self.head = None
         self.tail = None
@@ -49,15 +53,17 @@ class DoublyLinkedList:
         Requires one argument:
         data: the data to be added to the linked list
         """
+        node = Node(data)
+
         # case 1: if the linked list is empty
         if (self.head is None):
-            self.head = Node(data)
+            self.head = node
             self.tail = self.head
             self.size += 1
             return
 
         # case 2: if the linked list has more than one node
-        self.tail.next = Node(data)
+        self.tail.next = node
         self.tail.next.prev = self.tail
         self.tail = self.tail.next
         self.size += 1
@@ -74,41 +80,32 @@ class DoublyLinkedList:
         - O(1) when removing the node from the beginning or the end of the linkedlist
         - Better performance when removing a node in the linkedlist as it is not necessary to shift the nodes as compared to a list
         
+        Note: The nodes are not kept in a dictionary to find them in O(1) time as 
+        a dictionary entry for every node would take more memory than the node itself.
+        
         Requires one argument:
         data: the data to be removed from the linked list
         """
-        # case 1: if the linked list is empty
-        if (self.head is None):
-            return
+        # check the tail first as it is the only node that cannot be reached in O(1) time otherwise
+        node = self.tail if (self.tail is not None and self.tail.data == data) else self.head
+        while (node is not None and node.data != data):
+            node = node.next
 
-        # case 2: if the node to be removed is the head
-        if (self.head.data == data):
-            self.head = self.head.next
-            self.head.prev = None
-            self.size -= 1
-            return
+        if (node is None):
+            return -1 # return -1 if the node is not in the linked list
 
-        # case 3: if the node to be removed is the tail
-        if (self.tail.data == data):
-            self.tail = self.tail.prev
-            self.tail.next = None
-            self.size -= 1
-            return
+        # link the previous node and the next node together (or move the head/tail if the node is at either end)
+        if (node.prev is None):
+            self.head = node.next
+        else:
+            node.prev.next = node.next
 
-        # case 4: if the linked list has multiple nodes
-        current = self.head.next
-        while (current is not None):
-            # check if the node to be removed is the current node
-            if (current.data == data):
-                current.prev.next = current.next # if so, set the previous node's next to the current node's next
-                current.next.prev = current.prev # set the next node's previous to the current node's previous
-                self.size -= 1
-                return
-
-            # move to the next node
-            current = current.next
+        if (node.next is None):
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
 
-        return -1 # return -1 if the node is not in the linked list
+        self.size -= 1
 
     def is_empty(self) -> bool:
         """
@@ -136,6 +133,12 @@ class DoublyLinkedList:
             current = current.next
         return listOfNodes
 
+    def __iter__(self):
+        current = self.head
+        while (current is not None):
+            yield current.data
+            current = current.next
+
     def __len__(self) -> int:
         return self.size
 
@@ -0,0 +1,143 @@
+class FenwickTree:
+    """
+    This is a Fenwick tree (binary indexed tree) that stores an array of integers (e.g. the number of bookings
+    at each distinct cost per pax) and returns the sum of any range of the array in O(log n) time.
+
+    Each index of the tree stores the sum of a range of the array whose length is the lowest set bit of the index,
+    hence a prefix sum only adds up O(log n) of the ranges and updating a value only updates O(log n) of the ranges.
+
+    The size of the tree is fixed when it is built, hence the values should be indexed by their rank
+    (e.g. the rank of a cost among the distinct costs) instead of a value that can be arbitrarily large.
+
+    Optional argument:
+    - values (iterable): the initial values of the array, defaults to an empty array
+
+    References:
+    - https://en.wikipedia.org/wiki/Fenwick_tree
+    - https://cp-algorithms.com/data_structures/fenwick.html
+    """
+    def __init__(self, values=()):
+        # 1-based, i.e. index i of the array is stored at self.__tree[i + 1]
+        tree = self.__tree = [0]
+        tree.extend(values)
+
+        # build the tree in O(n) by adding each range to the next range that contains it
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if (parent <= size):
+                tree[parent] += tree[i]
+
+    def get_values(self) -> list:
+        """
+        Returns the values of the array (e.g. to rebuild the tree with more indexes)
+
+        Time complexity: O(n) by undoing the build in reverse order
+        """
+        values = self.__tree[:]
+        size = len(values) - 1
+        for i in range(size, 0, -1):
+            parent = i + (i & -i)
+            if (parent <= size):
+                values[parent] -= values[i]
+        return values[1:]
+
+    def add(self, index:int, delta:int) -> None:
+        """
+        Add the delta to the value at the index
+
+        Time complexity: O(log n)
+
+        Requires 2 arguments:
+        - index (int): the index of the value (from 0 to the size of the tree - 1)
+        - delta (int): the amount to add (negative to subtract)
+        """
+        tree = self.__tree
+        size = len(tree)
+        if (index < 0 or index >= size - 1):
+            raise IndexError("FenwickTree index out of range")
+
+        i = index + 1
+        while (i < size):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index:int) -> int:
+        """
+        Returns the sum of the values from index 0 to the index (inclusive)
+
+        Time complexity: O(log n)
+
+        Requires 1 argument:
+        - index (int): the last index of the range, 0 is returned if it is negative
+        """
+        tree = self.__tree
+        i = min(index + 1, len(tree) - 1)
+        total = 0
+        while (i > 0):
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, low:int, high:int) -> int:
+        """
+        Returns the sum of the values from the low index to the high index (inclusive)
+
+        Time complexity: O(log n)
+
+        Requires 2 arguments:
+        - low (int)
+        - high (int)
+        """
+        if (low > high):
+            return 0
+        return self.prefix_sum(high) - self.prefix_sum(low - 1)
+
+    def find_prefix_index(self, target:int) -> int:
+        """
+        Returns the smallest index where the prefix sum is more than the target
+        (e.g. the rank of the cost of the (target + 1)-th cheapest booking) or the size of the tree if there is none.
+
+        Note: All the values must be 0 or more.
+
+        Time complexity: O(log n) by descending the tree from its largest power of two instead of a binary search
+
+        Requires 1 argument:
+        - target (int)
+        """
+        tree = self.__tree
+        size = len(tree) - 1
+        i = 0
+        step = 1 << size.bit_length()
+        while (step > 0):
+            if (i + step <= size and tree[i + step] <= target):
+                i += step
+                target -= tree[i]
+            step >>= 1
+        return i # the 1-based position i + 1 is the 0-based index i
+
+    def __len__(self) -> int:
+        return len(self.__tree) - 1
+
+# test codes for the Fenwick tree
+if (__name__ == "__main__"):
+    from random import randint
+    values = [randint(0, 5) for _ in range(50)]
+    tree = FenwickTree(values)
+    for _ in range(1000):
+        index, delta = randint(0, 49), randint(0, 5)
+        values[index] += delta
+        tree.add(index, delta)
+
+    for low in range(50):
+        for high in range(low, 50):
+            assert tree.range_sum(low, high) == sum(values[low:high + 1])
+
+    for target in range(sum(values)):
+        index = tree.find_prefix_index(target)
+        assert sum(values[:index]) <= target < sum(values[:index + 1])
+
+    assert tree.get_values() == values
+    assert FenwickTree(values + [7]).range_sum(50, 50) == 7
+    print("Size of the tree:", len(tree))
+    print("All tests passed!")
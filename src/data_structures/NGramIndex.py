@@ -0,0 +1,116 @@
+class NGramIndex:
+    """
+    This is an inverted index of the n-grams (substrings of n characters) of names (e.g. customer names)
+    to the names that contain them, used to find the names that are similar to a misspelt name
+    without comparing it with every name (see fuzzy_search.py).
+
+    A misspelt name still shares most of its n-grams with the correct name since each typo only changes
+    at most n of the n-grams, e.g. "Hiroyki" and "Hiroyuki" share "  h", " hi", "hir", "iro", "roy", "ki ", and "i  ".
+
+    The names are padded with n - 1 spaces on both sides so that the first and last characters are in n n-grams too,
+    and are matched case-insensitively (the keys are lowercased). The count of each name is kept so that
+    a name is only removed when all the records with the name are removed.
+
+    Optional argument:
+    - n (int): the length of the n-grams, defaults to 3 (trigrams)
+
+    References:
+    - https://en.wikipedia.org/wiki/N-gram
+    - https://en.wikipedia.org/wiki/Inverted_index
+    """
+    def __init__(self, n:int=3):
+        self.n = n
+        self.__postings = {} # the n-gram to the set of keys of the names that contain it
+        self.__names = {} # the key of the name to a list of [name, count]
+
+    def get_ngrams(self, name:str) -> set:
+        """
+        Returns the set of n-grams of the name (lowercased and padded)
+
+        Requires 1 argument:
+        - name (str)
+        """
+        n = self.n
+        padding = " " * (n - 1)
+        padded = f"{padding}{name.lower()}{padding}"
+        return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+    def add(self, name:str, count:int=1) -> None:
+        """
+        Add the name to the index or add to its count if it is already in the index
+
+        Time complexity: O(m) where m is the length of the name
+
+        Requires 1 argument:
+        - name (str)
+
+        Optional argument:
+        - count (int): the number of records with the name, defaults to 1
+        """
+        key = name.lower()
+        entry = self.__names.get(key)
+        if (entry is not None):
+            entry[1] += count
+            return
+
+        self.__names[key] = [name, count]
+        postings = self.__postings
+        for ngram in self.get_ngrams(name):
+            if (ngram in postings):
+                postings[ngram].add(key)
+            else:
+                postings[ngram] = {key}
+
+    def remove(self, name:str) -> None:
+        """
+        Remove one occurrence of the name from the index and remove the name from the n-grams' postings
+        if it was the last occurrence
+
+        Time complexity: O(m) where m is the length of the name
+
+        Requires 1 argument:
+        - name (str)
+        """
+        key = name.lower()
+        entry = self.__names.get(key)
+        if (entry is None):
+            return
+
+        entry[1] -= 1
+        if (entry[1] > 0):
+            return
+
+        del self.__names[key]
+        postings = self.__postings
+        for ngram in self.get_ngrams(name):
+            keys = postings[ngram]
+            keys.discard(key)
+            if (not keys):
+                del postings[ngram]
+
+    def get_candidates(self, name:str, minSharedNGrams:int=1) -> list:
+        """
+        Returns the names that share at least minSharedNGrams n-grams with the name
+
+        Time complexity: O(p) where p is the total length of the postings of the name's n-grams
+
+        Requires 1 argument:
+        - name (str)
+
+        Optional argument:
+        - minSharedNGrams (int): defaults to 1
+        """
+        postings = self.__postings
+        sharedCounts = {}
+        for ngram in self.get_ngrams(name):
+            for key in postings.get(ngram, ()):
+                sharedCounts[key] = sharedCounts.get(key, 0) + 1
+
+        names = self.__names
+        return [names[key][0] for key, sharedCount in sharedCounts.items() if (sharedCount >= minSharedNGrams)]
+
+    def __contains__(self, name:str) -> bool:
+        return name.lower() in self.__names
+
+    def __len__(self) -> int:
+        return len(self.__names)
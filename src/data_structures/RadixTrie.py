@@ -0,0 +1,224 @@
+# import standard libraries
+from typing import Union
+
+class TrieNode:
+    """
+    Creates a TrieNode object for the radix trie
+
+    Requires one argument:
+    label: the part of the key on the edge from the parent node to this node
+    """
+    __slots__ = ("label", "children", "name", "count")
+
+    def __init__(self, label:str):
+        self.label = label
+        self.children = {} # the first character of the child's label to the child node
+        self.name = None # the name if a name ends at this node
+        self.count = 0 # the number of times the name was inserted
+
+class RadixTrie:
+    """
+    This is a radix trie (compact prefix tree) of names (e.g. customer names) where each edge is labelled
+    with a part of the names instead of a single character, hence a chain of nodes with only one child
+    is merged into one node and the trie only has at most 2k nodes where k is the number of unique names.
+
+    The names are matched case-insensitively (the keys are lowercased) and the count of each name
+    is kept so that a name is only removed when all the records with the name are removed.
+
+    Used for the prefix search and autocomplete suggestions of the names in O(p + r) time
+    where p is the length of the prefix and r is the number of names returned.
+
+    References:
+    - https://en.wikipedia.org/wiki/Radix_tree
+    """
+    def __init__(self):
+        self.root = TrieNode("")
+        self.size = 0 # the number of unique names
+
+    def insert(self, name:str, count:int=1) -> None:
+        """
+        Insert the name into the trie or add to its count if it is already in the trie
+
+        Time complexity: O(m) where m is the length of the name
+
+        Requires 1 argument:
+        - name (str)
+
+        Optional argument:
+        - count (int): the number of records with the name, defaults to 1
+        """
+        key = name.lower()
+        node = self.root
+        i = 0
+        while (i < len(key)):
+            child = node.children.get(key[i])
+            if (child is None):
+                # no name shares the rest of the key, hence add it as a new leaf
+                child = node.children[key[i]] = TrieNode(key[i:])
+                node = child
+                break
+
+            # find the length of the common prefix of the child's label and the rest of the key
+            label = child.label
+            j = 1
+            while (j < len(label) and i + j < len(key) and label[j] == key[i + j]):
+                j += 1
+
+            if (j < len(label)):
+                # split the child's edge at the end of the common prefix
+                mid = TrieNode(label[:j])
+                child.label = label[j:]
+                mid.children[child.label[0]] = child
+                node.children[key[i]] = mid
+                child = mid
+
+            node = child
+            i += j
+
+        if (node.name is None):
+            node.name = name
+            self.size += 1
+        node.count += count
+
+    def remove(self, name:str) -> Union[int, None]:
+        """
+        Remove one occurrence of the name from the trie and merge the nodes that are left with only one child
+
+        Time complexity: O(m) where m is the length of the name
+
+        Requires 1 argument:
+        - name (str)
+
+        Returns -1 if the name is not in the trie.
+        """
+        key = name.lower()
+        path = [] # the parent nodes of the node where the name ends
+        node = self.root
+        i = 0
+        while (i < len(key)):
+            child = node.children.get(key[i])
+            if (child is None or not key.startswith(child.label, i)):
+                return -1
+            path.append(node)
+            node = child
+            i += len(child.label)
+
+        if (node.name is None):
+            return -1
+
+        node.count -= 1
+        if (node.count > 0):
+            return
+
+        node.name = None
+        self.size -= 1
+        if (not node.children and path):
+            # remove the leaf and then merge its parent if the parent is left with only one child
+            parent = path[-1]
+            del parent.children[node.label[0]]
+            node = parent
+            if (len(path) == 1):
+                return # the root is never merged
+
+        if (len(node.children) == 1 and node.name is None and node is not self.root):
+            self.__merge_with_child(node)
+
+    @staticmethod
+    def __merge_with_child(node:TrieNode) -> None:
+        """
+        Merge the node with its only child by joining their labels
+
+        Requires 1 argument:
+        - node (TrieNode)
+        """
+        (child,) = node.children.values()
+        node.label += child.label
+        node.children = child.children
+        node.name = child.name
+        node.count = child.count
+
+    def starts_with(self, prefix:str, limit:int=None) -> list:
+        """
+        Returns the names that start with the prefix (case-insensitive) in ascending order
+
+        Time complexity: O(p + r) where p is the length of the prefix and r is the number of names returned
+
+        Requires 1 argument:
+        - prefix (str)
+
+        Optional argument:
+        - limit (int): the maximum number of names to return (e.g. for autocomplete suggestions),
+                       defaults to None for all the names
+        """
+        key = prefix.lower()
+        node = self.root
+        i = 0
+        while (i < len(key)):
+            child = node.children.get(key[i])
+            if (child is None):
+                return []
+
+            rest = key[i:]
+            if (len(rest) <= len(child.label)):
+                # the prefix ends inside or at the end of the child's label
+                if (not child.label.startswith(rest)):
+                    return []
+                node = child
+                break
+
+            if (not rest.startswith(child.label)):
+                return []
+            node = child
+            i += len(child.label)
+
+        # collect the names under the node in order with a depth-first search
+        names = []
+        stack = [node]
+        while (stack and (limit is None or len(names) < limit)):
+            node = stack.pop()
+            if (node.name is not None):
+                names.append(node.name)
+            # push the children in descending order so that the smallest child is visited first
+            for firstChar in sorted(node.children, reverse=True):
+                stack.append(node.children[firstChar])
+        return names
+
+    def __contains__(self, name:str) -> bool:
+        return self.starts_with(name, limit=1) == [name]
+
+    def __len__(self) -> int:
+        return self.size
+
+# test codes for the radix trie
+if (__name__ == "__main__"):
+    from random import choice, randint
+    trie = RadixTrie()
+    for name in ("Jason", "Jay", "Jayden", "James", "Jane", "John", "Johnny"):
+        trie.insert(name)
+
+    print("Names starting with \"ja\":", trie.starts_with("ja"))
+    print("Names starting with \"jay\":", trie.starts_with("jay"))
+    print("First 2 names starting with \"j\":", trie.starts_with("j", limit=2))
+
+    trie.remove("Jay")
+    print("\nAfter removing \"Jay\", names starting with \"jay\":", trie.starts_with("jay"))
+
+    # compare with a sorted list of the names
+    names = {}
+    trie = RadixTrie()
+    for _ in range(5000):
+        name = "".join(choice("abc ") for _ in range(randint(1, 6))).title()
+        if (names and randint(0, 2) == 0):
+            removedName = choice(list(names))
+            trie.remove(removedName)
+            names[removedName] -= 1
+            if (names[removedName] == 0):
+                del names[removedName]
+        else:
+            trie.insert(name)
+            names[name] = names.get(name, 0) + 1
+
+        prefix = "".join(choice("abc ") for _ in range(randint(0, 3)))
+        assert trie.starts_with(prefix) == sorted((n for n in names if (n.lower().startswith(prefix))), key=str.lower)
+    assert len(trie) == len(names)
+    print("\nAll tests passed!")
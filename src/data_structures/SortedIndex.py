@@ -0,0 +1,448 @@
+# import standard libraries
+from array import array
+from bisect import bisect_left
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from FenwickTree import FenwickTree
+else:
+    from .FenwickTree import FenwickTree
+
+# the number of record IDs in each block when the index is built
+# (a block is split in half when it has twice as many record IDs)
+SORTED_INDEX_BLOCK_SIZE = 512
+
+class SortedIndex:
+    """
+    This is a sorted index of records (e.g. by their package name) that only stores the stable record ID
+    of each record (see HotelDatabase.get_record()) in packed arrays instead of a node for every record.
+
+    The record IDs are kept in ascending order of (key of the record, record ID) in a list of blocks
+    where each block is a sorted array of 8-byte integers, hence each record only takes 8 bytes in the index
+    and the records are looked up from the record IDs with the getRecord function (e.g. the HotelDatabase's
+    record index) so that there is only one structure that maps the record IDs to the records.
+
+    The (key, record ID) of the last record in each block is also kept so that a record is found by a binary search
+    of the blocks followed by a binary search of the record IDs in the block, i.e. O(log n) comparisons,
+    and a record is inserted or removed by shifting the record IDs of its block only, i.e. O(log n + b) time
+    where b is the size of the block. Records with the same key are in the order of their record IDs
+    (i.e. the order that they were added in).
+
+    The key of a record can be changed as long as move_node() is called afterwards with its old key
+    (like the AVL tree, see AVLTree.move_node()).
+
+    The number of records in each block (and the total weight of the records in each block if the weight
+    function is given, e.g. the total cost of the bookings) are kept in Fenwick trees which are updated on every
+    insert and delete, hence the position of a key (see bisect_left()), the record at a position, and the total weight
+    of a range of positions are found in O(log m + b) time where m is the number of blocks, without walking the records.
+    The Fenwick trees are only rebuilt in O(m) when a block is split or removed, i.e. at most once every b inserts or deletes.
+
+    Requires 2 arguments:
+    - key (function): the key extractor of the records to order the index by (e.g. PACKAGE_NAME_KEY from field_keys.py)
+    - getRecord (function): returns the record with the record ID
+
+    Optional arguments:
+    - weight (function): returns the integer weight of a record to sum over the ranges of records 
+                         (e.g. total_cost_in_cents_key from field_keys.py), defaults to None
+    - blockSize (int): the number of record IDs in each block when the index is built, defaults to SORTED_INDEX_BLOCK_SIZE
+
+    References:
+    - https://grantjenks.com/docs/sortedcontainers/implementation.html
+    - https://en.wikipedia.org/wiki/Unrolled_linked_list
+    """
+    def __init__(self, key, getRecord, weight=None, blockSize:int=SORTED_INDEX_BLOCK_SIZE):
+        self.key = key
+        self.weight = weight
+        self.__get_record = getRecord
+        self.__block_size = blockSize
+        self.__blocks = [] # the arrays of record IDs
+        self.__maxes = [] # the (key, record ID) of the last record in each block
+        self.__len = 0
+
+        # the number of records and the total weight of the records in each block
+        self.__block_counts = FenwickTree()
+        self.__block_weights = FenwickTree()
+
+    def __get_total_weight(self, recordIds) -> int:
+        """
+        Returns the total weight of the records with the record IDs (0 if there is no weight function)
+
+        Requires 1 argument:
+        - recordIds (iterable)
+        """
+        if (self.weight is None):
+            return 0
+        weight, getRecord = self.weight, self.__get_record
+        return sum(weight(getRecord(recordId)) for recordId in recordIds)
+
+    def __rebuild_block_sums(self, blockWeights) -> None:
+        """
+        Rebuild the Fenwick trees of the number of records and the total weight in each block in O(m)
+        (after the blocks were split, removed, or rebuilt)
+
+        Requires 1 argument:
+        - blockWeights (iterable): the total weight of the records in each block
+        """
+        self.__block_counts = FenwickTree(len(block) for block in self.__blocks)
+        self.__block_weights = FenwickTree(blockWeights) if (self.weight is not None) else FenwickTree()
+
+    def __get_sort_key(self, recordId:int, targetSortKey:tuple) -> tuple:
+        """
+        Returns the (key, record ID) of the record with the record ID
+        or the target's sort key if it is the target record (whose key might have been changed
+        or which might have been removed from the getRecord function's records already)
+
+        Requires 2 arguments:
+        - recordId (int)
+        - targetSortKey (tuple): the (key, record ID) being searched for
+        """
+        if (recordId == targetSortKey[1]):
+            return targetSortKey
+        return self.key(self.__get_record(recordId)), recordId
+
+    def __locate(self, sortKey:tuple) -> tuple:
+        """
+        Returns the index of the block and the index in the block of the first record ID
+        whose (key, record ID) is not less than the sort key in a tuple
+        (the number of blocks and 0 if the sort key is larger than every record)
+
+        Time complexity: O(log n)
+
+        Requires 1 argument:
+        - sortKey (tuple): the (key, record ID) to search for
+        """
+        blockIndex = bisect_left(self.__maxes, sortKey)
+        if (blockIndex == len(self.__blocks)):
+            return blockIndex, 0
+
+        block = self.__blocks[blockIndex]
+        low, high = 0, len(block)
+        while (low < high):
+            mid = (low + high) // 2
+            if (self.__get_sort_key(block[mid], sortKey) < sortKey):
+                low = mid + 1
+            else:
+                high = mid
+        return blockIndex, low
+
+    def tree_sort(self, reverse:bool=False) -> list:
+        """
+        Returns a sorted array of the records by the key (named like AVLTree.tree_sort() as it is used in the same way)
+
+        Time complexity: O(n) as the record IDs are already sorted
+
+        Optional argument:
+        - reverse (bool): Whether to return the records in ascending or descending order. Defaults to False
+        """
+        getRecord = self.__get_record
+        sortedArr = [getRecord(recordId) for block in self.__blocks for recordId in block]
+        if (reverse):
+            sortedArr.reverse()
+        return sortedArr
+
+    def search(self, target) -> list:
+        """
+        Returns the array of the records with the key in the order that they were added in (empty if there are none)
+
+        Time complexity: O(log n + k) where k is the number of records with the key
+
+        Requires 1 argument:
+        - target: the key to search for (e.g. a package name)
+        """
+        # record IDs start from 0, hence (target, -1) is before every record with the key
+        blockIndex, index = self.__locate((target, -1))
+        key, getRecord = self.key, self.__get_record
+        records = []
+        for block in self.__blocks[blockIndex:]:
+            for recordId in block[index:]:
+                record = getRecord(recordId)
+                if (key(record) != target):
+                    return records
+                records.append(record)
+            index = 0
+        return records
+
+    def insert(self, data) -> None:
+        """
+        Insert the record into the index
+
+        Time complexity: O(log n + b)
+
+        Requires 1 argument:
+        - data (RecordData): the record which must already have a record ID
+        """
+        recordId = data.get_record_id()
+        sortKey = (self.key(data), recordId)
+        dataWeight = self.weight(data) if (self.weight is not None) else 0
+        blocks, maxes = self.__blocks, self.__maxes
+        self.__len += 1
+        if (not blocks):
+            blocks.append(array("q", (recordId,)))
+            maxes.append(sortKey)
+            self.__rebuild_block_sums((dataWeight,))
+            return
+
+        blockIndex, index = self.__locate(sortKey)
+        if (blockIndex == len(blocks)):
+            # the record is after every record, hence it is appended to the last block
+            blockIndex -= 1
+            index = len(blocks[blockIndex])
+            maxes[blockIndex] = sortKey
+
+        block = blocks[blockIndex]
+        block.insert(index, recordId)
+        self.__block_counts.add(blockIndex, 1)
+        if (self.weight is not None):
+            self.__block_weights.add(blockIndex, dataWeight)
+
+        if (len(block) >= 2 * self.__block_size):
+            # split the block in half so that inserting into it stays O(b)
+            half = len(block) // 2
+            blocks[blockIndex:blockIndex + 1] = [block[:half], block[half:]]
+            maxes.insert(blockIndex, self.__get_sort_key(block[half - 1], sortKey))
+
+            blockWeights = self.__block_weights.get_values()
+            if (self.weight is not None):
+                firstHalfWeight = self.__get_total_weight(blocks[blockIndex])
+                blockWeights[blockIndex:blockIndex + 1] = [firstHalfWeight, blockWeights[blockIndex] - firstHalfWeight]
+            self.__rebuild_block_sums(blockWeights)
+
+    def bulk_insert(self, dataArr:list) -> None:
+        """
+        Insert an array of records into the index in one pass.
+
+        If there are more records to insert than an eighth of the records in the index, the index will be
+        rebuilt from all the record IDs sorted by the key. Otherwise, each record will be inserted one by one.
+
+        Time complexity: O((n + m) log (n + m)) if the index is rebuilt, otherwise O(m (log n + b))
+        where n is the number of records in the index and m is the number of records to insert
+
+        Requires one argument:
+        - dataArr (list): The array of records to be inserted which must already have a record ID
+        """
+        if (len(dataArr) <= self.__len // 8):
+            for data in dataArr:
+                self.insert(data)
+            return
+
+        key, getRecord = self.key, self.__get_record
+        recordIds = [recordId for block in self.__blocks for recordId in block]
+        recordIds.extend(data.get_record_id() for data in dataArr)
+
+        # sort by the record ID and then by the key so that the sort (which is stable)
+        # orders the records with the same key by their record ID
+        recordIds.sort()
+        recordIds.sort(key=lambda recordId: key(getRecord(recordId)))
+
+        blockSize = self.__block_size
+        self.__blocks = [array("q", recordIds[i:i + blockSize]) for i in range(0, len(recordIds), blockSize)]
+        self.__maxes = [(key(getRecord(block[-1])), block[-1]) for block in self.__blocks]
+        self.__len = len(recordIds)
+        self.__rebuild_block_sums(map(self.__get_total_weight, self.__blocks))
+
+    def delete(self, data, key=None, weight:int=None) -> None:
+        """
+        Remove the record from the index (it may already be removed from the getRecord function's records)
+
+        Time complexity: O(log n + b)
+
+        Requires 1 argument:
+        - data (RecordData)
+
+        Optional arguments:
+        - key: the key of the record in the index if it has been changed, defaults to None for its current key
+        - weight (int): the weight of the record in the index if it has been changed, defaults to None for its current weight
+        """
+        recordId = data.get_record_id()
+        sortKey = (self.key(data) if (key is None) else key, recordId)
+        blockIndex, index = self.__locate(sortKey)
+        blocks, maxes = self.__blocks, self.__maxes
+        if (blockIndex == len(blocks) or index == len(blocks[blockIndex]) or blocks[blockIndex][index] != recordId):
+            return -1 # return -1 if the record is not in the index
+
+        block = blocks[blockIndex]
+        del block[index]
+        self.__len -= 1
+        self.__block_counts.add(blockIndex, -1)
+        if (self.weight is not None):
+            self.__block_weights.add(blockIndex, -(self.weight(data) if (weight is None) else weight))
+
+        if (not block):
+            del blocks[blockIndex]
+            del maxes[blockIndex]
+            blockWeights = self.__block_weights.get_values()
+            del blockWeights[blockIndex:blockIndex + 1]
+            self.__rebuild_block_sums(blockWeights)
+        elif (index == len(block)):
+            # the last record of the block was removed
+            maxes[blockIndex] = self.__get_sort_key(block[-1], sortKey)
+
+    def move_node(self, data, oldKey, oldWeight:int=None) -> None:
+        """
+        Used when the key (e.g. package name) or the weight of the record has been changed
+        so that the record is moved to the position of its new key with its new weight.
+
+        Requires two arguments:
+        - data (RecordData): The record whose key was changed
+        - oldKey: The key of the record before it was changed
+
+        Optional argument:
+        - oldWeight (int): The weight of the record before it was changed, defaults to None if it was not changed
+        """
+        self.delete(data, oldKey, oldWeight)
+        self.insert(data)
+
+    def bisect_left(self, target) -> int:
+        """
+        Returns the position of the first record whose key is not less than the target
+
+        Time complexity: O(log n)
+
+        Requires 1 argument:
+        - target: the key (e.g. a cost in cents)
+        """
+        blockIndex, index = self.__locate((target, -1))
+        return self.__block_counts.prefix_sum(blockIndex - 1) + index
+
+    def bisect_right(self, target) -> int:
+        """
+        Returns the position after the last record whose key is not more than the target
+
+        Time complexity: O(log n)
+
+        Requires 1 argument:
+        - target: the key (e.g. a cost in cents)
+        """
+        blockIndex, index = self.__locate((target, float("inf")))
+        return self.__block_counts.prefix_sum(blockIndex - 1) + index
+
+    def __find_position(self, position:int) -> tuple:
+        """
+        Returns the index of the block and the index in the block of the record at the position in a tuple
+        (the number of blocks and 0 if the position is not less than the number of records)
+
+        Time complexity: O(log m)
+
+        Requires 1 argument:
+        - position (int): from 0 to the number of records
+        """
+        blockIndex = self.__block_counts.find_prefix_index(position)
+        return blockIndex, position - self.__block_counts.prefix_sum(blockIndex - 1)
+
+    def get_weight_before(self, position:int) -> int:
+        """
+        Returns the total weight of the records before the position (0 if there is no weight function)
+
+        Time complexity: O(log m + b) as only the records before (or after) the position in its block are summed
+
+        Requires 1 argument:
+        - position (int): from 0 to the number of records
+        """
+        blockIndex, index = self.__find_position(position)
+        if (blockIndex == len(self.__blocks)):
+            return self.__block_weights.prefix_sum(blockIndex - 1)
+
+        block = self.__blocks[blockIndex]
+        if (index <= len(block) // 2):
+            return self.__block_weights.prefix_sum(blockIndex - 1) + self.__get_total_weight(block[:index])
+        return self.__block_weights.prefix_sum(blockIndex) - self.__get_total_weight(block[index:])
+
+    def range_weight(self, start:int, stop:int) -> int:
+        """
+        Returns the total weight of the records from the start position to the stop position (exclusive)
+
+        Time complexity: O(log m + b)
+
+        Requires 2 arguments:
+        - start (int)
+        - stop (int)
+        """
+        if (start >= stop):
+            return 0
+        return self.get_weight_before(stop) - self.get_weight_before(start)
+
+    def get_records(self, start:int, stop:int) -> list:
+        """
+        Returns the array of the records from the start position to the stop position (exclusive)
+
+        Time complexity: O(log m + k) where k is the number of records returned
+
+        Requires 2 arguments:
+        - start (int)
+        - stop (int)
+        """
+        blocks, getRecord = self.__blocks, self.__get_record
+        blockIndex, index = self.__find_position(start)
+        records = []
+        remaining = stop - start
+        while (remaining > 0 and blockIndex < len(blocks)):
+            recordIds = blocks[blockIndex][index:index + remaining]
+            records.extend(map(getRecord, recordIds))
+            remaining -= len(recordIds)
+            blockIndex += 1
+            index = 0
+        return records
+
+    def __getitem__(self, position:int):
+        if (position < 0):
+            position += self.__len
+
+        if (position < 0 or position >= self.__len):
+            raise IndexError("SortedIndex index out of range")
+
+        blockIndex, index = self.__find_position(position)
+        return self.__get_record(self.__blocks[blockIndex][index])
+
+    def __iter__(self):
+        getRecord = self.__get_record
+        return (getRecord(recordId) for block in self.__blocks for recordId in block)
+
+    def __len__(self) -> int:
+        return self.__len
+
+# test codes for the sorted index
+if (__name__ == "__main__"):
+    from random import randint, shuffle
+    class TestData:
+        def __init__(self, recordId, value):
+            self.recordId = recordId
+            self.value = value
+
+        def get_record_id(self):
+            return self.recordId
+
+    records = {i: TestData(i, randint(0, 50)) for i in range(5000)}
+    index = SortedIndex(lambda data: data.value, records.__getitem__, weight=lambda data: data.value * 3, blockSize=16)
+    index.bulk_insert(list(records.values())[:1000])
+    for i in range(1000, 5000):
+        index.insert(records[i])
+
+    expected = sorted(records.values(), key=lambda data: (data.value, data.recordId))
+    assert index.tree_sort() == expected and index.tree_sort(reverse=True) == expected[::-1]
+    assert index.search(25) == [data for data in expected if (data.value == 25)]
+    assert index.search(51) == []
+
+    # change the keys of some records and delete others
+    recordIds = list(records)
+    shuffle(recordIds)
+    for recordId in recordIds[:1000]:
+        data = records[recordId]
+        oldKey, data.value = data.value, randint(0, 50)
+        index.move_node(data, oldKey, oldKey * 3)
+    for recordId in recordIds[1000:3000]:
+        index.delete(records.pop(recordId))
+    assert index.delete(TestData(-5, 0)) == -1
+
+    expected = sorted(records.values(), key=lambda data: (data.value, data.recordId))
+    assert list(index) == expected and len(index) == len(records)
+
+    # the positions and the total weight of the ranges of keys
+    for low in range(0, 52, 3):
+        for high in range(low, 52, 5):
+            start, stop = index.bisect_left(low), index.bisect_right(high)
+            inRange = [data for data in expected if (low <= data.value <= high)]
+            assert index.get_records(start, stop) == inRange
+            assert index.range_weight(start, stop) == sum(data.value * 3 for data in inRange)
+    assert all(index[i] is expected[i] for i in range(len(expected))) and index[-1] is expected[-1]
+    print("Number of records:", len(index))
+    print("All tests passed!")
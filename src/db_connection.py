@@ -0,0 +1,157 @@
+"""
+This file contains the connection manager that keeps one sqlite3 connection to the database file
+open for the whole process instead of connecting and disconnecting on every load and save.
+
+Reusing the connection also reuses the statements that sqlite3 has already prepared (compiled)
+since the connection caches the prepared statement of each SQL string that it has executed
+(up to DB_CACHED_STATEMENTS). Hence, the SQL string of each query should stay the same between calls
+by using parameters for the values instead of formatting the values into the SQL string.
+
+The pragmas are applied once when the connection is opened:
+- journal_mode: WAL lets other processes (e.g. import_export_records.py) read the database file while
+                it is being saved and a commit only appends the changed pages to the -wal file
+                instead of writing the rollback journal and the database file
+- synchronous: FULL fsyncs on every commit while NORMAL only fsyncs when the -wal file is checkpointed
+               in the WAL mode (faster, but the last commits may be rolled back after a power loss)
+- mmap_size: the number of bytes of the database file that are memory-mapped for reads instead of copied
+"""
+
+# import standard libraries
+import os, sqlite3, pathlib
+from threading import RLock
+from typing import Union
+
+# default pragmas of the connection
+DB_JOURNAL_MODE = "WAL"
+DB_SYNCHRONOUS = "FULL"
+DB_MMAP_SIZE = 256 * 1024 * 1024 # 256MB
+
+# number of prepared statements to cache in the connection (sqlite3 defaults to 128)
+DB_CACHED_STATEMENTS = 256
+
+# the accepted values of the pragmas as they have to be formatted into the PRAGMA statements
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+class ConnectionManager:
+    """
+    Creates a ConnectionManager object that lazily opens and keeps one sqlite3 connection to the database file.
+
+    The connection can be shared between threads (e.g. the autosave thread), hence use the object
+    as a context manager to lock the connection while using it:
+        with manager as con:
+            con.execute(...)
+
+    The connection is reopened automatically if the database file was deleted or replaced
+    (e.g. renamed after it was found to be corrupted) since it was opened.
+
+    Requires one argument:
+    - filePath (pathlib.Path): the path of the sqlite3 database file
+
+    Optional arguments:
+    - journalMode (str): defaults to DB_JOURNAL_MODE
+    - synchronous (str): defaults to DB_SYNCHRONOUS
+    - mmapSize (int): defaults to DB_MMAP_SIZE
+    - cachedStatements (int): defaults to DB_CACHED_STATEMENTS
+    """
+    def __init__(self, filePath:pathlib.Path, journalMode:str=DB_JOURNAL_MODE, synchronous:str=DB_SYNCHRONOUS, \
+                 mmapSize:int=DB_MMAP_SIZE, cachedStatements:int=DB_CACHED_STATEMENTS) -> None:
+        self.__file_path = filePath
+        self.__cached_statements = cachedStatements
+        self.__lock = RLock()
+        self.__con = None
+        self.__file_id = None
+        self.__journal_mode = self.__synchronous = self.__mmap_size = None
+        self.configure(journalMode=journalMode, synchronous=synchronous, mmapSize=mmapSize)
+
+    def configure(self, journalMode:str=None, synchronous:str=None, mmapSize:int=None) -> None:
+        """
+        Change the pragmas of the connection which will be applied immediately if the connection is open
+
+        Optional arguments:
+        - journalMode (str): one of JOURNAL_MODES, defaults to None to keep the current journal mode
+        - synchronous (str): one of SYNCHRONOUS_MODES, defaults to None to keep the current synchronous mode
+        - mmapSize (int): the number of bytes to memory-map, defaults to None to keep the current size
+
+        Raises ValueError if the value of a pragma is invalid.
+        """
+        if (journalMode is not None and journalMode.upper() not in JOURNAL_MODES):
+            raise ValueError(f"Invalid journal mode \"{journalMode}\", please use one of {', '.join(JOURNAL_MODES)}.")
+        if (synchronous is not None and synchronous.upper() not in SYNCHRONOUS_MODES):
+            raise ValueError(f"Invalid synchronous mode \"{synchronous}\", please use one of {', '.join(SYNCHRONOUS_MODES)}.")
+        if (mmapSize is not None and (not isinstance(mmapSize, int) or mmapSize < 0)):
+            raise ValueError("The mmap size must be an integer that is at least 0.")
+
+        with self.__lock:
+            if (journalMode is not None):
+                self.__journal_mode = journalMode.upper()
+            if (synchronous is not None):
+                self.__synchronous = synchronous.upper()
+            if (mmapSize is not None):
+                self.__mmap_size = mmapSize
+
+            if (self.__con is not None):
+                self.__apply_pragmas(self.__con)
+
+    def __apply_pragmas(self, con:sqlite3.Connection) -> None:
+        """
+        Apply the pragmas to the connection
+        """
+        # PRAGMA statements do not support parameters, but the values are validated in configure()
+        con.execute(f"PRAGMA journal_mode = {self.__journal_mode}").fetchall()
+        con.execute(f"PRAGMA synchronous = {self.__synchronous}")
+        con.execute(f"PRAGMA mmap_size = {self.__mmap_size}").fetchall()
+
+    def __get_file_id(self) -> Union[tuple, None]:
+        """
+        Returns the device and inode number of the database file or None if it does not exist
+        """
+        try:
+            stat = os.stat(self.__file_path)
+        except (FileNotFoundError):
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Returns the connection to the database file which will be opened if it is not open yet.
+
+        Note: The database file will be created if it does not exist.
+        """
+        with self.__lock:
+            if (self.__con is not None and self.__get_file_id() != self.__file_id):
+                # the database file was deleted or replaced since the connection was opened
+                self.close()
+
+            if (self.__con is None):
+                con = sqlite3.connect(self.__file_path, check_same_thread=False, cached_statements=self.__cached_statements)
+                try:
+                    self.__apply_pragmas(con)
+                except (sqlite3.DatabaseError):
+                    # the pragmas will be applied again when the connection is reopened,
+                    # e.g. after the corrupted database file is renamed
+                    pass
+                self.__con = con
+                self.__file_id = self.__get_file_id()
+            return self.__con
+
+    def close(self) -> None:
+        """
+        Close the connection (if it is open), e.g. before the database file is renamed or deleted
+        """
+        with self.__lock:
+            if (self.__con is not None):
+                self.__con.close()
+                self.__con = None
+                self.__file_id = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.__lock.acquire()
+        try:
+            return self.get()
+        except:
+            self.__lock.release()
+            raise
+
+    def __exit__(self, *args) -> None:
+        self.__lock.release()
@@ -0,0 +1,30 @@
+"""
+This file contains the key extractors for the fields of the records
+(RecordData or ColumnarRecord objects) which the sorting and searching algorithms use to compare the records.
+
+Each key extractor is created once when this file is imported and takes a record and returns the value
+of its field, e.g. PACKAGE_NAME_KEY(record) returns record.get_package_name(). Hence, the algorithms
+call the key extractor that they were given directly in their inner loops instead of branching on
+the name of the field for every comparison.
+
+operator.methodcaller is used instead of the unbound methods of RecordData (e.g. RecordData.get_package_name)
+so that the method of the record's own class is called, e.g. the ColumnarRecord's getters in the columnar mode.
+"""
+
+# import standard libraries
+from operator import methodcaller
+
+# the key extractors of the stored fields
+CUSTOMER_NAME_KEY = methodcaller("get_customer_name")
+PACKAGE_NAME_KEY = methodcaller("get_package_name")
+PAX_NUM_KEY = methodcaller("get_pax_num")
+COST_IN_CENTS_KEY = methodcaller("get_cost_in_cents") # the cost per pax is compared as an integer number of cents
+
+def total_cost_in_cents_key(record) -> int:
+    """
+    Returns the total cost of the record's booking in cents (the cost per pax multiplied by the number of pax)
+
+    Requires one argument:
+    - record (RecordData)
+    """
+    return record.get_cost_in_cents() * record.get_pax_num()
@@ -7,11 +7,16 @@ from colorama import Fore as F
 from colorama import Style as S
 
 # import standard libraries
-import re, pathlib, logging, sqlite3
+import os, re, pathlib, logging, sqlite3
+from itertools import groupby
 from datetime import datetime
 from time import sleep
 from random import randint, uniform, choice
 from typing import Union
+from concurrent.futures.process import BrokenProcessPool
+
+# import local python files
+from db_connection import ConnectionManager
 
 # String to indicate that the records are not sorted
 NOT_SORTED = "Not Sorted"
@@ -30,10 +35,46 @@ FILE_PATH = pathlib.Path(__file__).parent.resolve()
 DB_FILE_NAME = "staycation_records.db"
 DB_FILE_PATH = FILE_PATH.joinpath(DB_FILE_NAME)
 
+# the connection to the sqlite3 database file that is reused by every load and save in this process
+DB_CONNECTION = ConnectionManager(DB_FILE_PATH)
+
+# the write-ahead log of the sqlite3 database file where the commits are written to
+# before they are checkpointed into the database file (in the WAL journal mode)
+DB_WAL_FILE_PATH = FILE_PATH.joinpath(DB_FILE_NAME + "-wal")
+
+# for the directory of sqlite3 database files (shards) that the records are saved into 
+# instead of the sqlite3 database file when the sharded storage is used
+SHARDED_DB_DIR_NAME = "staycation_records.shards"
+SHARDED_DB_DIR_PATH = FILE_PATH.joinpath(SHARDED_DB_DIR_NAME)
+
+# for the memory-mappable columnar snapshot of the records which is 
+# written besides the sqlite3 database file for a faster startup
+SNAPSHOT_FILE_NAME = "staycation_records.snapshot"
+SNAPSHOT_FILE_PATH = FILE_PATH.joinpath(SNAPSHOT_FILE_NAME)
+
+# for the append-only journal of the changes made since the sqlite3 database file was last saved
+JOURNAL_FILE_NAME = "staycation_records.journal"
+JOURNAL_FILE_PATH = FILE_PATH.joinpath(JOURNAL_FILE_NAME)
+
+# for the new sqlite3 database file written by the child process of a background save
+# which replaces the sqlite3 database file once it has been completely written
+BGSAVE_FILE_NAME = DB_FILE_NAME + ".bgsave"
+BGSAVE_FILE_PATH = FILE_PATH.joinpath(BGSAVE_FILE_NAME)
+
+# number of rows to fetch from the sqlite3 database file at a time when loading the records
+DB_FETCH_BATCH_SIZE = 10000
+
 # used for the table name in sqlite3 database file
 STAYCATION_RECORDS_TABLE = "StaycationRecords"
 HOTEL_DATABASE_CONFIG_TABLE = "HotelDatabaseConfig"
 
+# used for the table names in the normalised schema where each package name and customer name
+# is only stored once in its lookup table and the bookings only store their integer ids.
+# The staycation records table is then a view of the bookings joined with the lookup tables.
+STAYCATION_BOOKINGS_TABLE = "StaycationBookings"
+PACKAGES_TABLE = "Packages"
+CUSTOMERS_TABLE = "Customers"
+
 # a tuple of strings that indicates True used in this project
 USED_TRUE_CONDITIONS = ("y", "Y", "d") 
 
@@ -71,32 +112,478 @@ def check_if_db_file_exists() -> bool:
     """
     return DB_FILE_PATH.is_file()
 
+def check_if_snapshot_is_up_to_date() -> bool:
+    """
+    Check if the columnar snapshot file exists and was written after 
+    the last modification to the sqlite3 database file.
+    """
+    if (not SNAPSHOT_FILE_PATH.is_file() or not check_if_db_file_exists()):
+        return False
+
+    # the commits in the WAL journal mode only modify the write-ahead log until it is checkpointed
+    dbFileMtime = DB_FILE_PATH.stat().st_mtime_ns
+    if (DB_WAL_FILE_PATH.is_file()):
+        dbFileMtime = max(dbFileMtime, DB_WAL_FILE_PATH.stat().st_mtime_ns)
+    return SNAPSHOT_FILE_PATH.stat().st_mtime_ns >= dbFileMtime
+
+def read_snapshot_file():
+    """
+    Function to load the HotelDatabase object from the memory-mapped columnar snapshot file.
+    
+    Returns None if the snapshot file is invalid.
+    """
+    # import here to avoid circular imports
+    from hotel_record import HotelDatabase, CUST_NAME, PACKAGE_NAME, COST_PER_PAX, PAX_NUM
+    from columnar_snapshot import ColumnarSnapshot, SnapshotError
+
+    try:
+        with ColumnarSnapshot(SNAPSHOT_FILE_PATH) as snapshot:
+            db = HotelDatabase()
+            db.bulk_load(snapshot.iter_rows(), customerOrder=snapshot.get_column("customerOrder"))
+
+            # restore the sorted views from the stored orders in O(n) instead of sorting the records again
+            records = db.get_array()
+            db.set_sorted_views({
+                sortKey: [records[i] for i in snapshot.get_column(section)] \
+                for sortKey, section in ((CUST_NAME, "customerOrder"), (PACKAGE_NAME, "packageOrder"), \
+                                         (COST_PER_PAX, "costPerPaxOrder"), (PAX_NUM, "paxNumOrder"))
+            })
+            db.sort_order = snapshot.sort_order
+            db.descending_flag = snapshot.descending_flag
+    except (SnapshotError, OSError, ValueError, IndexError, UnicodeDecodeError):
+        return None
+    return db
+
 def preintialise_data() -> tuple:
     """
     Randomly picks a package name and customer name from the list of packages and customers predefined in this function and returns them in a tuple.
     """
     return choice(PACKAGE_NAME_PRESETS), choice(CUSTOMER_NAME_PRESETS)
 
-def read_db_file(preintialiseData:bool=False):
+def fetch_rows_in_batches(cur:sqlite3.Cursor, batchSize:int=DB_FETCH_BATCH_SIZE):
+    """
+    Generator to yield the rows from the executed sqlite3 query in batches
+    to avoid loading all the rows into memory at once like fetchall() does.
+    
+    Requires one argument:
+    - cur (sqlite3.Cursor): The cursor that has executed the query
+    
+    Optional argument:
+    - batchSize (int): The number of rows to fetch at a time, defaults to DB_FETCH_BATCH_SIZE
+    """
+    while (1):
+        rows = cur.fetchmany(batchSize)
+        if (not rows):
+            return
+        yield from rows
+
+def get_db_file_version(con:sqlite3.Connection) -> int:
+    """
+    Returns the version (PRAGMA user_version) of the sqlite3 database file
+    which is incremented every time the records are saved to the database file.
+    
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    return con.execute("PRAGMA user_version").fetchone()[0]
+
+def increment_db_file_version(con:sqlite3.Connection) -> None:
+    """
+    Increment the version (PRAGMA user_version) of the sqlite3 database file
+    which will be committed together with the current transaction.
+    
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    set_db_file_version(con, get_db_file_version(con) + 1)
+
+def set_db_file_version(con:sqlite3.Connection, dbVersion:int) -> None:
+    """
+    Set the version (PRAGMA user_version) of the sqlite3 database file
+    which will be committed together with the current transaction.
+    
+    Requires two arguments:
+    - con (sqlite3.Connection)
+    - dbVersion (int)
+    """
+    # PRAGMA statements do not support parameters, but the version is always an int
+    con.execute(f"PRAGMA user_version = {int(dbVersion)}")
+
+def get_staycation_records_type(con:sqlite3.Connection) -> Union[str, None]:
+    """
+    Returns "table" if the staycation records are stored in a single table, "view" if the
+    database file uses the normalised schema, or None if the staycation records table does not exist.
+    
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    row = con.execute("SELECT type FROM sqlite_master WHERE name = ?", (STAYCATION_RECORDS_TABLE,)).fetchone()
+    return row[0] if (row) else None
+
+def is_normalised_schema(con:sqlite3.Connection) -> bool:
+    """
+    Returns True if the database file uses the normalised schema
+    where the names are stored in the packages and customers lookup tables
+    
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    return get_staycation_records_type(con) == "view"
+
+def check_if_db_file_is_normalised() -> bool:
+    """
+    Check if the sqlite3 database file exists and uses the normalised schema
+    """
+    if (not check_if_db_file_exists()):
+        return False
+
+    with DB_CONNECTION as con:
+        try:
+            return is_normalised_schema(con)
+        except (sqlite3.DatabaseError):
+            return False
+
+def create_normalised_schema_statements() -> list:
+    """
+    Returns the statements to create the normalised schema which consists of:
+    - the packages and customers lookup tables that store each unique name once with an integer id
+    - the staycation bookings table that stores the ids of the names instead of the names
+    - the staycation records view that joins the bookings with the names and has the same columns
+      (including the ROWID) as the staycation records table so that it can be queried the same way
+    - the INSTEAD OF triggers so that the rows can be inserted, updated, and deleted through the view
+      which will add the names to the lookup tables if they are new
+    
+    Note: The names are added with a WHERE NOT EXISTS instead of INSERT OR IGNORE as the conflict
+    clause of the statement that fired the trigger (e.g. INSERT OR REPLACE when replaying the journal)
+    will override the conflict clauses in the trigger, which would have given the name a new id.
+    """
+    def add_name_statement(table:str, column:str) -> str:
+        return f"INSERT INTO {table} ({column}) SELECT NEW.{column} " \
+               f"WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE {column} = NEW.{column});"
+
+    customerIdQuery = f"(SELECT customerId FROM {CUSTOMERS_TABLE} WHERE customerName = NEW.customerName)"
+    packageIdQuery = f"(SELECT packageId FROM {PACKAGES_TABLE} WHERE packageName = NEW.packageName)"
+    return [
+        f"CREATE TABLE {PACKAGES_TABLE} (packageId INTEGER PRIMARY KEY, packageName TEXT NOT NULL UNIQUE)",
+        f"CREATE TABLE {CUSTOMERS_TABLE} (customerId INTEGER PRIMARY KEY, customerName TEXT NOT NULL UNIQUE)",
+        f"""CREATE TABLE {STAYCATION_BOOKINGS_TABLE} (
+            customerId INTEGER NOT NULL REFERENCES {CUSTOMERS_TABLE} (customerId),
+            packageId INTEGER NOT NULL REFERENCES {PACKAGES_TABLE} (packageId),
+            paxNum INTEGER NOT NULL,
+            costPerPax INTEGER NOT NULL
+            )""",
+        f"""CREATE VIEW {STAYCATION_RECORDS_TABLE} AS
+            SELECT b.ROWID AS ROWID, c.customerName AS customerName, p.packageName AS packageName,
+                   b.paxNum AS paxNum, b.costPerPax AS costPerPax
+            FROM {STAYCATION_BOOKINGS_TABLE} AS b
+            JOIN {CUSTOMERS_TABLE} AS c ON c.customerId = b.customerId
+            JOIN {PACKAGES_TABLE} AS p ON p.packageId = b.packageId""",
+        f"""CREATE TRIGGER {STAYCATION_RECORDS_TABLE}_insert INSTEAD OF INSERT ON {STAYCATION_RECORDS_TABLE} BEGIN
+            {add_name_statement(CUSTOMERS_TABLE, "customerName")}
+            {add_name_statement(PACKAGES_TABLE, "packageName")}
+            INSERT INTO {STAYCATION_BOOKINGS_TABLE} (ROWID, customerId, packageId, paxNum, costPerPax)
+            VALUES (NEW.ROWID, {customerIdQuery}, {packageIdQuery}, NEW.paxNum, NEW.costPerPax);
+            END""",
+        f"""CREATE TRIGGER {STAYCATION_RECORDS_TABLE}_update INSTEAD OF UPDATE ON {STAYCATION_RECORDS_TABLE} BEGIN
+            {add_name_statement(CUSTOMERS_TABLE, "customerName")}
+            {add_name_statement(PACKAGES_TABLE, "packageName")}
+            UPDATE {STAYCATION_BOOKINGS_TABLE} SET customerId = {customerIdQuery}, packageId = {packageIdQuery},
+            paxNum = NEW.paxNum, costPerPax = NEW.costPerPax WHERE ROWID = OLD.ROWID;
+            END""",
+        f"""CREATE TRIGGER {STAYCATION_RECORDS_TABLE}_delete INSTEAD OF DELETE ON {STAYCATION_RECORDS_TABLE} BEGIN
+            DELETE FROM {STAYCATION_BOOKINGS_TABLE} WHERE ROWID = OLD.ROWID;
+            END"""
+    ]
+
+def fetch_normalised_rows(cur:sqlite3.Cursor, batchSize:int=DB_FETCH_BATCH_SIZE):
+    """
+    Generator to yield the rows from a database file with the normalised schema in the same order as
+    the bulk_load rows, (packageName, customerName, paxNum, costInCents, rowId), in batches.
+    
+    The lookup tables are read once and the names are looked up in Python
+    instead of joining the lookup tables in the query for every row.
+    
+    Requires one argument:
+    - cur (sqlite3.Cursor)
+    
+    Optional argument:
+    - batchSize (int): The number of rows to fetch at a time, defaults to DB_FETCH_BATCH_SIZE
+    
+    Raises KeyError if a booking refers to a name that is not in the lookup tables.
+    """
+    packageNames = dict(cur.execute(f"SELECT packageId, packageName FROM {PACKAGES_TABLE}"))
+    customerNames = dict(cur.execute(f"SELECT customerId, customerName FROM {CUSTOMERS_TABLE}"))
+    cur.execute(f"SELECT packageId, customerId, paxNum, costPerPax, ROWID FROM {STAYCATION_BOOKINGS_TABLE} ORDER BY ROWID ASC")
+    for packageId, customerId, paxNum, costPerPax, rowId in fetch_rows_in_batches(cur, batchSize):
+        yield packageNames[packageId], customerNames[customerId], paxNum, costPerPax, rowId
+
+def replay_journal_file(journalFilePath:pathlib.Path) -> int:
+    """
+    Function to fold the changes in the journal file into the sqlite3 database file 
+    in a single transaction and delete the journal file afterwards.
+    
+    The journal is only replayed if it was started on the current version of the 
+    database file, otherwise the changes were already saved before the journal was truncated.
+    The version of the database file is incremented after the journal is replayed.
+    
+    Requires one argument:
+    - journalFilePath (pathlib.Path): the path of the journal file
+    
+    Returns the number of changes replayed.
+    """
+    from mutation_journal import read_journal # import here to avoid circular imports
+
+    numOfChanges = 0
+    entries = read_journal(journalFilePath)
+    beginEntry = next(entries, None)
+    if (beginEntry is not None and beginEntry["op"] == "begin" and check_if_db_file_exists()):
+        with DB_CONNECTION as con:
+            try:
+                if (get_db_file_version(con) == beginEntry["version"]):
+                    with con:
+                        # apply consecutive entries of the same operation with a single executemany
+                        # while preserving the order of the operations, e.g. an add before an edit
+                        for op, group in groupby(entries, key=lambda entry: entry["op"]):
+                            group = list(group)
+                            if (op == "add"):
+                                con.executemany(
+                                    f"INSERT OR REPLACE INTO {STAYCATION_RECORDS_TABLE} (ROWID, customerName, packageName, paxNum, costPerPax) " \
+                                    "VALUES (:rowId, :customerName, :packageName, :paxNum, :costPerPax)", group
+                                )
+                            elif (op == "edit"):
+                                con.executemany(
+                                    f"UPDATE {STAYCATION_RECORDS_TABLE} SET customerName = :customerName, packageName = :packageName, " \
+                                    "paxNum = :paxNum, costPerPax = :costPerPax WHERE ROWID = :rowId", group
+                                )
+                            elif (op == "delete"):
+                                con.executemany(f"DELETE FROM {STAYCATION_RECORDS_TABLE} WHERE ROWID = :rowId", group)
+                            else:
+                                continue
+
+                            numOfChanges += len(group)
+                            if (op != "delete"):
+                                # the saved sort order is no longer valid after a record is added or edited
+                                con.execute(f"UPDATE {HOTEL_DATABASE_CONFIG_TABLE} SET sortingOrder = ?", (NOT_SORTED,))
+
+                        # a journal after a rotated journal starts on the next version
+                        increment_db_file_version(con)
+            except (sqlite3.OperationalError, sqlite3.DatabaseError, KeyError):
+                print(f"{F.LIGHTRED_EX}Error: The journal could not be replayed into the SQLite3 database file and its changes will be discarded.")
+                S_reset()
+
+    entries.close()
+    journalFilePath.unlink()
+    return numOfChanges
+
+def promote_background_save() -> bool:
+    """
+    Function to replace the sqlite3 database file with the new database file 
+    written by a background save (see background_save.py) if it has been completely written.
+    
+    Returns True if the database file was replaced.
+    """
+    if (not BGSAVE_FILE_PATH.is_file()):
+        return False
+
+    # the connection is opened and closed first to checkpoint the write-ahead log into the old database file 
+    # as the log would otherwise be applied to the new database file which will have the same file name
+    with DB_CONNECTION:
+        DB_CONNECTION.close()
+        os.replace(BGSAVE_FILE_PATH, DB_FILE_PATH)
+    return True
+
+def replay_journal() -> int:
+    """
+    Function to fold the changes in the rotated journal file and then the journal file (if any)
+    into the sqlite3 database file, e.g. if the program was terminated before the changes were saved.
+    
+    Returns the number of changes replayed.
+    """
+    from mutation_journal import get_rotated_file_path # import here to avoid circular imports
+
+    numOfChanges = 0
+    for journalFilePath in (get_rotated_file_path(JOURNAL_FILE_PATH), JOURNAL_FILE_PATH):
+        if (journalFilePath.is_file()):
+            numOfChanges += replay_journal_file(journalFilePath)
+    return numOfChanges
+
+def open_journal(db):
+    """
+    Function to start journalling the changes made to the records of the HotelDatabase object 
+    to the append-only journal file so that the changes are not lost if the program is terminated abruptly.
+    
+    The HotelDatabase object will be saved first if there are records that have not been
+    saved yet (e.g. pre-initialised records) as the journal entries refer to the records by their ROWID.
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Returns the MutationJournal object that is attached to the HotelDatabase object.
+    """
+    from mutation_journal import MutationJournal # import here to avoid circular imports
+
+    if (not check_if_db_file_exists() or db.get_unsaved_changes()[0]):
+        save_db_file(db, printSuccessMsg=False)
+
+    with DB_CONNECTION as con:
+        maxRowId, _, dbVersion = query_save_state(con)
+
+    journal = MutationJournal(JOURNAL_FILE_PATH, dbVersion, maxRowId)
+    db.attach_journal(journal)
+    return journal
+
+def add_preinitialised_records(db, numOfRecords:int=10) -> None:
+    """
+    Pre-initialise the database with randomly generated records
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Optional argument:
+    - numOfRecords (int): defaults to 10 records to satisfy basic function b
+    """
+    for _ in range(numOfRecords):
+        randPackage, randCust = preintialise_data()
+        db.add_record(randPackage, randCust, randint(1,9), uniform(50,1000))
+
+def read_sharded_db_file(preintialiseData:bool=False):
+    """
+    Function to load the records from the directory of sqlite3 database files (shards)
+    which are read in parallel by a pool of processes (one worker per shard)
+    
+    Optional argument:
+    - preintialiseData (bool): to preinitialise the database with 10 records 
+                               if there are no shards, defaults to False
+    """
+    # import here to avoid circular imports
+    from hotel_record import HotelDatabase
+    from sharded_storage import recover_sharded_dir, get_shard_file_paths, read_sharded_db
+
+    # restore the old shards if the program was terminated while saving
+    recover_sharded_dir(SHARDED_DB_DIR_PATH)
+
+    db = HotelDatabase()
+    if (not SHARDED_DB_DIR_PATH.is_dir() or not get_shard_file_paths(SHARDED_DB_DIR_PATH)):
+        if (preintialiseData):
+            add_preinitialised_records(db)
+        return db
+
+    try:
+        rows, configTuple = read_sharded_db(SHARDED_DB_DIR_PATH)
+        db.bulk_load(rows)
+    except (sqlite3.DatabaseError, BrokenProcessPool):
+        newDirName = datetime.now().strftime("corrupted-%d-%m-%Y_%H-%M-%S") + ".shards"
+        print(f"{F.LIGHTRED_EX}Error: One of the SQLite3 database shards is empty or has some errors.")
+        print(f"Old directory of shards will be renamed to \"{newDirName}\" (delete at your own risk and will)")
+        print(f"and new shards will be created with {'10 pre-initialised records' if (preintialiseData) else 'no records pre-initialised'}.")
+        S_reset()
+
+        try:
+            SHARDED_DB_DIR_PATH.rename(FILE_PATH.joinpath(newDirName))
+        except (PermissionError, OSError):
+            print(f"\n{F.LIGHTRED_EX}File Permission Error: The directory of shards might be in use by other resources when renaming it to \"{newDirName}\".")
+            print(f"Please MANUALLY delete or rename the directory of shards, \"{SHARDED_DB_DIR_NAME}\" to something else to use this program again!")
+            S_reset()
+
+            # raise error to shut down the program
+            raise dbFileError("File Permission error: Old corrupted directory of shards might in use or the program may have limited access to it.")
+
+        return read_sharded_db_file(preintialiseData=preintialiseData)
+
+    if (configTuple):
+        if (configTuple[0] is not None):
+            db.sort_order = configTuple[0]
+
+        if (configTuple[1] is not None):
+            db.descending_flag = bool(configTuple[1])
+    return db
+
+def read_db_file(preintialiseData:bool=False, sqlQueryMode:bool=False, useSnapshot:bool=False, sharded:bool=False, \
+                 inMemory:bool=False, columnar:bool=False):
     """
     Function to load the database file
     
     Requires one argument:
     - preintialiseData (bool): to preinitialise the database with 10 records 
                                if pickle file doesn't exist, defaults to False
+    
+    Optional arguments:
+    - sqlQueryMode (bool): to return a HotelDatabase object in the SQL query mode where 
+                           the records are not loaded and are queried from the database file instead.
+                           Defaults to False.
+    - useSnapshot (bool): to load the records from the columnar snapshot file instead if it is 
+                          up to date with the sqlite3 database file, defaults to False
+    - sharded (bool): to load the records from the directory of sqlite3 database files (shards) instead
+                      in parallel, defaults to False (the other optional arguments are then ignored)
+    - inMemory (bool): to return a HotelDatabase object in the SQL query mode on an in-memory copy of the 
+                       database file where the changes are only written to the database file when it is saved
+                       (see save_in_memory_db_file()), defaults to False
+    - columnar (bool): to return a HotelDatabase object in the columnar mode where the records are 
+                       stored in packed columns instead of RecordData objects, defaults to False 
+                       (the columnar snapshot is then not used)
     """
     from hotel_record import HotelDatabase # import here to avoid circular imports
-    db = HotelDatabase()
+
+    if (sharded):
+        return read_sharded_db_file(preintialiseData=preintialiseData)
+
+    # use the database file written by a background save that finished after the program was terminated
+    # and then fold the changes that were not saved before the program was terminated into the database file
+    promote_background_save()
+    replay_journal()
+
+    if (sqlQueryMode or inMemory):
+        from sql_queries import create_indexes
+        if (check_if_db_file_exists()):
+            try:
+                if (inMemory):
+                    # copy all the pages of the database file into the in-memory database
+                    con = sqlite3.connect(":memory:", check_same_thread=False)
+                    with DB_CONNECTION as fileCon:
+                        fileCon.backup(con)
+                else:
+                    con = DB_CONNECTION.get()
+
+                # the indexes are only created once and persisted in the database file
+                create_indexes(con)
+                db = HotelDatabase(sqlCon=con)
+                configTuple = con.execute(f"SELECT * FROM {HOTEL_DATABASE_CONFIG_TABLE}").fetchone()
+                if (configTuple):
+                    db.sort_order = configTuple[0]
+                    db.descending_flag = bool(configTuple[1])
+                return db
+            except (sqlite3.OperationalError, sqlite3.DatabaseError):
+                DB_CONNECTION.close()
+
+        # if the database file does not exist or has some errors, load the database file normally 
+        # to handle the errors and save it as a new database file before querying it
+        rewrite_db_file(read_db_file(preintialiseData=preintialiseData))
+        return read_db_file(preintialiseData=preintialiseData, sqlQueryMode=sqlQueryMode, inMemory=inMemory)
+
+    if (useSnapshot and not columnar and check_if_snapshot_is_up_to_date()):
+        db = read_snapshot_file()
+        if (db is not None):
+            return db
+
+    db = HotelDatabase(columnar=columnar)
 
     if (check_if_db_file_exists()):
         try:
-            con = sqlite3.connect(DB_FILE_PATH)
+            con = DB_CONNECTION.get()
             cur = con.cursor()
-            records = cur.execute(f"SELECT * FROM {STAYCATION_RECORDS_TABLE} ORDER BY ROWID ASC").fetchall()
-        except (sqlite3.IntegrityError, sqlite3.OperationalError, sqlite3.DatabaseError):
+
+            # load all sqlite3 database records into the HotelDatabase object in batches.
+            # The columns are selected in the same order as the add_record arguments and
+            # the cost is kept in cents as it is stored as an INTEGER
+            if (is_normalised_schema(cur)):
+                db.bulk_load(fetch_normalised_rows(cur))
+            else:
+                cur.execute(f"SELECT packageName, customerName, paxNum, costPerPax, ROWID FROM {STAYCATION_RECORDS_TABLE} ORDER BY ROWID ASC")
+                db.bulk_load(fetch_rows_in_batches(cur))
+        except (sqlite3.IntegrityError, sqlite3.OperationalError, sqlite3.DatabaseError, KeyError):
             # if the sqlite3 database file is empty (no tables) or has some errors, 
             # delete it and call itself (the function) again
-            con.close() # close the connection to allow the program to rename the corrupted db file
+            DB_CONNECTION.close() # close the connection to allow the program to rename the corrupted db file
 
             newFileName = datetime.now().strftime("corrupted-%d-%m-%Y_%H-%M-%S") + ".db"
             newFilePath = FILE_PATH.joinpath(newFileName)
@@ -119,7 +606,7 @@ def read_db_file(preintialiseData:bool=False):
                 # raise error to shut down the program
                 raise dbFileError("File Permission error: Old corrupted SQLite3 file might in use or the program may have limited access to the file.")
 
-            return read_db_file(preintialiseData=preintialiseData)
+            return read_db_file(preintialiseData=preintialiseData, columnar=columnar)
 
         # load the HotelDatabase object's configuration from the sqlite3 database file
         try:
@@ -127,15 +614,7 @@ def read_db_file(preintialiseData:bool=False):
         except (sqlite3.OperationalError):
             configTuple = None # if the config table doesn't exist, then the configTuple will be None
 
-        con.close()
-
-        # load all sqlite3 database records into the HotelDatabase object
-        for record in records:
-            customerName = record[0]
-            packageName = record[1]
-            paxNum = record[2]
-            costPerPax = record[3] / 100 # since the cost is stored as an INTEGER
-            db.add_record(packageName, customerName, paxNum, costPerPax)
+        cur.close()
 
         # set the config here since the HoteLDatabase object will reset the 
         # sort order to NOT_SORTED when each record is added to the object.
@@ -149,65 +628,450 @@ def read_db_file(preintialiseData:bool=False):
 
         return db
 
-    numOfRecords = 0
-    if (preintialiseData):
-        numOfRecords = 10
-
     # pre-initialize the database with 10 records to satisfy basic function b
-    for _ in range(numOfRecords):
-        randPackage, randCust = preintialise_data()
-        db.add_record(randPackage, randCust, randint(1,9), uniform(50,1000))
+    if (preintialiseData):
+        add_preinitialised_records(db)
     return db
 
-def save_db_file(db, printSuccessMsg:bool=True) -> None:
+def is_row_order_preserved(records:list) -> bool:
     """
-    Function to save the database file for future runs
+    Checks if the order of the records is the same as the order of their ROWID
+    in the sqlite3 database file since the records are loaded in ascending order of their ROWID.
+    
+    Requires one argument:
+    - records (list): The array of RecordData objects that all have a ROWID
+    
+    Time complexity: O(n)
+    """
+    prevRowId = 0
+    for record in records:
+        if (record.get_row_id() <= prevRowId):
+            return False
+        prevRowId = record.get_row_id()
+    return True
+
+def get_record_rows(records:list) -> list:
+    """
+    Returns the rows of the records to be written to the sqlite3 database file as an array of
+    (rowId, customerName, packageName, paxNum, costPerPax) tuples where the cost is in cents.
+    
+    Requires one argument:
+    - records (list): The array of RecordData objects that all have a ROWID
+    """
+    return [(record.get_row_id(), record.get_customer_name(), record.get_package_name(), \
+             record.get_pax_num(), record.get_cost_in_cents()) for record in records]
+
+def query_save_state(con:sqlite3.Connection) -> tuple:
+    """
+    Returns the largest ROWID, the saved configuration, and the version of the sqlite3 database file 
+    in a tuple which are needed to save the changes to the database file.
+    
+    Raises sqlite3.OperationalError or sqlite3.DatabaseError if the tables are missing or the file is corrupted.
+    
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    maxRowId = con.execute(f"SELECT MAX(ROWID) FROM {STAYCATION_RECORDS_TABLE}").fetchone()[0] or 0
+    configTuple = con.execute(f"SELECT * FROM {HOTEL_DATABASE_CONFIG_TABLE}").fetchone()
+    return maxRowId, configTuple, get_db_file_version(con)
+
+def prepare_changes(db, maxRowId:int, configTuple:tuple) -> Union[tuple, bool, None]:
+    """
+    Prepare the rows of the records that were added, edited, or deleted since the last save
+    so that they can be written to the sqlite3 database file without accessing the HotelDatabase object.
+    
+    Returns:
+    - a tuple of (deleted ROWIDs, edited rows, added rows, configuration tuple or None if it has not changed)
+    - False if there were no changes to save
+    - None if the whole table has to be rewritten instead, e.g. the order of the records 
+      has changed after sorting
+    
+    Requires three arguments:
+    - db (HotelDatabase)
+    - maxRowId (int): the largest ROWID in the database file
+    - configTuple (tuple): the configuration saved in the database file
+    """
+    addedRecords, editedRecords, deletedRowIds = db.get_unsaved_changes()
+
+    # give the newly added records a ROWID after the last row in the table 
+    # since they are appended to the back of the array
+    # (unless the journal has already given them a ROWID)
+    for record in addedRecords:
+        if (record.get_row_id() is None):
+            maxRowId += 1
+            record.set_row_id(maxRowId)
+
+    # since the records are loaded in ascending order of their ROWID, the whole
+    # table has to be rewritten if the records are no longer in that order (e.g. after sorting)
+    if (not is_row_order_preserved(db.get_array())):
+        return None
+
+    configChanged = (configTuple != (db.sort_order, db.descending_flag))
+    if (not addedRecords and not editedRecords and not deletedRowIds and not configChanged):
+        return False
+
+    return deletedRowIds, get_record_rows(editedRecords), get_record_rows(addedRecords), \
+           (db.sort_order, db.descending_flag) if (configChanged) else None
+
+def write_changes_to_db_file(con:sqlite3.Connection, changes:tuple) -> None:
+    """
+    Write the changes prepared by prepare_changes() to the sqlite3 database file in a single transaction
     
     Requires two arguments:
+    - con (sqlite3.Connection)
+    - changes (tuple): (deleted ROWIDs, edited rows, added rows, configuration tuple or None)
+    """
+    deletedRowIds, editedRows, addedRows, configTuple = changes
+
+    # apply all the changes in a single transaction which will be 
+    # committed at the end of the with block or rolled back if there is an error
+    with con:
+        con.executemany(f"DELETE FROM {STAYCATION_RECORDS_TABLE} WHERE ROWID = ?", [(rowId,) for rowId in deletedRowIds])
+        con.executemany(
+            f"UPDATE {STAYCATION_RECORDS_TABLE} SET customerName = ?2, packageName = ?3, paxNum = ?4, costPerPax = ?5 WHERE ROWID = ?1",
+            editedRows
+        )
+        con.executemany(
+            f"INSERT INTO {STAYCATION_RECORDS_TABLE} (ROWID, customerName, packageName, paxNum, costPerPax) VALUES (?, ?, ?, ?, ?)",
+            addedRows
+        )
+        if (configTuple is not None):
+            con.execute(f"DELETE FROM {HOTEL_DATABASE_CONFIG_TABLE}")
+            con.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", configTuple)
+        increment_db_file_version(con)
+
+def save_changes_to_db_file(db) -> Union[bool, None]:
+    """
+    Function to only write the records that were added, edited, or deleted since 
+    the last save to the sqlite3 database file in a single transaction.
+    
+    Returns:
+    - True if the changes were saved
+    - False if there were no changes to save (nothing will be written to the database file)
+    - None if the whole table has to be rewritten instead, e.g. the order of the records 
+      has changed after sorting or the table is missing from the database file
+    
+    Requires one argument:
     - db (HotelDatabase)
-    - printSuccessMsg (bool): to print a success message if True, defaults to True
     """
-    con = sqlite3.connect(DB_FILE_PATH)
+    with DB_CONNECTION as con:
+        try:
+            maxRowId, configTuple, _ = query_save_state(con)
+        except (sqlite3.OperationalError, sqlite3.DatabaseError):
+            return None
+
+        changes = prepare_changes(db, maxRowId, configTuple)
+        if (not changes):
+            return changes
+
+        write_changes_to_db_file(con, changes)
+    return True
+
+def save_config_to_db_file(db, con:sqlite3.Connection=None) -> bool:
+    """
+    Function to only save the HotelDatabase object's configuration (sorting order and descending flag)
+    to the sqlite3 database file if it has changed.
+    
+    Returns True if the configuration was saved, False if it has not changed.
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Optional argument:
+    - con (sqlite3.Connection): the connection to save the configuration to, e.g. an in-memory database,
+                                defaults to None to save it to the sqlite3 database file
+    """
+    if (con is None):
+        with DB_CONNECTION as con:
+            return save_config_to_db_file(db, con=con)
+
+    with con:
+        con.execute(f"CREATE TABLE IF NOT EXISTS {HOTEL_DATABASE_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
+        configTuple = con.execute(f"SELECT * FROM {HOTEL_DATABASE_CONFIG_TABLE}").fetchone()
+        configChanged = (configTuple != (db.sort_order, db.descending_flag))
+        if (configChanged):
+            con.execute(f"DELETE FROM {HOTEL_DATABASE_CONFIG_TABLE}")
+            con.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", (db.sort_order, db.descending_flag))
+    return configChanged
+
+def save_in_memory_db_file(db) -> bool:
+    """
+    Function to save the in-memory sqlite3 database of the HotelDatabase object to the sqlite3 database file 
+    by copying all of its pages with sqlite3's backup API in a single step (a checkpoint).
+    
+    Requires one argument:
+    - db (HotelDatabase): the HotelDatabase object in the SQL query mode on an in-memory database
+    
+    Returns True as the whole database file is always replaced.
+    """
+    memCon = db.sql_con
+    with db.lock:
+        save_config_to_db_file(db, con=memCon)
+        with memCon:
+            increment_db_file_version(memCon)
+
+        # the backup replaces all the pages of the database file (including its version)
+        with DB_CONNECTION as con:
+            memCon.backup(con)
+    return True
+
+def prepare_rewrite(db) -> tuple:
+    """
+    Prepare the rows of all the records in the current order of the HotelDatabase object
+    so that they can be written to the sqlite3 database file without accessing the HotelDatabase object.
+    
+    Note: The rows' ROWID are renumbered from 1 to n based on the current order of the records,
+    call renumber_records() after the rows are written to update the records' ROWID.
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Returns a tuple of (rows, configuration tuple)
+    """
+    rows = [(rowId, record.get_customer_name(), record.get_package_name(), record.get_pax_num(), \
+             record.get_cost_in_cents()) for rowId, record in enumerate(db.get_array(), start=1)]
+    return rows, (db.sort_order, db.descending_flag)
+
+def renumber_records(db) -> None:
+    """
+    Renumber the records' ROWID from 1 to n based on their current order 
+    after the rows prepared by prepare_rewrite() are written to the database file
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    """
+    for rowId, record in enumerate(db.get_array(), start=1):
+        record.set_row_id(rowId)
+
+def write_normalised_rows(cur:sqlite3.Cursor, rows:list) -> None:
+    """
+    Create the normalised schema and insert the rows prepared by prepare_rewrite() into it.
+    
+    The names are dictionary-encoded in Python so that the lookup tables and the bookings
+    can be inserted directly instead of through the staycation records view's trigger for every row.
+    
+    Requires two arguments:
+    - cur (sqlite3.Cursor)
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+    """
+    for statement in create_normalised_schema_statements():
+        cur.execute(statement)
+
+    customerIds = {}
+    packageIds = {}
+    bookings = [(rowId, customerIds.setdefault(customerName, len(customerIds) + 1), \
+                 packageIds.setdefault(packageName, len(packageIds) + 1), paxNum, costPerPax) \
+                for rowId, customerName, packageName, paxNum, costPerPax in rows]
+
+    cur.executemany(f"INSERT INTO {CUSTOMERS_TABLE} (customerName, customerId) VALUES (?, ?)", customerIds.items())
+    cur.executemany(f"INSERT INTO {PACKAGES_TABLE} (packageName, packageId) VALUES (?, ?)", packageIds.items())
+    cur.executemany(f"INSERT INTO {STAYCATION_BOOKINGS_TABLE} (ROWID, customerId, packageId, paxNum, costPerPax) VALUES (?, ?, ?, ?, ?)", bookings)
+
+def write_new_db_file(rows:list, configTuple:tuple, normalisedSchema:bool=None) -> None:
+    """
+    Function to replace the tables in the sqlite3 database file with the rows 
+    prepared by prepare_rewrite() in a single transaction so that the database file
+    is never left with only some of the rows if an error occurs while writing.
+    
+    Requires two arguments:
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+    - configTuple (tuple): the HotelDatabase object's configuration (sorting order and descending flag)
+    
+    Optional argument:
+    - normalisedSchema (bool): to store the names in the packages and customers lookup tables if True 
+                               or in every row if False, defaults to None to keep the current schema
+    """
+    with DB_CONNECTION as con:
+        write_db_tables(con, rows, configTuple, normalisedSchema=normalisedSchema)
+
+def write_db_tables(con:sqlite3.Connection, rows:list, configTuple:tuple, normalisedSchema:bool=None, dbVersion:int=None) -> None:
+    """
+    Replace the tables in the sqlite3 database file of the connection with the rows 
+    prepared by prepare_rewrite() in a single transaction, e.g. to write a new database file
+    in the child process of a background save (see background_save.py).
+    
+    Requires three arguments:
+    - con (sqlite3.Connection)
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+    - configTuple (tuple): the HotelDatabase object's configuration (sorting order and descending flag)
+    
+    Optional arguments:
+    - normalisedSchema (bool): to store the names in the packages and customers lookup tables if True 
+                               or in every row if False, defaults to None to keep the current schema
+    - dbVersion (int): the version to give the database file, defaults to None to increment its version
+    """
+    from sql_queries import create_index_statements # import here to avoid circular imports
+
+    # the transaction is begun and committed manually as sqlite3 only 
+    # begins a transaction implicitly before INSERT/UPDATE/DELETE statements
     cur = con.cursor()
+    cur.execute("BEGIN")
+    try:
+        currentType = get_staycation_records_type(cur)
+        if (normalisedSchema is None):
+            normalisedSchema = (currentType == "view")
+
+        # saving the records to the sqlite3 database
+        # remove old table (or the view and the tables of the normalised schema)
+        if (currentType == "view"):
+            cur.execute(f"DROP VIEW {STAYCATION_RECORDS_TABLE}") # the triggers are dropped together with the view
+        elif (currentType is not None):
+            cur.execute(f"DROP TABLE {STAYCATION_RECORDS_TABLE}")
+        for table in (STAYCATION_BOOKINGS_TABLE, PACKAGES_TABLE, CUSTOMERS_TABLE):
+            cur.execute(f"DROP TABLE IF EXISTS {table}")
+
+        if (normalisedSchema):
+            write_normalised_rows(cur, rows)
+        else:
+            # create new table
+            cur.execute(f"""CREATE TABLE {STAYCATION_RECORDS_TABLE} (
+                customerName TEXT NOT NULL, 
+                packageName TEXT NOT NULL, 
+                paxNum INTEGER NOT NULL, 
+                costPerPax INTEGER NOT NULL -- Using INTEGER since REAL is not the best way to store price data
+                                            -- https://dba.stackexchange.com/questions/15729/storing-prices-in-sqlite-what-data-type-to-use
+                )""")
+
+            # add tuples to the new table
+            cur.executemany(f"INSERT INTO {STAYCATION_RECORDS_TABLE} (ROWID, customerName, packageName, paxNum, costPerPax) VALUES (?, ?, ?, ?, ?)", rows)
+
+        # recreate the indexes for the SQL query mode after the rows are inserted 
+        # as the indexes are dropped together with the old table
+        for statement in create_index_statements(normalisedSchema):
+            cur.execute(statement)
+
+        # save the HotelDatabase object's configuration to the sqlite3 database file
+        # delete old HotelDatabase saved configuration (sorting order and descending flag)
+        cur.execute(f"DROP TABLE IF EXISTS {HOTEL_DATABASE_CONFIG_TABLE}")
+
+        # update the HotelDatabase saved configuration (sorting order and descending flag)
+        cur.execute(f"CREATE TABLE {HOTEL_DATABASE_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
+        cur.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", configTuple)
+        if (dbVersion is None):
+            increment_db_file_version(con)
+        else:
+            set_db_file_version(con, dbVersion)
+        cur.execute("COMMIT")
+    except:
+        cur.execute("ROLLBACK")
+        raise
+
+    if (currentType is not None and normalisedSchema != (currentType == "view")):
+        # the pages of the dropped tables are only reused by sqlite3 instead of being freed,
+        # hence the database file has to be vacuumed for it to shrink after changing the schema
+        cur.execute("VACUUM")
+
+    cur.close()
+
+def rewrite_db_file(db, normalisedSchema:bool=None) -> None:
+    """
+    Function to rewrite the whole sqlite3 database file with all the records 
+    in the current order of the HotelDatabase object.
+    
+    Note: The records' ROWID will be renumbered from 1 to n based on their current order.
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Optional argument:
+    - normalisedSchema (bool): to store the names in the packages and customers lookup tables if True 
+                               or in every row if False, defaults to None to keep the current schema
+    """
+    write_new_db_file(*prepare_rewrite(db), normalisedSchema=normalisedSchema)
+    renumber_records(db)
 
-    # saving the records to the sqlite3 database
-    # remove old table
-    cur.execute(f"DROP TABLE IF EXISTS {STAYCATION_RECORDS_TABLE}")
-    con.commit()
-
-    # create new table
-    cur.execute(f"""CREATE TABLE {STAYCATION_RECORDS_TABLE} (
-        customerName TEXT NOT NULL, 
-        packageName TEXT NOT NULL, 
-        paxNum INTEGER NOT NULL, 
-        costPerPax INTEGER NOT NULL -- Using INTEGER since REAL is not the best way to store price data
-                                    -- https://dba.stackexchange.com/questions/15729/storing-prices-in-sqlite-what-data-type-to-use
-        )""")
-    con.commit()
-
-    # add tuples to the new table
-    for record in db.get_array():
-        dataTuple = (
-                record.get_customer_name(), record.get_package_name(), 
-                record.get_pax_num(), int(record.get_cost_per_pax() * 100) # times 100 since it is in 2dp
-            )
-        cur.execute(f"INSERT INTO {STAYCATION_RECORDS_TABLE} VALUES (?, ?, ?, ?)", dataTuple)
-    con.commit()
-
-    # save the HotelDatabase object's configuration to the sqlite3 database file
-    # delete old HotelDatabase saved configuration (sorting order and descending flag)
-    cur.execute(f"DROP TABLE IF EXISTS {HOTEL_DATABASE_CONFIG_TABLE}")
-    con.commit()
-
-    # update the HotelDatabase saved configuration (sorting order and descending flag)
-    cur.execute(f"CREATE TABLE {HOTEL_DATABASE_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
-    cur.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", (db.sort_order, \
-                                                                             db.descending_flag))
-    con.commit()
-    con.close()
+def save_sharded_db_file(db) -> bool:
+    """
+    Function to save all the records to new sqlite3 database files (shards) in parallel 
+    by a pool of processes (one worker per shard) which will then replace the old shards.
+    
+    Nothing will be written if there were no changes since the last save.
+    
+    Note: The records' ROWID will be renumbered from 1 to n based on their current order.
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Returns True if the records were saved, False if there were no changes to save.
+    """
+    from sharded_storage import recover_sharded_dir, read_sharded_config, write_sharded_db # import here to avoid circular imports
+
+    recover_sharded_dir(SHARDED_DB_DIR_PATH)
+    addedRecords, editedRecords, deletedRowIds = db.get_unsaved_changes()
+    if (not addedRecords and not editedRecords and not deletedRowIds and is_row_order_preserved(db.get_array()) \
+        and read_sharded_config(SHARDED_DB_DIR_PATH) == (db.sort_order, db.descending_flag)):
+        return False
+
+    write_sharded_db(SHARDED_DB_DIR_PATH, *prepare_rewrite(db))
+    renumber_records(db)
+    return True
+
+def save_db_file(db, printSuccessMsg:bool=True, fullRewrite:bool=False, writeSnapshot:bool=False, \
+                 normalisedSchema:bool=None, sharded:bool=False) -> None:
+    """
+    Function to save the database file for future runs
+    
+    By default, only the records that were added, edited, or deleted since the last save
+    will be written to the database file in a single transaction and nothing will be 
+    written if there were no changes. The whole table will be rewritten if the database 
+    file does not exist or if the order of the records has changed (e.g. after sorting).
+    
+    Requires one argument:
+    - db (HotelDatabase)
+    
+    Optional arguments:
+    - printSuccessMsg (bool): to print a success message if True, defaults to True
+    - fullRewrite (bool): to always rewrite the whole table if True, defaults to False
+    - writeSnapshot (bool): to also write the columnar snapshot file after saving if True, 
+                            defaults to False (not written in the SQL query mode)
+    - normalisedSchema (bool): to store the names in the packages and customers lookup tables if True
+                               or in every row if False. The whole table will be rewritten if the database file
+                               uses the other schema. Defaults to None to keep the current schema.
+                               (the schema is not changed in the SQL query mode)
+    - sharded (bool): to save the records to the directory of sqlite3 database files (shards) instead
+                      in parallel, defaults to False (the snapshot and the schema are then ignored)
+    """
+    if (normalisedSchema is not None and not sharded and not db.sql_query_mode and check_if_db_file_exists() \
+        and check_if_db_file_is_normalised() != normalisedSchema):
+        fullRewrite = True
+
+    saved = None
+    if (sharded):
+        saved = save_sharded_db_file(db)
+    elif (db.in_memory_mode):
+        saved = save_in_memory_db_file(db)
+    elif (db.sql_query_mode):
+        # only the sort order has to be saved as the changes are 
+        # already written to the database file in the SQL query mode
+        saved = save_config_to_db_file(db)
+    elif (not fullRewrite and check_if_db_file_exists()):
+        saved = save_changes_to_db_file(db)
+
+    if (saved is None):
+        rewrite_db_file(db, normalisedSchema=normalisedSchema)
+        saved = True
+    db.clear_unsaved_changes()
+
+    if (db.journal is not None and (saved or db.journal.num_of_entries > 0)):
+        # truncate the journal as its changes are now saved in the database file
+        with DB_CONNECTION as con:
+            maxRowId, _, dbVersion = query_save_state(con)
+        db.journal.reset(dbVersion, maxRowId)
+
+    if (writeSnapshot and not sharded and not db.sql_query_mode and (saved or not check_if_snapshot_is_up_to_date())):
+        from columnar_snapshot import write_snapshot # import here to avoid circular imports
+
+        # checkpoint the write-ahead log first as the snapshot would no longer be up to date
+        # if the log is only checkpointed into the database file after the snapshot is written
+        with DB_CONNECTION as con:
+            con.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        write_snapshot(db, SNAPSHOT_FILE_PATH)
 
     if (printSuccessMsg):
-        print(f"{F.LIGHTGREEN_EX}Database file saved successfully!")
+        if (saved):
+            print(f"{F.LIGHTGREEN_EX}Database file saved successfully!")
+        else:
+            print(f"{F.LIGHTGREEN_EX}No changes to save, database file is already up to date!")
         S_reset()
 
 def print_main_menu(numOfRecords:int, sortOrder:str=NOT_SORTED) -> None:
@@ -250,9 +1114,14 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print("-" * 10, "Display Options", "-" * 10)
         print()
         print("1. Display all records")
-        print("2. Display records by cost (binary search + radix sort)")
+        print("2. Display records by cost (cost index range search)")
         print("3. Display records by customer name (binary search tree)")
-        print("4. Display records by package name (fibonacci search + introsort)")
+        print("4. Display records by package name (package name index)")
+        print("5. Display records by customer name prefix (radix trie)")
+        print("6. Display records by similar customer name (n-gram fuzzy search)")
+        print("7. Display records by similar package name (n-gram fuzzy search)")
+        print("8. Display records by cost (binary search + radix sort)")
+        print("9. Display records by package name (fibonacci search + introsort)")
         print("F. Back to main menu")
         print()
         print("-" * 37)
@@ -261,7 +1130,8 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print("-" * 13, "Edit Options", "-" * 13)
         print()
         print("1. Edit record by customer name (linear search)")
-        print("2. Edit record by package name (binary search + heap sort)")
+        print("2. Edit record by package name (package name index)")
+        print("3. Edit record by package name (binary search + heap sort)")
         print("F. Back to main menu")
         print()
         print("-" * 40)
@@ -269,10 +1139,14 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print()
         print("-" * 15, "Sort Options", "-" * 15)
         print()
-        print("1. Sort records by customer name (bubble sort)")
-        print("2. Sort records by package name (selection sort)")
-        print("3. Sort records by package cost (insertion sort)")
-        print("4. Sort records by package's number of pax (shellsort)")
+        print("1. Sort records by customer name (tree sort)")
+        print("2. Sort records by package name (package name index)")
+        print("3. Sort records by package cost (cost index)")
+        print("4. Sort records by package's number of pax (pax index)")
+        print("5. Sort records by customer name (bubble sort)")
+        print("6. Sort records by package name (selection sort)")
+        print("7. Sort records by package cost (insertion sort)")
+        print("8. Sort records by package's number of pax (shellsort)")
         print("F. Back to main menu")
         print()
         print("Noob/Pancake. ???")
@@ -283,7 +1157,8 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print("-" * 13, "Delete Options", "-" * 13)
         print()
         print("1. Delete record by customer name (exponential search + tree sort)")
-        print("2. Delete record by package name (binary search + heap sort)")
+        print("2. Delete record by package name (package name index)")
+        print("3. Delete record by package name (binary search + heap sort)")
         print("F. Back to main menu")
         print()
         print("-" * 42)
@@ -395,21 +1270,25 @@ def countdown() -> None:
         print(f"\rAutomatically shutting down in {i} seconds...", end="")
         sleep(1)
 
-def shutdown(nl:bool=False, program:str="Main", abrupt:bool=False) -> None:
+def shutdown(nl:bool=False, program:str="Main", abrupt:bool=False, journalled:bool=False) -> None:
     """
     Print some messages before shutting down the program
 
-    Requires three arguments:
+    Requires four arguments:
     - nl (bool): Whether to print a newline before the shutdown messages. Defaults to False.
     - program (str): Print the corresponding program shutdown messages. Defaults to "Main".
     - abrupt (bool): Whether to print the abrupt shutdown message only. Defaults to False.
+    - journalled (bool): Whether the changes were kept in the journal when shutting down abruptly. Defaults to False.
     """
     if (nl): 
         print()
 
     if (abrupt):
         print(f"{F.LIGHTRED_EX}Abruptly shutting down Waffle Hotel's Staycation Booking Records System...")
-        print("Note: All changes will be LOST.", end="\n\n")
+        if (journalled):
+            print("Note: All changes are kept in the journal and will be restored on the next run.", end="\n\n")
+        else:
+            print("Note: All changes will be LOST.", end="\n\n")
     else:
         if (program.title() == "Main"): 
             print(f"\n{F.LIGHTYELLOW_EX}Thank you for using Waffle Hotel's Staycation Booking Records System!")
@@ -417,6 +1296,9 @@ def shutdown(nl:bool=False, program:str="Main", abrupt:bool=False) -> None:
             print(f"\n{F.LIGHTRED_EX}Exiting program...")
 
     S_reset()
+
+    # close the connection to the database file which also checkpoints its write-ahead log
+    DB_CONNECTION.close()
     countdown()
 
 def get_range(userInput) -> list:
@@ -458,6 +1340,16 @@ def format_price(price) -> str:
     """
     return f"${round(float(price), 2):.2f}"
 
+def convert_to_cents(price) -> int:
+    """
+    Convert the price to an integer number of cents (rounded to 2 decimal places first)
+    so that the cost per pax is stored, compared, and saved as an integer instead of a float.
+    
+    Requires one argument:
+    - price (str/int/float)
+    """
+    return round(round(float(price), 2) * 100)
+
 def print_record_data(packageNameInput:str, customerNameInput:str, paxNumInput:int, packageCostPerPaxInput:float) -> str:
     """
     Function to print the record data in a readable format.
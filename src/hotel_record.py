@@ -7,24 +7,35 @@ for the hotel records in the main.py program.
 from colorama import Fore as F
 
 # import standard library
-import re
+import re, sqlite3
+from sys import intern
+from array import array
 from math import ceil
+from functools import wraps
+from threading import RLock
 from typing import Union
+from collections import OrderedDict, Counter
 
 # import local python files
-from functions import get_input, S_reset, format_price, print_record_data, get_descending_flag
+from functions import get_input, S_reset, format_price, convert_to_cents, print_record_data, get_descending_flag
+from field_keys import CUSTOMER_NAME_KEY, PACKAGE_NAME_KEY, PAX_NUM_KEY, COST_IN_CENTS_KEY, total_cost_in_cents_key
 
 # import data structures (import local python files)
 from data_structures.AVLTree import AVLTree
+from data_structures.SortedIndex import SortedIndex
+from data_structures.RadixTrie import RadixTrie
+from data_structures.NGramIndex import NGramIndex
+from data_structures.BloomFilter import BloomFilter
 
 # import sorting algorithms (import local python files)
-from sorting_algorithms.radix_sort import radix_sort
+from sorting_algorithms.bubble_sort import bubble_sort
+from sorting_algorithms.selection_sort import selection_sort
+from sorting_algorithms.insertion_sort import insertion_sort
 from sorting_algorithms.shellsort import shellsort
 from sorting_algorithms.heap_sort import heap_sort
 from sorting_algorithms.intro_sort import intro_sort
-from sorting_algorithms.insertion_sort import insertion_sort
-from sorting_algorithms.selection_sort import selection_sort
-from sorting_algorithms.bubble_sort import bubble_sort
+from sorting_algorithms.radix_sort import radix_sort
+from sorting_algorithms.counting_sort import counting_sort
 
 # import bad sorting algorithms (import local python files)
 from bad_sorting_algorithms.bogo_sort import bogo_sort
@@ -35,11 +46,16 @@ from bad_sorting_algorithms.gnome_sort import gnome_sort
 from bad_sorting_algorithms.pancake_sort import pancake_sort
 
 # import searching algorithms (import local python files)
-from searching_algorithms.binary_search import binary_search_for_name, binary_search_for_range_of_cost
 from searching_algorithms.linear_search import linear_search_for_name
+from searching_algorithms.fuzzy_search import fuzzy_search_for_name, rank_by_edit_distance
 from searching_algorithms.exponential_search import exponential_search_for_customer
+from searching_algorithms.binary_search import binary_search_for_name, binary_search_for_range_of_cost
 from searching_algorithms.fibonacci_search import fibonacci_search_for_package_name
 
+# import sqlite3 queries for the SQL query mode (import local python files)
+from sql_queries import count_records, query_max_values, query_total_revenue, query_names_with_prefix, query_page, query_record, insert_record, \
+                        update_record, delete_record, is_in_memory_db, CUSTOMER_NAME_CONDITION, PACKAGE_NAME_CONDITION, RANGE_OF_COST_CONDITION
+
 # regex for handling user inputs
 NUM_REGEX = re.compile(r"^\d+$")
 COST_REGEX = re.compile(r"^\d+(\.\d+)?$")
@@ -52,6 +68,29 @@ PACKAGE_NAME  = "Package Name"
 PAX_NUM = "Number of Pax"
 COST_PER_PAX = "Package Cost Per Pax"
 
+# the columns in the sqlite3 database file to order the records by in the SQL query mode
+SQL_ORDER_COLUMNS = {
+    NOT_SORTED: "ROWID",
+    CUST_NAME: "customerName",
+    PACKAGE_NAME: "packageName",
+    PAX_NUM: "paxNum",
+    COST_PER_PAX: "costPerPax"
+}
+
+# default rows to print per page, change at own will
+ROWS_PER_PAGE = 10
+
+# the maximum number of pages of records to keep in memory in the SQL query mode
+SQL_PAGE_CACHE_SIZE = 32
+
+# the maximum number of names to suggest in the prefix search and the fuzzy search
+AUTOCOMPLETE_LIMIT = 10
+
+# the default false positive rate of the Bloom filter of the customer names and its minimum capacity
+# (the filter is rebuilt with twice the number of names as its capacity when it is full)
+BLOOM_FILTER_FALSE_POSITIVE_RATE = 0.01
+BLOOM_FILTER_MIN_CAPACITY = 1024
+
 # info on what the various slow sorting algorithms sorts by
 NOOB_SORTS_INFO_DICT = {
     "bogosort": PACKAGE_NAME,
@@ -62,41 +101,34 @@ NOOB_SORTS_INFO_DICT = {
     "gnomesort": PAX_NUM
 }
 
-class RecordData:
+def synchronised(method):
     """
-    Creates a RecordData object with methods to update each of its attributes.
-    
-    Used to hold each Staycation booking records information such as:
-    - package name
-    - customer name
-    - number of pax
-    - package cost per pax
-    These attributes satisfy the basic function a
-    
-    Requires 4 arguments to initialise the object:
-        - packageName: the name of the package
-        - customerName: the name of the customer
-        - paxNum: the number of pax in the package
-        - packageCostPerPax: the package cost per pax of the package
+    Decorator for the HotelDatabase methods that change the records so that the method 
+    is run while holding the database's lock and the background autosave thread 
+    will never see a change that is only partially applied.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class BaseRecord:
+    """
+    The base class of the records (RecordData objects and the ColumnarRecord views in the columnar mode)
+    with the methods that only use the getters and setters of the record, e.g. to update each of its attributes.
     
-    Note that paxNum and packageCostPerPax will be converted to integers and floats respectively.
+    Subclasses must implement the getters and setters of the fields and declare their own __slots__
+    (this class has no attributes so that it does not add any slots to its subclasses).
     """
-    def __init__(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float]) -> None:
-        self.__packageName = packageName.title()
-        self.__customerName = customerName.title()
-        self.__paxNum = int(paxNum)
-        self.__packageCostPerPax = round(float(packageCostPerPax), 2)
+    __slots__ = ()
 
-    def set_package_name(self, packageName:str) -> None:
-        self.__packageName = packageName.title()
-    def get_package_name(self) -> None:
-        return self.__packageName
     def update_package_name(self) -> None:
         while (1):
             print()
-            print(f"Current package name: {self.__packageName}")
+            print(f"Current package name: {self.get_package_name()}")
             newPackageName = input("Enter a new package name (x to cancel): ").strip().lower()
-            if (newPackageName.title() == self.__packageName):
+            if (newPackageName.title() == self.get_package_name()):
                 print(f"{F.LIGHTRED_EX}Package name cannot be the same as the current name!")
                 S_reset()
             elif (newPackageName == ""):
@@ -112,16 +144,12 @@ class RecordData:
                     S_reset()
                     return
 
-    def set_customer_name(self, customerName:str) -> None:
-        self.__customerName = customerName.title()
-    def get_customer_name(self) -> None:
-        return self.__customerName
     def update_customer_name(self) -> None:
         while (1):
             print()
-            print(f"Current customer name: {self.__customerName}")
+            print(f"Current customer name: {self.get_customer_name()}")
             newCustomerName = input("Enter a new customer name (x to cancel): ").strip().lower()
-            if (newCustomerName.title() == self.__customerName):
+            if (newCustomerName.title() == self.get_customer_name()):
                 print(f"{F.LIGHTRED_EX}Customer name cannot be the same as the current name!")
                 S_reset()
             elif (newCustomerName == ""):
@@ -137,14 +165,10 @@ class RecordData:
                     S_reset()
                     return
 
-    def set_pax_num(self, paxNum:Union[int, str]) -> None:
-        self.__paxNum = int(paxNum)
-    def get_pax_num(self) -> None:
-        return self.__paxNum
     def update_pax_num(self) -> None:
         while (1):
             print()
-            print(f"Current number of pax: {self.__paxNum}")
+            print(f"Current number of pax: {self.get_pax_num()}")
             newPaxNum = input("Enter a new number of pax (x to cancel): ").strip().lower()
             if (newPaxNum == ""):
                 print(f"{F.LIGHTRED_EX}Number of pax cannot be empty!")
@@ -154,7 +178,7 @@ class RecordData:
             elif (not re.fullmatch(NUM_REGEX, newPaxNum) or int(newPaxNum) < 1):
                 print(f"{F.LIGHTRED_EX}Invalid input, please enter a valid pax number of pax more than 0...")
                 S_reset()
-            elif (int(newPaxNum) != self.__paxNum):
+            elif (int(newPaxNum) != self.get_pax_num()):
                 confirmInput = get_input(prompt=f"Are you sure you want to change the number of pax to \"{newPaxNum}\"? (Y/N): ", command=("y", "n"))
                 if (confirmInput == "y"):
                     self.set_pax_num(newPaxNum)
@@ -165,105 +189,1068 @@ class RecordData:
                 print(f"{F.LIGHTRED_EX}Number of pax cannot be the same as the current number of pax!")
                 S_reset()
 
-    def set_cost_per_pax(self, packageCostPerPax:Union[str, int, float]) -> None:
-        self.__packageCostPerPax = round(float(packageCostPerPax), 2)
-    def get_cost_per_pax(self) -> None:
-        return self.__packageCostPerPax
-    def update_cost_per_pax(self) -> None:
-        while (1):
-            print()
-            print(f"Current package cost per pax: {format_price(self.__packageCostPerPax)}")
-            newPackageCostPerPax = input("Enter a new package cost per pax (x to cancel): $").strip().lower()
-            if (newPackageCostPerPax == ""):
-                print(f"{F.LIGHTRED_EX}Package cost per pax cannot be empty!")
-                S_reset()
-            elif (newPackageCostPerPax == "x"):
-                return -1
-            elif (not re.fullmatch(COST_REGEX, newPackageCostPerPax)):
-                print(f"{F.LIGHTRED_EX}Package cost per pax must be a valid price!")
-                S_reset()
-            elif (round(float(newPackageCostPerPax), 2) != self.__packageCostPerPax):
-                confirmInput = get_input(prompt=f"Are you sure you want to change the package cost per pax to \"{format_price(newPackageCostPerPax)}\"? (Y/N): ", command=("y", "n"))
-                if (confirmInput == "y"):
-                    self.set_cost_per_pax(newPackageCostPerPax)
-                    print(f"{F.LIGHTGREEN_EX}Package cost per pax updated!")
-                    S_reset()
-                    return
-            else:
-                print(f"{F.LIGHTRED_EX}Package cost per pax cannot be the same as the current package cost per pax!")
-                S_reset()
+    def set_cost_per_pax(self, packageCostPerPax:Union[str, int, float]) -> None:
+        self.set_cost_in_cents(convert_to_cents(packageCostPerPax))
+    def get_cost_per_pax(self) -> float:
+        return self.get_cost_in_cents() / 100
+    def update_cost_per_pax(self) -> None:
+        while (1):
+            print()
+            print(f"Current package cost per pax: {format_price(self.get_cost_per_pax())}")
+            newPackageCostPerPax = input("Enter a new package cost per pax (x to cancel): $").strip().lower()
+            if (newPackageCostPerPax == ""):
+                print(f"{F.LIGHTRED_EX}Package cost per pax cannot be empty!")
+                S_reset()
+            elif (newPackageCostPerPax == "x"):
+                return -1
+            elif (not re.fullmatch(COST_REGEX, newPackageCostPerPax)):
+                print(f"{F.LIGHTRED_EX}Package cost per pax must be a valid price!")
+                S_reset()
+            elif (convert_to_cents(newPackageCostPerPax) != self.get_cost_in_cents()):
+                confirmInput = get_input(prompt=f"Are you sure you want to change the package cost per pax to \"{format_price(newPackageCostPerPax)}\"? (Y/N): ", command=("y", "n"))
+                if (confirmInput == "y"):
+                    self.set_cost_per_pax(newPackageCostPerPax)
+                    print(f"{F.LIGHTGREEN_EX}Package cost per pax updated!")
+                    S_reset()
+                    return
+            else:
+                print(f"{F.LIGHTRED_EX}Package cost per pax cannot be the same as the current package cost per pax!")
+                S_reset()
+
+    def __repr__(self) -> str:
+        return "(" + f"{self.get_package_name()}, " + f"{self.get_customer_name()}, " + f"{self.get_pax_num()} pax, " + format_price(self.get_cost_per_pax()) + ")"
+
+    def __str__(self) -> str:
+        return print_record_data(self.get_package_name(), self.get_customer_name(), self.get_pax_num(), self.get_cost_per_pax())
+
+class RecordData(BaseRecord):
+    """
+    Creates a RecordData object with methods to update each of its attributes.
+    
+    Used to hold each Staycation booking records information such as:
+    - package name
+    - customer name
+    - number of pax
+    - package cost per pax
+    These attributes satisfy the basic function a
+    
+    Requires 4 arguments to initialise the object:
+        - packageName: the name of the package
+        - customerName: the name of the customer
+        - paxNum: the number of pax in the package
+        - packageCostPerPax: the package cost per pax of the package
+    
+    Optional argument:
+        - rowId: the ROWID of the record in the sqlite3 database file (defaults to None if it has not been saved yet)
+    
+    The record ID is a stable integer ID assigned by the HotelDatabase when the record is added or loaded
+    (None until then) that does not change when the records are sorted, unlike the index of the record in the array.
+    
+    Note that paxNum will be converted to an integer and packageCostPerPax will be stored as
+    an integer number of cents (use get_cost_per_pax() for the price in dollars).
+    
+    The attributes are stored in __slots__ instead of a per-instance __dict__ and the names are interned
+    since a RecordData object is created for every record (see benchmark_memory.py for the memory used per record).
+    """
+    __slots__ = ("__packageName", "__customerName", "__paxNum", "__costInCents", "__rowId", "__recordId")
+
+    def __init__(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float], rowId:int=None) -> None:
+        # the names are interned so that records with the same name share one string 
+        # instead of each record keeping the new string returned by title()
+        self.__packageName = intern(packageName.title())
+        self.__customerName = intern(customerName.title())
+        self.__paxNum = int(paxNum)
+        self.__costInCents = convert_to_cents(packageCostPerPax)
+        self.__rowId = rowId
+        self.__recordId = None
+
+    @classmethod
+    def from_row(cls, packageName:str, customerName:str, paxNum:int, costInCents:int, rowId:int=None) -> "RecordData":
+        """
+        Creates a RecordData object from a row where the cost per pax is already in cents,
+        e.g. a row read from the sqlite3 database file, without converting the cost to a float and back.
+        
+        Requires 4 arguments:
+        - packageName (str)
+        - customerName (str)
+        - paxNum (int)
+        - costInCents (int)
+        
+        Optional argument:
+        - rowId (int): defaults to None if the record has not been saved yet
+        """
+        record = cls.__new__(cls)
+        record.__packageName = intern(packageName.title())
+        record.__customerName = intern(customerName.title())
+        record.__paxNum = int(paxNum)
+        record.__costInCents = int(costInCents)
+        record.__rowId = rowId
+        record.__recordId = None
+        return record
+
+    def set_row_id(self, rowId:int) -> None:
+        self.__rowId = rowId
+    def get_row_id(self) -> Union[int, None]:
+        return self.__rowId
+
+    def set_record_id(self, recordId:int) -> None:
+        self.__recordId = recordId
+    def get_record_id(self) -> Union[int, None]:
+        return self.__recordId
+
+    def set_package_name(self, packageName:str) -> None:
+        self.__packageName = intern(packageName.title())
+    def get_package_name(self) -> None:
+        return self.__packageName
+    def set_customer_name(self, customerName:str) -> None:
+        self.__customerName = intern(customerName.title())
+    def get_customer_name(self) -> None:
+        return self.__customerName
+    def set_pax_num(self, paxNum:Union[int, str]) -> None:
+        self.__paxNum = int(paxNum)
+    def get_pax_num(self) -> None:
+        return self.__paxNum
+    def set_cost_in_cents(self, costInCents:int) -> None:
+        self.__costInCents = costInCents
+    def get_cost_in_cents(self) -> int:
+        return self.__costInCents
+
+class SQLRecordPages:
+    """
+    Creates a read-only array-like object of the records in the sqlite3 database that matches the condition
+    where only the pages of records that are accessed will be loaded as RecordData objects.
+    
+    Used in the SQL query mode so that the records can be displayed with the print_from_array method
+    without loading all the records into memory.
+    
+    The pages are loaded with keyset pagination when the previous or next page is in the cache
+    and the least recently used page will be removed from the cache when the cache is full.
+    
+    Requires 3 arguments:
+    - con (sqlite3.Connection)
+    - orderColumn (str): the column to order the records by, e.g. "customerName" or "ROWID"
+    - descendingOrder (bool): True if the records are to be ordered in descending order
+    
+    Optional arguments:
+    - where (str): the SQL condition that the records must match, defaults to None for all records
+    - params (tuple): the parameters for the condition, defaults to an empty tuple
+    - pageSize (int): the number of records in a page, defaults to ROWS_PER_PAGE
+    - cacheSize (int): the maximum number of pages in the cache, defaults to SQL_PAGE_CACHE_SIZE
+    
+    Note: A new object should be created whenever the records are changed as the cached pages will be outdated.
+    """
+    def __init__(self, con:sqlite3.Connection, orderColumn:str, descendingOrder:bool, where:str=None, params:tuple=(), \
+                 pageSize:int=ROWS_PER_PAGE, cacheSize:int=SQL_PAGE_CACHE_SIZE) -> None:
+        self.__con = con
+        self.__order_column = orderColumn
+        self.__descending_order = descendingOrder
+        self.__where = where
+        self.__params = params
+        self.__page_size = pageSize
+        self.__cache_size = cacheSize
+        self.__len = count_records(con, where, params)
+
+        # page number -> (array of RecordData objects, key of the first record, key of the last record)
+        # where the key is a tuple of (orderColumn value, rowId)
+        self.__pages = OrderedDict()
+
+    def get_max_values(self) -> tuple:
+        """
+        Returns the length of the longest customer name and package name, the largest cost per pax,
+        and the largest number of pax of the records in a tuple
+        """
+        return query_max_values(self.__con, self.__where, self.__params)
+
+    def __get_page(self, pageNum:int) -> list:
+        """
+        Returns the page of RecordData objects from the cache or from the sqlite3 database
+        
+        Requires 1 argument:
+        - pageNum (int): the page number starting from 0
+        """
+        if (pageNum in self.__pages):
+            self.__pages.move_to_end(pageNum) # mark as the most recently used page
+            return self.__pages[pageNum][0]
+
+        queryArgs = (self.__con, self.__order_column, self.__descending_order, self.__page_size, self.__where, self.__params)
+        lastPageNum = (self.__len - 1) // self.__page_size
+        if (pageNum - 1 in self.__pages):
+            # seek to the records after the last record of the previous page
+            rows = query_page(*queryArgs, afterKey=self.__pages[pageNum - 1][2])
+        elif (pageNum + 1 in self.__pages):
+            # seek to the records before the first record of the next page
+            rows = query_page(*queryArgs, beforeKey=self.__pages[pageNum + 1][1])
+        elif (pageNum == lastPageNum and pageNum != 0):
+            # the last page may have less records than the page size
+            rows = query_page(self.__con, self.__order_column, self.__descending_order, \
+                              self.__len - (pageNum * self.__page_size), self.__where, self.__params, fromEnd=True)
+        else:
+            rows = query_page(*queryArgs, offset=pageNum * self.__page_size)
+
+        # the last two columns of each row are the rowId and the orderColumn value
+        page = [RecordData.from_row(*row[:5]) for row in rows]
+        for record in page:
+            # the ROWID is the stable record ID in the SQL query mode
+            record.set_record_id(record.get_row_id())
+        self.__pages[pageNum] = (page, (rows[0][5], rows[0][4]), (rows[-1][5], rows[-1][4]))
+        if (len(self.__pages) > self.__cache_size):
+            self.__pages.popitem(last=False) # remove the least recently used page
+        return page
+
+    def __getitem__(self, index:int) -> RecordData:
+        if (index < 0):
+            index += self.__len
+
+        if (index < 0 or index >= self.__len):
+            raise IndexError("SQLRecordPages index out of range")
+
+        return self.__get_page(index // self.__page_size)[index % self.__page_size]
+
+    def __len__(self) -> int:
+        return self.__len
+
+class CostRangePages:
+    """
+    Creates a read-only array-like object of the records with a cost per pax in a range (in ascending order of their cost)
+    where only the pages of records that are accessed will be collected from the sorted index of the package costs.
+    
+    Used so that the records in a range of cost can be displayed with the print_from_array method
+    without walking all the matching records first since the records in the range are at consecutive positions
+    of the sorted index of the package costs and each page is collected from its first position in O(log m + page size).
+    
+    Requires 3 arguments:
+    - costIndex (SortedIndex): the sorted index of the package costs in cents
+    - start (int): the position of the first record in the range
+    - stop (int): the position after the last record in the range
+    
+    Optional arguments:
+    - pageSize (int): the number of records in a page, defaults to ROWS_PER_PAGE
+    - cacheSize (int): the maximum number of pages in the cache, defaults to SQL_PAGE_CACHE_SIZE
+    
+    Note: A new object should be created whenever the records are changed as the cached pages will be outdated.
+    """
+    def __init__(self, costIndex:SortedIndex, start:int, stop:int, pageSize:int=ROWS_PER_PAGE, cacheSize:int=SQL_PAGE_CACHE_SIZE) -> None:
+        self.__cost_index = costIndex
+        self.__start_pos = start
+        self.__len = max(0, stop - start)
+        self.__page_size = pageSize
+        self.__cache_size = cacheSize
+
+        # page number -> array of RecordData objects
+        self.__pages = OrderedDict()
+
+    def __get_page(self, pageNum:int) -> list:
+        """
+        Returns the page of RecordData objects from the cache or from the sorted index of the package costs
+        
+        Requires 1 argument:
+        - pageNum (int): the page number starting from 0
+        """
+        if (pageNum in self.__pages):
+            self.__pages.move_to_end(pageNum) # mark as the most recently used page
+            return self.__pages[pageNum]
+
+        pos = self.__start_pos + pageNum * self.__page_size
+        endPos = self.__start_pos + min((pageNum + 1) * self.__page_size, self.__len)
+        page = self.__cost_index.get_records(pos, endPos)
+
+        self.__pages[pageNum] = page
+        if (len(self.__pages) > self.__cache_size):
+            self.__pages.popitem(last=False) # remove the least recently used page
+        return page
+
+    def __getitem__(self, index:int) -> RecordData:
+        if (index < 0):
+            index += self.__len
+
+        if (index < 0 or index >= self.__len):
+            raise IndexError("CostRangePages index out of range")
+
+        return self.__get_page(index // self.__page_size)[index % self.__page_size]
+
+    def __len__(self) -> int:
+        return self.__len
+
+class ColumnarRecord(BaseRecord):
+    """
+    Creates a ColumnarRecord object which is a view of a record in the ColumnarRecords object's columns.
+    
+    The view has the same methods as a RecordData object, but the getters read from and the setters 
+    write to the columns directly. Hence, the views are only created when a record is accessed 
+    (e.g. displayed or edited) and can be discarded afterwards.
+    
+    Two views of the same record are equal (and have the same hash) so that they can be used 
+    as the keys of the HotelDatabase's unsaved changes.
+    
+    Requires 2 arguments:
+    - records (ColumnarRecords): the columns that the record is stored in
+    - slot (int): the index of the record in the columns
+    """
+    __slots__ = ("__records", "__slot")
+
+    def __init__(self, records:"ColumnarRecords", slot:int) -> None:
+        self.__records = records
+        self.__slot = slot
+
+    def get_slot(self) -> int:
+        return self.__slot
+
+    def get_record_id(self) -> int:
+        # the slot of the record is already stable as the columns are never reordered
+        return self.__slot
+
+    def set_row_id(self, rowId:int) -> None:
+        self.__records.set_value(self.__slot, "rowId", rowId)
+    def get_row_id(self) -> Union[int, None]:
+        return self.__records.get_value(self.__slot, "rowId")
+
+    def set_package_name(self, packageName:str) -> None:
+        self.__records.set_value(self.__slot, "packageName", packageName.title())
+    def get_package_name(self) -> str:
+        return self.__records.get_value(self.__slot, "packageName")
+
+    def set_customer_name(self, customerName:str) -> None:
+        self.__records.set_value(self.__slot, "customerName", customerName.title())
+    def get_customer_name(self) -> str:
+        return self.__records.get_value(self.__slot, "customerName")
+
+    def set_pax_num(self, paxNum:Union[int, str]) -> None:
+        self.__records.set_value(self.__slot, "paxNum", int(paxNum))
+    def get_pax_num(self) -> int:
+        return self.__records.get_value(self.__slot, "paxNum")
+
+    def set_cost_in_cents(self, costInCents:int) -> None:
+        self.__records.set_value(self.__slot, "costPerPax", costInCents)
+    def get_cost_in_cents(self) -> int:
+        return self.__records.get_value(self.__slot, "costPerPax")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ColumnarRecord) and self.__slot == other.get_slot()
+
+    def __hash__(self) -> int:
+        return hash(self.__slot)
+
+class ColumnarRecords:
+    """
+    Creates an array-like ColumnarRecords object that stores the records as columns (a struct of arrays)
+    instead of an array of RecordData objects.
+    
+    Used in the columnar mode so that each record only takes a few bytes in packed arrays:
+    - the number of pax and the cost per pax (in cents) are stored as arrays of integers
+    - the package names and customer names are dictionary-encoded, i.e. each unique name is stored once
+      in a string table and each record only stores the integer code of its name
+    - the codes are mapped to their rank in the sorted string table (order-preserving codes)
+      so that the records are sorted by name with a counting sort on the ranks
+    - the ROWID is stored as an array of integers where 0 means that the record has not been saved yet
+    
+    Each record is stored at an index (slot) of the columns and the order of the records is an array of the slots.
+    Hence, sorting and searching are done on the packed columns and only the array of slots is reordered.
+    Accessing a record by its index returns a ColumnarRecord view of its slot.
+    
+    Note: The slots of the deleted records are not reused so that a view of a deleted record 
+    will never refer to another record. Their columns are freed when the records are loaded again.
+    A deleted slot is only marked as deleted and left in the array of slots as a tombstone until 
+    the array is next accessed (lazy compaction like the HotelDatabase's array of records).
+    """
+    def __init__(self) -> None:
+        self.__package_names = []
+        self.__package_codes = {}
+        self.__customer_names = []
+        self.__customer_codes = {}
+
+        # the rank of each code in the sorted string table of the field,
+        # None if a new name was added since the ranks were last built
+        self.__name_ranks = {"packageName": None, "customerName": None}
+
+        self.__columns = {
+            "packageName": array("I"),
+            "customerName": array("I"),
+            "paxNum": array("I"),
+            "costPerPax": array("q"),
+            "rowId": array("q")
+        }
+
+        # the slots of the records in their current order, 
+        # use self.__order instead which removes the tombstones of the deleted slots first
+        self.__slot_order = array("I")
+
+        # 1 at the index of each deleted slot
+        self.__deleted = bytearray()
+        self.__num_of_tombstones = 0
+
+    def __get_order(self) -> array:
+        """
+        Returns the array of slots after removing the tombstones of the deleted slots (if any)
+        in O(n) time which is amortised over the deletions since the last compaction
+        """
+        if (self.__num_of_tombstones > 0):
+            deleted = self.__deleted
+            self.__slot_order = array("I", [slot for slot in self.__slot_order if (not deleted[slot])])
+            self.__num_of_tombstones = 0
+        return self.__slot_order
+
+    def __set_order(self, slots:array) -> None:
+        self.__slot_order = slots
+
+    __order = property(__get_order, __set_order)
+
+    def __encode(self, field:str, name:str) -> int:
+        """
+        Returns the code of the name in the string table of the field (which will be added if it is a new name)
+        
+        Requires 2 arguments:
+        - field (str): "packageName" or "customerName"
+        - name (str): the title-cased name
+        """
+        names, codes = (self.__package_names, self.__package_codes) if (field == "packageName") \
+                       else (self.__customer_names, self.__customer_codes)
+        code = codes.get(name)
+        if (code is None):
+            code = codes[intern(name)] = len(names)
+            names.append(name)
+            # the new name may be ranked before the existing names, hence the ranks are rebuilt when they are next used
+            self.__name_ranks[field] = None
+        return code
+
+    def __get_name_ranks(self, field:str) -> array:
+        """
+        Returns the rank of each code in the sorted string table of the field
+        
+        The ranks are only rebuilt in O(k log k) time after new names were added instead of 
+        renumbering the codes of every record whenever a new name is ranked before the existing names.
+        
+        Requires 1 argument:
+        - field (str): "packageName" or "customerName"
+        """
+        ranks = self.__name_ranks[field]
+        if (ranks is None):
+            names = self.__package_names if (field == "packageName") else self.__customer_names
+            ranks = array("I", bytes(4 * len(names)))
+            for rank, code in enumerate(sorted(range(len(names)), key=names.__getitem__)):
+                ranks[code] = rank
+            self.__name_ranks[field] = ranks
+        return ranks
+
+    def get_value(self, slot:int, field:str) -> Union[str, int, float, None]:
+        """
+        Returns the value of the field of the record at the slot
+        
+        Requires 2 arguments:
+        - slot (int)
+        - field (str): "packageName", "customerName", "paxNum", "costPerPax", or "rowId"
+        """
+        value = self.__columns[field][slot]
+        if (field == "packageName"):
+            return self.__package_names[value]
+        elif (field == "customerName"):
+            return self.__customer_names[value]
+        elif (field == "rowId"):
+            return value or None
+        return value
+
+    def set_value(self, slot:int, field:str, value:Union[str, int, float, None]) -> None:
+        """
+        Set the value of the field of the record at the slot
+        
+        Requires 3 arguments:
+        - slot (int)
+        - field (str): "packageName", "customerName", "paxNum", "costPerPax", or "rowId"
+        - value: the title-cased name, the number of pax, the cost per pax in cents, or the ROWID (None if not saved)
+        """
+        if (field == "packageName" or field == "customerName"):
+            value = self.__encode(field, value)
+        elif (field == "rowId"):
+            value = value or 0
+        self.__columns[field][slot] = value
+
+    def append(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float], \
+               rowId:int=None) -> ColumnarRecord:
+        """
+        Add a record to the back of the records
+        
+        Requires 4 arguments in the same order as the HotelDatabase's add_record arguments:
+        - packageName (str)
+        - customerName (str)
+        - paxNum (int/str)
+        - packageCostPerPax (int/float/str)
+        
+        Optional argument:
+        - rowId (int): defaults to None if the record has not been saved yet
+        
+        Returns the ColumnarRecord view of the new record.
+        """
+        columns = self.__columns
+        slot = len(columns["rowId"])
+        columns["packageName"].append(self.__encode("packageName", packageName.title()))
+        columns["customerName"].append(self.__encode("customerName", customerName.title()))
+        columns["paxNum"].append(int(paxNum))
+        columns["costPerPax"].append(convert_to_cents(packageCostPerPax))
+        columns["rowId"].append(rowId or 0)
+        self.__deleted.append(0)
+        self.__order.append(slot)
+        return ColumnarRecord(self, slot)
+
+    def extend(self, rows) -> tuple:
+        """
+        Add the rows to the back of the records
+        
+        Requires 1 argument:
+        - rows (iterable): tuples in the same order as the HotelDatabase's bulk_load rows,
+                           (packageName, customerName, paxNum, costInCents, rowId)
+        
+        Returns the number of records added and the array of the ColumnarRecord views 
+        of the new records that have not been saved yet (no ROWID) in a tuple.
+        """
+        columns = self.__columns
+        packageCodes, customerCodes, paxNums, costs, rowIds = columns["packageName"], columns["customerName"], \
+                                                              columns["paxNum"], columns["costPerPax"], columns["rowId"]
+        firstSlot = len(rowIds)
+        unsavedRecords = []
+        for packageName, customerName, paxNum, costInCents, rowId in rows:
+            if (rowId is None):
+                unsavedRecords.append(ColumnarRecord(self, len(rowIds)))
+            packageCodes.append(self.__encode("packageName", packageName.title()))
+            customerCodes.append(self.__encode("customerName", customerName.title()))
+            paxNums.append(int(paxNum))
+            costs.append(int(costInCents))
+            rowIds.append(rowId or 0)
+
+        self.__deleted.extend(bytes(len(rowIds) - firstSlot))
+        self.__order.extend(range(firstSlot, len(rowIds)))
+        return len(rowIds) - firstSlot, unsavedRecords
+
+    def sort(self, sortOrder:str, reverse:bool=False) -> None:
+        """
+        Sort the records by only reordering the array of slots based on the packed columns (stable)
+        
+        The records are sorted by name with a counting sort on the ranks of their name codes in O(n + k) time
+        instead of comparing the name strings, where k is the number of unique names.
+        
+        Requires 1 argument:
+        - sortOrder (str): CUST_NAME, PACKAGE_NAME, PAX_NUM, or COST_PER_PAX
+        
+        Optional argument:
+        - reverse (bool): True to sort in descending order, defaults to False
+        """
+        if (sortOrder == PAX_NUM or sortOrder == COST_PER_PAX):
+            sortKeys = self.__columns["paxNum"] if (sortOrder == PAX_NUM) else self.__columns["costPerPax"]
+            self.__order = array("I", sorted(self.__order, key=sortKeys.__getitem__, reverse=reverse))
+            return
+
+        field = "customerName" if (sortOrder == CUST_NAME) else "packageName"
+        ranks, codes = self.__get_name_ranks(field), self.__columns[field]
+        slots = self.__order.tolist()
+        counting_sort(slots, len(ranks), key=lambda slot: ranks[codes[slot]], reverse=reverse)
+        self.__order = array("I", slots)
+
+    def search_for_name(self, field:str, name:str) -> list:
+        """
+        Returns the ColumnarRecord views of the records with the name in their current order
+        
+        Requires 2 arguments:
+        - field (str): "packageName" or "customerName"
+        - name (str): the title-cased name
+        """
+        code = (self.__package_codes if (field == "packageName") else self.__customer_codes).get(name)
+        if (code is None):
+            return []
+
+        codes = self.__columns[field]
+        return [ColumnarRecord(self, slot) for slot in self.__order if (codes[slot] == code)]
+
+    def get_names_with_prefix(self, field:str, prefix:str, limit:int=None) -> list:
+        """
+        Returns the names of the records that start with the prefix (case-insensitive) in ascending order
+        
+        Requires 2 arguments:
+        - field (str): "packageName" or "customerName"
+        - prefix (str)
+        
+        Optional argument:
+        - limit (int): the maximum number of names to return, defaults to None for all the names
+        """
+        names = self.__package_names if (field == "packageName") else self.__customer_names
+        codes = self.__columns[field]
+
+        # the string table also has the names of the deleted records, hence only the codes in use are checked
+        prefix = prefix.lower()
+        matchedNames = sorted((names[code] for code in set(map(codes.__getitem__, self.__order)) \
+                               if (names[code].lower().startswith(prefix))), key=str.lower)
+        return matchedNames[:limit] if (limit is not None) else matchedNames
+
+    def search_for_range_of_cost(self, lowInCents:int, highInCents:int) -> list:
+        """
+        Returns the ColumnarRecord views of the records with a cost per pax between low and high (inclusive)
+        in ascending order of their cost per pax
+        
+        Requires 2 arguments:
+        - lowInCents (int)
+        - highInCents (int)
+        """
+        costs = self.__columns["costPerPax"]
+        slots = sorted((slot for slot in self.__order if (lowInCents <= costs[slot] <= highInCents)), key=costs.__getitem__)
+        return [ColumnarRecord(self, slot) for slot in slots]
+
+    def get_max_values(self) -> tuple:
+        """
+        Returns the length of the longest customer name and package name, the largest cost per pax,
+        and the largest number of pax of the records in a tuple (or zeros if there are no records)
+        """
+        if (not self.__order):
+            return 0, 0, 0, 0
+
+        columns = self.__columns
+        return max(map(len, self.__customer_names)), max(map(len, self.__package_names)), \
+               max(map(columns["costPerPax"].__getitem__, self.__order)) / 100, max(map(columns["paxNum"].__getitem__, self.__order))
+
+    def get_record(self, slot:int) -> Union[ColumnarRecord, None]:
+        """
+        Returns the ColumnarRecord view of the record at the slot or None if the record was deleted
+        
+        Requires 1 argument:
+        - slot (int)
+        """
+        if (0 <= slot < len(self.__deleted) and not self.__deleted[slot]):
+            return ColumnarRecord(self, slot)
+        return None
+
+    def remove(self, record:ColumnarRecord) -> None:
+        """
+        Remove the record from the records
+        
+        Time complexity: O(1) amortised as the slot is only marked as deleted
+        and its tombstone is removed in the next compaction (see __get_order)
+        
+        Requires 1 argument:
+        - record (ColumnarRecord)
+        """
+        slot = record.get_slot()
+        if (self.__deleted[slot]):
+            raise ValueError("ColumnarRecords.remove(record): record not in records")
+        self.__deleted[slot] = 1
+        self.__num_of_tombstones += 1
+
+    def pop(self, index:int=-1) -> ColumnarRecord:
+        """
+        Remove the record at the index from the records and return its view
+        
+        Optional argument:
+        - index (int): defaults to -1 for the last record
+        """
+        slot = self.__order.pop(index)
+        self.__deleted[slot] = 1
+        return ColumnarRecord(self, slot)
+
+    def __getitem__(self, index:Union[int, slice]) -> Union[ColumnarRecord, list]:
+        if (isinstance(index, slice)):
+            return [ColumnarRecord(self, slot) for slot in self.__order[index]]
+        return ColumnarRecord(self, self.__order[index])
+
+    def __setitem__(self, index:int, record:ColumnarRecord) -> None:
+        # only the slot is moved so that swapping two records (e.g. in a sorting algorithm) works like a list
+        self.__order[index] = record.get_slot()
+
+    def __iter__(self):
+        return (ColumnarRecord(self, slot) for slot in self.__order)
+
+    def __len__(self) -> int:
+        return len(self.__slot_order) - self.__num_of_tombstones
+
+class HotelDatabase:
+    """
+    Will create a HotelDatabase object responsible for storing and managing all hotel records.
+    
+    Upon initialisation, this object will create an empty array which would hold all hotel records
+    of RecordData objects.
+    
+    Optional argument:
+    - sqlCon (sqlite3.Connection): If defined, the object will be in the SQL query mode where the records
+                                   are not loaded into memory. Instead, the records stay in the database and 
+                                   only the page of records being displayed will be loaded. Searches will be done 
+                                   as indexed SQL queries and sorting will only change the ORDER BY clause.
+                                   Any changes to the records will also be written directly to the database.
+                                   Defaults to None.
+                                   (If it is an in-memory database, see read_db_file() in functions.py, 
+                                   the changes are only written to the database file when it is saved.)
+    - columnar (bool): If True, the object will be in the columnar mode where the records are stored in
+                       packed columns (see ColumnarRecords) instead of an array of RecordData objects.
+                       Sorting and searching will be done on the columns and the AVL tree is not used.
+                       Defaults to False.
+    """
+    def __init__(self, sqlCon:sqlite3.Connection=None, columnar:bool=False):
+        # Array of RecordData objects (or the columns of the records in the columnar mode),
+        # use self.__db instead which removes the tombstones of the deleted records first
+        self.__records = ColumnarRecords() if (columnar) else []
+        self.__columnar = columnar
+
+        # the stable record IDs to the RecordData objects (not used in the columnar mode)
+        # so that a record can be found and deleted in O(1) time regardless of its index in the array.
+        # A deleted record is only removed from this index and is left in the array as a tombstone
+        # until the array is next accessed through self.__db (lazy compaction)
+        self.__record_index = {}
+        self.__next_record_id = 0
+        self.__num_of_tombstones = 0
+
+        # sqlite3 connection for the SQL query mode (None if not in the SQL query mode)
+        self.__sql_con = sqlCon
+
+        # the number of records and the pages of all records in the current sort order 
+        # for the SQL query mode (only loaded when required)
+        self.__sql_len = None
+        self.__sql_pages = None
+
+        # create an AVL tree based on customer names as the keys
+        self.__bst_root = AVLTree() 
+
+        # the sorted secondary indexes of the other fields which are updated on every add, edit, and delete
+        # like the AVL tree of the customer names so that sorting by a field is an O(n) walk of its index
+        # and searching is O(log n + k) without re-sorting the array (not used in the columnar mode).
+        # The indexes only store the record IDs in packed arrays (8 bytes per record) and look up the records 
+        # from the record index instead of keeping a node for every record like the AVL tree
+        self.__package_index = SortedIndex(PACKAGE_NAME_KEY, self.__record_index.__getitem__)
+        # The index of the package costs also sums the total cost of the bookings (the cost per pax multiplied by the 
+        # number of pax) so that the number of bookings in a range of cost and their total revenue are found in O(log m + b)
+        # without walking the records (see SortedIndex)
+        self.__cost_index = SortedIndex(COST_IN_CENTS_KEY, self.__record_index.__getitem__, weight=total_cost_in_cents_key)
+        self.__pax_index = SortedIndex(PAX_NUM_KEY, self.__record_index.__getitem__)
+
+        # the radix trie of the customer names that is kept in step with the AVL tree of the customer names
+        # for the prefix search and autocomplete suggestions (not used in the columnar mode)
+        self.__customer_name_trie = RadixTrie()
+
+        # the n-gram indexes of the customer names and package names for the fuzzy search 
+        # of misspelt names without comparing with every name (not used in the columnar mode)
+        self.__customer_name_ngrams = NGramIndex()
+        self.__package_name_ngrams = NGramIndex()
+
+        # the optional Bloom filter of the customer names to skip the search for a customer name
+        # that no record has (None if it is not enabled, see enable_customer_bloom_filter())
+        self.__customer_bloom_filter = None
+
+        # boolean to determine whether to sort the records in descending order
+        self.__descending_order = False 
+
+        # to determine the current sort order
+        self.__sort_order = NOT_SORTED 
+
+        # table headers
+        self.__table_headers = [CUST_NAME, PACKAGE_NAME, COST_PER_PAX, PAX_NUM] 
+        
+        # table lengths for padding
+        self.__table_len = [len(self.__table_headers[0]), len(self.__table_headers[1]), \
+                            len(self.__table_headers[2]), len(self.__table_headers[3])] 
+
+        # to track the changes made since the database was last saved
+        # so that only the changed records have to be written to the sqlite3 database file.
+        # Dictionaries are used as ordered sets of RecordData objects (values are unused)
+        self.__added_records = {}
+        self.__edited_records = {}
+        self.__deleted_row_ids = []
+
+        # the append-only journal of the changes (None if the changes are not journalled)
+        self.__journal = None
+
+        # the records in ascending order of each sort key (e.g. PAX_NUM) which are reused
+        # to sort the records in O(n) until a record is added, edited, or deleted
+        self.__sorted_views = {}
+
+        # reentrant lock held while the records are being changed so that the background 
+        # autosave thread can take a consistent snapshot of the changes
+        self.__lock = RLock()
+
+    def __get_db(self) -> Union[list, "ColumnarRecords"]:
+        """
+        Returns the array of records after removing the tombstones of the deleted records (if any)
+        
+        Removing all the tombstones at once only takes O(n) time which is amortised over the 
+        deletions since the last compaction, instead of O(n) time for every deletion.
+        """
+        if (self.__num_of_tombstones > 0):
+            with self.__lock:
+                recordIndex = self.__record_index
+                self.__records = [record for record in self.__records if (record.get_record_id() in recordIndex)]
+                self.__num_of_tombstones = 0
+        return self.__records
+
+    def __set_db(self, records:Union[list, "ColumnarRecords"]) -> None:
+        self.__records = records
+
+    __db = property(__get_db, __set_db)
+
+    def __index_record(self, record:RecordData) -> None:
+        """
+        Give the record a new stable record ID and add it to the record index
+        
+        Requires 1 argument:
+        - record (RecordData)
+        """
+        record.set_record_id(self.__next_record_id)
+        self.__record_index[self.__next_record_id] = record
+        self.__next_record_id += 1
+
+    def __get_trees(self) -> tuple:
+        """
+        Returns the AVL tree of the customer names and the sorted indexes of the other fields in a tuple
+        """
+        return self.__bst_root, self.__package_index, self.__cost_index, self.__pax_index
+
+    def __unindex_record(self, record:RecordData) -> None:
+        """
+        Remove the record from the record index and the sorted indexes (when it is deleted)
+        
+        Requires 1 argument:
+        - record (RecordData)
+        """
+        del self.__record_index[record.get_record_id()]
+        for tree in self.__get_trees():
+            tree.delete(record)
+        self.__customer_name_trie.remove(record.get_customer_name())
+        self.__customer_name_ngrams.remove(record.get_customer_name())
+        self.__package_name_ngrams.remove(record.get_package_name())
+
+    def __get_distinct_customer_names(self) -> list:
+        """
+        Returns the distinct customer names of the records
+        """
+        if (self.__sql_con is not None):
+            return query_names_with_prefix(self.__sql_con, "customerName", "")
+        if (self.__columnar):
+            return self.__db.get_names_with_prefix("customerName", "")
+        return self.__customer_name_trie.starts_with("")
+
+    def __rebuild_customer_bloom_filter(self) -> None:
+        """
+        Rebuild the Bloom filter of the customer names (if it is enabled) from the names of the records
+        with twice the number of names as its capacity so that names can be added before it is full again.
+        The names of the deleted records are also removed from the filter.
+        """
+        if (self.__customer_bloom_filter is None):
+            return
+
+        customerNames = self.__get_distinct_customer_names()
+        self.__customer_bloom_filter.rebuild(customerNames, max(BLOOM_FILTER_MIN_CAPACITY, 2 * len(customerNames)))
+
+    def __add_to_customer_bloom_filter(self, customerName:str) -> None:
+        """
+        Add the customer name to the Bloom filter of the customer names (if it is enabled)
+        and rebuild the filter if it is full
+
+        Requires 1 argument:
+        - customerName (str)
+        """
+        bloomFilter = self.__customer_bloom_filter
+        if (bloomFilter is None):
+            return
+
+        bloomFilter.add(customerName)
+        if (bloomFilter.is_full()):
+            # the name is added again as the record might not be in the indexes or the database yet
+            self.__rebuild_customer_bloom_filter()
+            bloomFilter.add(customerName)
+
+    @synchronised
+    def enable_customer_bloom_filter(self, falsePositiveRate:float=BLOOM_FILTER_FALSE_POSITIVE_RATE) -> None:
+        """
+        Build a Bloom filter of the customer names so that the searches for a customer name that no record has
+        are short-circuited without searching the AVL tree or querying the database (in the SQL query mode).
+        
+        The filter is rebuilt when records are bulk loaded and the customer names of the records that 
+        are added or edited are added to it. The names of the deleted records are only removed when the 
+        filter is rebuilt, hence their searches are not short-circuited until then.
+        
+        Optional argument:
+        - falsePositiveRate (float): the false positive rate of the filter (between 0 and 1 exclusive), 
+                                     defaults to BLOOM_FILTER_FALSE_POSITIVE_RATE
+        """
+        self.__customer_bloom_filter = BloomFilter(BLOOM_FILTER_MIN_CAPACITY, falsePositiveRate)
+        self.__rebuild_customer_bloom_filter()
+
+    def get_customer_bloom_filter_stats(self) -> Union[tuple, None]:
+        """
+        Returns the number of customer name lookups and the number of lookups that were short-circuited
+        by the Bloom filter of the customer names in a tuple or None if the filter is not enabled
+        """
+        bloomFilter = self.__customer_bloom_filter
+        if (bloomFilter is None):
+            return None
+        return bloomFilter.numOfLookups, bloomFilter.numOfShortCircuits
+
+    def get_record(self, recordId:int) -> Union[RecordData, None]:
+        """
+        Returns the record with the record ID or None if the record does not exist (e.g. it was deleted)
+        
+        Requires 1 argument:
+        - recordId (int): the stable record ID from get_record_id() of the record
+        
+        Note: The record ID is the slot of the ColumnarRecord in the columnar mode
+        and the ROWID of the record in the SQL query mode (which is queried from the database).
+        
+        Time complexity: O(1)
+        """
+        if (self.__sql_con is not None):
+            row = query_record(self.__sql_con, recordId)
+            if (row is None):
+                return None
+            record = RecordData.from_row(*row)
+            record.set_record_id(recordId)
+            return record
+        if (self.__columnar):
+            return self.__records.get_record(recordId)
+        return self.__record_index.get(recordId)
+
+    @synchronised
+    def __mark_as_edited(self, record:RecordData) -> None:
+        """
+        Mark a record as edited since the last save
+        
+        Requires 1 argument:
+        - record (RecordData)
+        """
+        # the customer name of the record might have been changed to a new name
+        self.__add_to_customer_bloom_filter(record.get_customer_name())
+        if (self.__sql_con is not None):
+            # write the changes directly to the database in the SQL query mode
+            update_record(self.__sql_con, record)
+            self.__sql_pages = None
+            return
+
+        self.__sorted_views.clear()
+
+        # records that have not been saved yet will be inserted with their latest data anyway
+        if (record not in self.__added_records):
+            self.__edited_records[record] = None
 
-    def get_val(self, attribute:str=None) -> Union[str, int, float]:
+        if (self.__journal is not None):
+            self.__journal.log_edit(record)
+
+    @synchronised
+    def __mark_as_deleted(self, record:RecordData) -> None:
         """
-        Returns the value of the specified attribute.
+        Mark a record as deleted since the last save
         
-        Requires one argument:
-        - attribute(str): The attribute to get the value of.
-            - "packageName"
-            - "customerName"
-            - "paxNum"
-            - "costPerPax"
-        """
-        if (attribute == "packageName"):
-            return self.get_package_name()
-        elif (attribute == "customerName"):
-            return self.get_customer_name()
-        elif (attribute == "paxNum"):
-            return self.get_pax_num()
-        elif (attribute == "costPerPax"):
-            return self.get_cost_per_pax()
-        else:
-            raise ValueError(f"Invalid attribute \"{attribute}\" in get_val in RecordData object!")
+        Requires 1 argument:
+        - record (RecordData)
+        """
+        if (self.__sql_con is not None):
+            # delete the record directly from the database in the SQL query mode
+            delete_record(self.__sql_con, record.get_row_id())
+            self.__sql_len = None
+            self.__sql_pages = None
+            return
 
-    def __repr__(self) -> str:
-        return "(" + f"{self.__packageName}, " + f"{self.__customerName}, " + f"{self.__paxNum} pax, " + format_price(self.__packageCostPerPax) + ")"
+        self.__sorted_views.clear()
 
-    def __str__(self) -> str:
-        return print_record_data(self.__packageName, self.__customerName, self.__paxNum, self.__packageCostPerPax)
+        if (self.__journal is not None):
+            self.__journal.log_delete(record.get_row_id())
 
-class HotelDatabase:
-    """
-    Will create a HotelDatabase object responsible for storing and managing all hotel records.
-    
-    Upon initialisation, this object will create an empty array which would hold all hotel records
-    of RecordData objects.
-    """
-    def __init__(self):
-        # Array of RecordData objects
-        self.__db = []
+        if (record in self.__added_records):
+            # the record was never saved, hence there is nothing to delete in the database file
+            del self.__added_records[record]
+            return
 
-        # create an AVL tree based on customer names as the keys
-        self.__bst_root = AVLTree() 
+        self.__edited_records.pop(record, None)
+        self.__deleted_row_ids.append(record.get_row_id())
 
-        # boolean to determine whether to sort the records in descending order
-        self.__descending_order = False 
+    @synchronised
+    def get_unsaved_changes(self) -> tuple:
+        """
+        Returns the changes made since the database was last saved in a tuple of
+        (list of added records, list of edited records, list of deleted records' ROWID)
+        """
+        return list(self.__added_records), list(self.__edited_records), self.__deleted_row_ids.copy()
 
-        # to determine the current sort order
-        self.__sort_order = NOT_SORTED 
+    @synchronised
+    def clear_unsaved_changes(self) -> None:
+        """
+        Clears the tracked changes after the database has been saved
+        """
+        self.__added_records.clear()
+        self.__edited_records.clear()
+        self.__deleted_row_ids.clear()
 
-        # table headers
-        self.__table_headers = [CUST_NAME, PACKAGE_NAME, COST_PER_PAX, PAX_NUM] 
+    @synchronised
+    def set_sorted_views(self, sortedViews:dict) -> None:
+        """
+        Set the records in ascending order of each sort key (e.g. loaded from the columnar snapshot)
+        so that sorting by the sort key will only take O(n) time.
         
-        # table lengths for padding
-        self.__table_len = [len(self.__table_headers[0]), len(self.__table_headers[1]), \
-                            len(self.__table_headers[2]), len(self.__table_headers[3])] 
+        Requires 1 argument:
+        - sortedViews (dict): the sort keys (e.g. PAX_NUM) to the array of the records in ascending order
+        """
+        self.__sorted_views = sortedViews
+
+    def __sort_with_view(self, sortKey:str, reverse:bool) -> bool:
+        """
+        Sort the records by copying the sorted view of the sort key if it exists
+        
+        Requires 2 arguments:
+        - sortKey (str): e.g. PAX_NUM
+        - reverse (bool): True if the records are to be sorted in descending order
+        
+        Returns True if the records were sorted, False if there is no sorted view to copy from.
+        """
+        sortedView = self.__sorted_views.get(sortKey)
+        if (sortedView is None):
+            return False
+
+        self.__db = sortedView[::-1] if (reverse) else sortedView.copy()
+        return True
+
+    def __save_sorted_view(self, sortKey:str, reverse:bool) -> None:
+        """
+        Save the records that were just sorted as the sorted view of the sort key
+        
+        Requires 2 arguments:
+        - sortKey (str): e.g. PAX_NUM
+        - reverse (bool): True if the records were sorted in descending order
+        """
+        self.__sorted_views[sortKey] = self.__db[::-1] if (reverse) else self.__db.copy()
+
+    @synchronised
+    def attach_journal(self, journal) -> None:
+        """
+        Attach the append-only journal so that every record that is added, edited, 
+        or deleted from now on will also be appended to the journal.
+        
+        Note: All records must already have a ROWID (saved to the database file)
+        since the journal entries refer to the records by their ROWID.
+        
+        Requires 1 argument:
+        - journal (MutationJournal)
+        """
+        self.__journal = journal
 
-    def delete_record(self, record:RecordData=None, index:int=None) -> None:
+    @synchronised
+    def delete_record(self, record:RecordData=None, recordId:int=None) -> None:
         """
         Deletes a record from the database
         
         Requires either one of the two arguments:
         record: The record to be deleted (defaults to None)
-        index: The index of the record to be deleted (defaults to None)
+        recordId: The stable record ID of the record to be deleted (defaults to None)
+        
+        Time complexity: O(1) amortised as the record is only removed from the record index
+        and its tombstone in the array is removed in the next compaction (see __get_db)
         """
-        if (index is None):
-            self.__db.remove(record)
+        if (recordId is not None):
+            record = self.get_record(recordId)
+            if (record is None):
+                raise ValueError(f"No record with the record ID, {recordId}, in delete_record()")
+
+        if (self.__sql_con is not None):
+            # the record is not in the array in the SQL query mode
+            pass
+        elif (self.__columnar):
+            self.__records.remove(record)
         else:
-            self.__db.pop(index)
+            self.__unindex_record(record)
+            self.__num_of_tombstones += 1
+        self.__mark_as_deleted(record)
         print(f"{F.LIGHTGREEN_EX}Record deleted!")
         S_reset()
 
-    def add_record(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float]) -> None:
+    @synchronised
+    def add_record(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float], rowId:int=None) -> None:
         """
         Add a record to the database
         
@@ -272,6 +1259,10 @@ class HotelDatabase:
         2. Customer Name (string)
         3. Number of Pax (int/string) -> will be converted to int if it's a string
         4. Package Cost per Pax (int/float/string) -> will be converted to float if it's a string
+        
+        Optional argument:
+        5. ROWID of the record in the sqlite3 database file (int) -> if defined, the record 
+           is treated as already saved and will not be tracked as a newly added record
         """
         if (len(customerName) > self.__table_len[0]):
             self.__table_len[0] = len(customerName)
@@ -287,9 +1278,160 @@ class HotelDatabase:
             self.__table_len[3] = len(str(paxNum))
 
         self.__sort_order = NOT_SORTED
-        recordData = RecordData(packageName, customerName, paxNum, packageCostPerPax)
-        self.__db.append(recordData)
-        self.__bst_root.insert(recordData)
+        if (self.__columnar):
+            # only the columns are appended to and the view of the record is returned
+            recordData = self.__db.append(packageName, customerName, paxNum, packageCostPerPax, rowId=rowId)
+        else:
+            recordData = RecordData(packageName, customerName, paxNum, packageCostPerPax, rowId=rowId)
+
+        self.__add_to_customer_bloom_filter(recordData.get_customer_name())
+        if (self.__sql_con is not None):
+            # insert the record directly into the database in the SQL query mode
+            insert_record(self.__sql_con, recordData)
+            self.__sql_len = None
+            self.__sql_pages = None
+            return
+
+        if (self.__journal is not None and rowId is None):
+            # give the record its ROWID now so that the journal entries can refer to it
+            recordData.set_row_id(self.__journal.next_row_id())
+
+        if (not self.__columnar):
+            # appended to the raw array as the tombstones do not have to be removed first
+            self.__index_record(recordData)
+            self.__records.append(recordData)
+            for tree in self.__get_trees():
+                tree.insert(recordData)
+            self.__customer_name_trie.insert(recordData.get_customer_name())
+            self.__customer_name_ngrams.add(recordData.get_customer_name())
+            self.__package_name_ngrams.add(recordData.get_package_name())
+        self.__sorted_views.clear()
+        if (rowId is None):
+            self.__added_records[recordData] = None
+            if (self.__journal is not None):
+                self.__journal.log_add(recordData)
+
+    @synchronised
+    def bulk_load(self, rows, customerOrder=None) -> int:
+        """
+        Add many records to the database in one pass instead of calling add_record for each record.
+
+        The records are built first, then the table lengths for padding are computed once
+        from the longest names and largest numbers, and the AVL tree is built in one pass.
+
+        Requires one argument:
+        - rows (iterable): An iterable of tuples in the same order as the add_record arguments,
+                           (packageName, customerName, paxNum, costInCents, rowId) where the cost per pax
+                           is an integer number of cents (as stored in the sqlite3 database file) and rowId
+                           can be None if the record has not been saved to the database file yet.
+                           Can be a generator (e.g. streaming rows from a sqlite3 cursor) as
+                           it will only be iterated once.
+
+        Optional argument:
+        - customerOrder (sequence): the precomputed indexes of the rows sorted by customer name
+                                    (e.g. from the columnar snapshot) so that the AVL tree can be 
+                                    built without sorting the customer names, defaults to None
+
+        Returns the number of records added.
+        """
+        if (self.__columnar):
+            # the rows are appended to the columns directly without creating a RecordData object for each row
+            numOfRecords, unsavedRecords = self.__db.extend(rows)
+            if (numOfRecords > 0):
+                self.__update_table_len(*self.__db.get_max_values())
+                self.__sort_order = NOT_SORTED
+                for record in unsavedRecords:
+                    self.__added_records[record] = None
+                self.__rebuild_customer_bloom_filter()
+            return numOfRecords
+
+        newRecords = [RecordData.from_row(*row) for row in rows]
+        if (not newRecords):
+            return 0
+
+        self.__update_table_len(
+            max(len(record.get_customer_name()) for record in newRecords), 
+            max(len(record.get_package_name()) for record in newRecords), 
+            max(record.get_cost_in_cents() for record in newRecords) / 100, 
+            max(record.get_pax_num() for record in newRecords)
+        )
+        self.__sort_order = NOT_SORTED
+        self.__sorted_views.clear()
+        for record in newRecords:
+            self.__index_record(record)
+        self.__records.extend(newRecords)
+        if (customerOrder is not None):
+            self.__bst_root.bulk_insert([newRecords[i] for i in customerOrder], isSorted=True)
+        else:
+            self.__bst_root.bulk_insert(newRecords)
+        for tree in (self.__package_index, self.__cost_index, self.__pax_index):
+            tree.bulk_insert(newRecords)
+        for customerName, count in Counter(map(CUSTOMER_NAME_KEY, newRecords)).items():
+            self.__customer_name_trie.insert(customerName, count)
+            self.__customer_name_ngrams.add(customerName, count)
+        for packageName, count in Counter(map(PACKAGE_NAME_KEY, newRecords)).items():
+            self.__package_name_ngrams.add(packageName, count)
+        for record in newRecords:
+            if (record.get_row_id() is None):
+                self.__added_records[record] = None
+        self.__rebuild_customer_bloom_filter()
+        return len(newRecords)
+
+    def __update_table_len(self, maxCustomerNameLen:int, maxPackageNameLen:int, maxCost:float, maxPaxNum:int) -> None:
+        """
+        Update the table lengths for padding from the longest/largest values of the records only
+        since the formatted price and pax number only gets longer as the value gets larger
+        
+        Requires 4 arguments:
+        - maxCustomerNameLen (int): the length of the longest customer name
+        - maxPackageNameLen (int): the length of the longest package name
+        - maxCost (float): the largest package cost per pax
+        - maxPaxNum (int): the largest number of pax
+        """
+        self.__table_len[0] = max(self.__table_len[0], maxCustomerNameLen)
+        self.__table_len[1] = max(self.__table_len[1], maxPackageNameLen)
+        self.__table_len[2] = max(self.__table_len[2], len(format_price(maxCost)))
+        self.__table_len[3] = max(self.__table_len[3], len(str(maxPaxNum)))
+
+    def __get_sql_pages(self, where:str=None, params:tuple=(), orderBy:str=None) -> SQLRecordPages:
+        """
+        Returns the pages of the records that matches the condition in the SQL query mode
+        and update the table lengths for padding based on the matched records.
+        
+        Optional arguments:
+        - where (str): the SQL condition that the records must match, defaults to None for all records
+                       which will be cached until the records are changed or sorted
+        - params (tuple): the parameters for the condition, defaults to an empty tuple
+        - orderBy (str): the sort order (e.g. COST_PER_PAX) of the records, defaults to the current sort order
+        """
+        if (where is None and self.__sql_pages is not None):
+            return self.__sql_pages
+
+        if (orderBy is None):
+            orderBy = self.__sort_order
+
+        pages = SQLRecordPages(self.__sql_con, SQL_ORDER_COLUMNS.get(orderBy, "ROWID"), self.__descending_order, where=where, params=params)
+        if (len(pages) > 0):
+            self.__update_table_len(*pages.get_max_values())
+
+        if (where is None):
+            self.__sql_pages = pages
+        return pages
+
+    def __sql_sort(self, sortOrder:str, reverse:bool, sortedByMsg:str) -> None:
+        """
+        Sort the records in the SQL query mode by only changing the ORDER BY clause used when displaying the records
+        
+        Requires 3 arguments:
+        - sortOrder (str): the sort order, e.g. PAX_NUM
+        - reverse (bool): True if the records are to be sorted in descending order
+        - sortedByMsg (str): what the records are sorted by to be displayed in the message, e.g. "the number of pax"
+        """
+        self.__sort_order = sortOrder
+        self.__descending_order = reverse
+        self.__sql_pages = None
+        print(f"\n{F.LIGHTGREEN_EX}The database has been sorted by {sortedByMsg} in {'ascending' if (not reverse) else 'descending'} order!")
+        S_reset()
 
     def edit_all_details_of_record(self, record:RecordData) -> None:
         """
@@ -302,32 +1444,77 @@ class HotelDatabase:
         print()
         if (res == -1):
             return
-        elif (self.__sort_order == PACKAGE_NAME):
+
+        self.__mark_as_edited(record)
+        if (self.__sort_order == PACKAGE_NAME):
             self.__sort_order = NOT_SORTED
 
         res = record.update_customer_name()
         print()
         if (res == -1):
             return
-        elif (self.__sort_order == CUST_NAME):
+
+        self.__mark_as_edited(record)
+        if (self.__sort_order == CUST_NAME):
             self.__sort_order = NOT_SORTED
 
         res = record.update_pax_num()
         print()
         if (res == -1):
             return
-        elif (self.__sort_order == PAX_NUM):
+
+        self.__mark_as_edited(record)
+        if (self.__sort_order == PAX_NUM):
             self.__sort_order = NOT_SORTED
 
         res = record.update_cost_per_pax()
         if (res == -1):
             return
-        elif (self.__sort_order == COST_PER_PAX):
+
+        self.__mark_as_edited(record)
+        if (self.__sort_order == COST_PER_PAX):
             self.__sort_order = NOT_SORTED
 
     def edit_record(self, record:RecordData) -> None:
         """
-        Edit a record's data
+        Edit a record's data and move the record in the sorted indexes if the fields were changed
+        
+        Requires 1 argument:
+        - record (RecordData)
+        """
+        if (self.__sql_con is not None or self.__columnar):
+            return self.__edit_record_fields(record)
+
+        # the keys of the record in the sorted indexes before it was edited
+        trees = self.__get_trees()
+        oldKeys = [tree.key(record) for tree in trees]
+        oldTotalCostInCents = total_cost_in_cents_key(record)
+        try:
+            self.__edit_record_fields(record)
+        finally:
+            with self.__lock:
+                for tree, oldKey in zip(trees, oldKeys):
+                    if (tree is self.__cost_index and total_cost_in_cents_key(record) != oldTotalCostInCents):
+                        # the total cost of the booking summed by the index of the package costs has changed 
+                        # (the number of pax might have been changed without changing the cost per pax)
+                        tree.move_node(record, oldKey, oldTotalCostInCents)
+                    elif (tree.key(record) != oldKey):
+                        tree.move_node(record, oldKey)
+
+                oldCustomerName, oldPackageName = oldKeys[0], oldKeys[1]
+                if (record.get_customer_name() != oldCustomerName):
+                    self.__customer_name_trie.remove(oldCustomerName)
+                    self.__customer_name_trie.insert(record.get_customer_name())
+                    self.__customer_name_ngrams.remove(oldCustomerName)
+                    self.__customer_name_ngrams.add(record.get_customer_name())
+
+                if (record.get_package_name() != oldPackageName):
+                    self.__package_name_ngrams.remove(oldPackageName)
+                    self.__package_name_ngrams.add(record.get_package_name())
+
+    def __edit_record_fields(self, record:RecordData) -> None:
+        """
+        Prompts the user for the fields of the record to edit
         
         Requires 1 argument:
         - record (RecordData)
@@ -348,23 +1535,31 @@ X. Exit
             whichToEdit = get_input(prompt="Which field do you want to edit?: ", command=("1", "2", "3", "4", "5", "a", "x"), prints=menu)
             if (whichToEdit == "1"):
                 res = record.update_package_name()
-                if (res != -1 and self.__sort_order == PACKAGE_NAME):
-                    self.__sort_order = NOT_SORTED
+                if (res != -1):
+                    self.__mark_as_edited(record)
+                    if (self.__sort_order == PACKAGE_NAME):
+                        self.__sort_order = NOT_SORTED
 
             elif (whichToEdit == "2"):
                 res = record.update_customer_name()
-                if (res != -1 and self.__sort_order == CUST_NAME):
-                    self.__sort_order = NOT_SORTED
+                if (res != -1):
+                    self.__mark_as_edited(record)
+                    if (self.__sort_order == CUST_NAME):
+                        self.__sort_order = NOT_SORTED
 
             elif (whichToEdit == "3"):
                 res = record.update_pax_num()
-                if (res != -1 and self.__sort_order == PAX_NUM):
-                    self.__sort_order = NOT_SORTED
+                if (res != -1):
+                    self.__mark_as_edited(record)
+                    if (self.__sort_order == PAX_NUM):
+                        self.__sort_order = NOT_SORTED
 
             elif (whichToEdit == "4"):
                 res = record.update_cost_per_pax()
-                if (res != -1 and self.__sort_order == COST_PER_PAX):
-                    self.__sort_order = NOT_SORTED
+                if (res != -1):
+                    self.__mark_as_edited(record)
+                    if (self.__sort_order == COST_PER_PAX):
+                        self.__sort_order = NOT_SORTED
 
             elif (whichToEdit == "5"):
                 print(record, end="")
@@ -378,22 +1573,40 @@ X. Exit
                 print(f"{F.LIGHTRED_EX}Invalid input...")
                 S_reset()
 
-    def sort_by_pax_num(self, reverse:bool=False) -> None:
+    @synchronised
+    def sort_by_pax_num(self, reverse:bool=False, typeOfSort:str="tree") -> None:
         """
-        Do a shellsort on the database by number of pax
+        Sort the database by number of pax by walking the sorted index of the number of pax in O(n)
+        or do a shellsort on the array of records
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "tree" for the tree sort or "shell" for the shellsort, defaults to "tree"
         """
+        if (typeOfSort not in ("tree", "shell")):
+            raise ValueError(f"Invalid type of sort, {typeOfSort}, in sort_by_pax_num()")
+
         if (self.__sort_order == PAX_NUM and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the number of pax!")
             S_reset()
             return
 
+        if (self.__sql_con is not None):
+            return self.__sql_sort(PAX_NUM, reverse, "the number of pax")
+
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            shellsort(self.__db, reverse=reverse)
+            if (self.__columnar):
+                self.__db.sort(PAX_NUM, reverse=reverse)
+            elif (self.__sort_with_view(PAX_NUM, reverse)):
+                pass
+            elif (typeOfSort == "tree"):
+                self.__db = self.__pax_index.tree_sort(reverse=reverse)
+                self.__save_sorted_view(PAX_NUM, reverse)
+            else:
+                shellsort(self.__db, reverse=reverse, key=PAX_NUM_KEY)
+                self.__save_sorted_view(PAX_NUM, reverse)
             self.__descending_order = reverse
             self.__sort_order = PAX_NUM
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by the number of pax in {'ascending' if (not reverse) else 'descending'} order!")
@@ -403,25 +1616,37 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
+    @synchronised
     def sort_by_customer_name(self, reverse:bool=False, typeOfSort:str="tree") -> None:
         """
-        Do a bubble sort on the database by customer name to satisfy the basic function c.2. criteria
+        Sort the database by customer name by walking the AVL tree of the customer names in O(n) 
+        or do a bubble sort to satisfy the basic function c.2. criteria
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "tree" for the tree sort or "bubble" for the bubble sort, defaults to "tree"
         """
         if (self.__sort_order == CUST_NAME and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the customer's name!")
             S_reset()
             return
 
+        if (self.__sql_con is not None):
+            return self.__sql_sort(CUST_NAME, reverse, "customer name")
+
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            if (typeOfSort == "tree"):
+            if (self.__columnar):
+                self.__db.sort(CUST_NAME, reverse=reverse)
+            elif (self.__sort_with_view(CUST_NAME, reverse)):
+                pass
+            elif (typeOfSort == "tree"):
                 self.__db = self.__bst_root.tree_sort(reverse=reverse)
+                self.__save_sorted_view(CUST_NAME, reverse)
             else:
                 bubble_sort(self.__db, reverse=reverse)
+                self.__save_sorted_view(CUST_NAME, reverse)
 
             self.__descending_order = reverse
             self.__sort_order = CUST_NAME
@@ -432,22 +1657,48 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def sort_by_package_name(self, reverse:bool=False) -> None:
+    @synchronised
+    def sort_by_package_name(self, reverse:bool=False, typeOfSort:str="tree") -> None:
         """
-        Do a selection sort on the database by package name to satisfy the basic function c.3. criteria
+        Sort the database by package name by walking the sorted index of the package names in O(n) 
+        or do a selection sort to satisfy the basic function c.3. criteria
+        
+        The heap sort and introsort are used before a binary search or a fibonacci search for the package name.
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "tree" for the tree sort, "selection" for the selection sort, 
+                            "heap" for the heap sort, or "intro" for the introsort, defaults to "tree"
         """
+        if (typeOfSort not in ("tree", "selection", "heap", "intro")):
+            raise ValueError(f"Invalid type of sort, {typeOfSort}, in sort_by_package_name()")
+
         if (self.__sort_order == PACKAGE_NAME and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the package's name!")
             S_reset()
             return
 
+        if (self.__sql_con is not None):
+            return self.__sql_sort(PACKAGE_NAME, reverse, "package name")
+
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            selection_sort(self.__db, reverse=reverse)
+            if (self.__columnar):
+                self.__db.sort(PACKAGE_NAME, reverse=reverse)
+            elif (self.__sort_with_view(PACKAGE_NAME, reverse)):
+                pass
+            elif (typeOfSort == "tree"):
+                self.__db = self.__package_index.tree_sort(reverse=reverse)
+                self.__save_sorted_view(PACKAGE_NAME, reverse)
+            else:
+                if (typeOfSort == "selection"):
+                    selection_sort(self.__db, reverse=reverse, key=PACKAGE_NAME_KEY)
+                elif (typeOfSort == "heap"):
+                    heap_sort(self.__db, reverse=reverse, key=PACKAGE_NAME_KEY)
+                else:
+                    intro_sort(self.__db, reverse=reverse, key=PACKAGE_NAME_KEY)
+                self.__save_sorted_view(PACKAGE_NAME, reverse)
             self.__descending_order = reverse
             self.__sort_order = PACKAGE_NAME
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package name in {'ascending' if (not reverse) else 'descending'} order!")
@@ -457,22 +1708,46 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def sort_by_package_cost(self, reverse:bool=False) -> None:
+    @synchronised
+    def sort_by_package_cost(self, reverse:bool=False, typeOfSort:str="tree") -> None:
         """
-        Do a insertion sort on the database by package cost to satisfy the basic function c.4. criteria
+        Sort the database by package cost by walking the sorted index of the package costs in O(n) 
+        or do an insertion sort to satisfy the basic function c.4. criteria
         
-        Optional parameter:
+        The radix sort is used before a binary search for the range of cost.
+        
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "tree" for the tree sort, "insertion" for the insertion sort, 
+                            or "radix" for the radix sort, defaults to "tree"
         """
+        if (typeOfSort not in ("tree", "insertion", "radix")):
+            raise ValueError(f"Invalid type of sort, {typeOfSort}, in sort_by_package_cost()")
+
         if (self.__sort_order == COST_PER_PAX and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the package's cost!")
             S_reset()
             return
 
+        if (self.__sql_con is not None):
+            return self.__sql_sort(COST_PER_PAX, reverse, "package cost")
+
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            insertion_sort(self.__db, reverse=reverse)
+            if (self.__columnar):
+                self.__db.sort(COST_PER_PAX, reverse=reverse)
+            elif (self.__sort_with_view(COST_PER_PAX, reverse)):
+                pass
+            elif (typeOfSort == "tree"):
+                self.__db = self.__cost_index.tree_sort(reverse=reverse)
+                self.__save_sorted_view(COST_PER_PAX, reverse)
+            else:
+                if (typeOfSort == "insertion"):
+                    insertion_sort(self.__db, reverse=reverse, key=COST_IN_CENTS_KEY)
+                else:
+                    radix_sort(self.__db, reverse=reverse, key=COST_IN_CENTS_KEY)
+                self.__save_sorted_view(COST_PER_PAX, reverse)
             self.__descending_order = reverse
             self.__sort_order = COST_PER_PAX
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package cost in {'ascending' if (not reverse) else 'descending'} order!")
@@ -482,14 +1757,16 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def get_index_from_list(self, data:Union[list, int]=-1, dataOrigIndex:list=[], mode:str=None, typeOfOperations:str=None, target:str=None) -> tuple:
+    def get_index_from_list(self, data:Union[list, int]=-1, mode:str=None, typeOfOperations:str=None, target:str=None) -> tuple:
         """
         Function to get the index from a list of data.
         Used to when there is duplicate data in the search results.
         
-        Requires 5 arguments:
+        Returns the index of the chosen record in the data and its stable record ID (see get_record())
+        in a tuple or (-1, -1) if no record was chosen.
+        
+        Requires 4 arguments:
         - data (list/int): if int, it must be -1 to indicate no results found
-        - dataOrigIndex (list): the original index of the data in self.__db
         - mode (str): mode is defined as what type of data, e.g. "customer" and "package".
         - typeOfOperations (str): operations such as "edit" and "delete"
         - target (str): the target data to be passed into such as the customer/package name
@@ -503,14 +1780,11 @@ X. Exit
             S_reset()
             return -1, -1
 
-        if (len(data) != len(dataOrigIndex)):
-            raise ValueError("The length of data and dataOrigIndex arrays must be the same in get_index_from_list() function!")
-
         numIndexPrompt = ""
         if (len(data) == 1):
             print(f"\n{F.LIGHTGREEN_EX}Found one record found with the {mode} name, {target}!")
             S_reset(nl=True)
-            return 0, dataOrigIndex[0]
+            return 0, data[0].get_record_id()
 
         print(f"\n{F.LIGHTGREEN_EX}Multiple records found with the {mode} name, {target}!")
         print(f"{F.LIGHTGREEN_EX}Please select the record you wish to {typeOfOperations.lower()} after looking at the search results!")
@@ -529,14 +1803,14 @@ X. Exit
                 S_reset(nl=True)
                 return -1, -1
             elif (len(data) > 10 and numIndexChoice.lower() == "v"):
-                return self.get_index_from_list(data=data, dataOrigIndex=dataOrigIndex, mode=mode, typeOfOperations=typeOfOperations, target=target)
+                return self.get_index_from_list(data=data, mode=mode, typeOfOperations=typeOfOperations, target=target)
             elif (numIndexChoice == ""):
                 print(f"{F.LIGHTRED_EX}Please enter a number from the table!")
                 S_reset(nl=True)
             elif (re.fullmatch(NUM_REGEX, numIndexChoice)):
                 index = int(numIndexChoice) - 1
                 if (index >= 0 and index < len(data)):
-                    return index, dataOrigIndex[index]
+                    return index, data[index].get_record_id()
                 else:
                     print(f"{F.LIGHTRED_EX}Invalid input, please enter a number between 1 and {len(data)}!")
                     S_reset(nl=True)
@@ -557,26 +1831,40 @@ X. Exit
         mode = mode.title()
         customerName = customerName.title()
 
+        if (self.__customer_bloom_filter is not None and not self.__customer_bloom_filter.might_contain(customerName)):
+            # the customer name is definitely not in the database, hence the AVL tree or the database is not searched
+            print(f"{F.LIGHTRED_EX}No records found with the customer name, {customerName}!")
+            S_reset(nl=True)
+            return -1
+
+        if (self.__sql_con is not None):
+            # indexed SQL query on the customer name in the SQL query mode
+            records = self.__get_sql_pages(where=CUSTOMER_NAME_CONDITION, params=(customerName,), orderBy=NOT_SORTED)
+            return self.__handle_search_results(records, mode, "customer", customerName)
+
+        if (self.__columnar):
+            # scan the customer name codes in the columnar mode
+            records = self.__db.search_for_name("customerName", customerName)
+            return self.__handle_search_results(records, mode, "customer", customerName)
+
+        # search using AVL tree
+        dataList = self.__bst_root.search(customerName)
+        if (dataList == -1):
+            # no record has the customer name, hence there is no need to search the records
+            print(f"{F.LIGHTRED_EX}No records found with the customer name, {customerName}!")
+            S_reset(nl=True)
+            return -1
+
         if (mode == "Display"):
-            # search using AVL tree
-            dataList = self.__bst_root.search(customerName)
-            if (dataList != -1):
-                self.print_from_array(dataList.convert_to_array())
-                return
-            else:
-                print(f"{F.LIGHTRED_EX}No records found with the customer name, {customerName}!")
-                S_reset(nl=True)
-                return -1
+            self.print_from_array(dataList.convert_to_array())
+            return
 
         data = []
-        dataOrigIndex = []
         if (not bonus):
             # linear search to satisfy the basic function c.5. criteria
-            dataTuple = linear_search_for_name(self.__db, customerName, "customerName")
+            dataTuple = linear_search_for_name(self.__db, customerName, CUSTOMER_NAME_KEY)
             if (dataTuple != -1):
-                for matchedData in dataTuple:
-                    data.append(matchedData[0])
-                    dataOrigIndex.append(matchedData[1])
+                data = [matchedData[0] for matchedData in dataTuple]
 
         if (bonus):
             if (self.__sort_order != CUST_NAME and len(self.__db) > 1):
@@ -596,123 +1884,256 @@ X. Exit
             # if it's already sorted, do exponential search
             lowIndex, highIndex = exponential_search_for_customer(self.__db, customerName, descendingOrder=self.__descending_order)
             data = self.__db[lowIndex:highIndex + 1]
-            dataOrigIndex = list(range(lowIndex, highIndex + 1))
 
-        index, dbIndex = self.get_index_from_list(data=data, dataOrigIndex=dataOrigIndex, mode="customer", typeOfOperations=mode, target=customerName)
-        if (index == -1):
+        _, recordId = self.get_index_from_list(data=data, mode="customer", typeOfOperations=mode, target=customerName)
+        if (recordId == -1):
             return
 
-        data = data[index]
-        print(data)
+        print(self.get_record(recordId))
         inp = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
         if (inp == "y" and mode == "Edit"):
-            oldCustName = data.get_customer_name()
-            self.edit_record(data)
-            if (oldCustName != data.get_customer_name()):
-                self.__bst_root.move_node(data)
+            self.edit_record(self.get_record(recordId))
         elif (inp == "y" and mode == "Delete"):
-            self.delete_record(index=dbIndex)
-            self.__bst_root.delete(data)
+            self.delete_record(recordId=recordId)
+
+    def search_for_customer_prefix(self, prefix:str) -> Union[None, int]:
+        """
+        Suggest the customer names that start with the prefix (case-insensitive) from the radix trie 
+        of the customer names in O(p + r) and display the records of the customer chosen by the user
+        
+        Requires 1 argument:
+        - prefix (string): e.g. the first few letters of the customer name
+        """
+        if (self.__sql_con is not None):
+            # indexed SQL query on the customer name in the SQL query mode
+            names = query_names_with_prefix(self.__sql_con, "customerName", prefix, limit=AUTOCOMPLETE_LIMIT + 1)
+        elif (self.__columnar):
+            # scan the customer names of the records in the columnar mode
+            names = self.__db.get_names_with_prefix("customerName", prefix, limit=AUTOCOMPLETE_LIMIT + 1)
+        else:
+            names = self.__customer_name_trie.starts_with(prefix, limit=AUTOCOMPLETE_LIMIT + 1)
+
+        if (not names):
+            print(f"{F.LIGHTRED_EX}No customer names found starting with \"{prefix}\"!")
+            S_reset(nl=True)
+            return -1
+
+        # one more name than the limit is requested to check if there are more names to suggest
+        hasMoreNames = len(names) > AUTOCOMPLETE_LIMIT
+        names = names[:AUTOCOMPLETE_LIMIT]
+
+        print(f"\n{F.LIGHTGREEN_EX}Customer names starting with \"{prefix}\":")
+        S_reset()
+        for i, name in enumerate(names, start=1):
+            print(f"{i}. {name}")
+        if (hasMoreNames):
+            print(f"{F.LIGHTYELLOW_EX}...and more, enter more letters of the customer name to narrow down the suggestions.")
+            S_reset()
+        print()
+
+        if (len(names) == 1):
+            return self.search_for_customer(names[0], mode="Display")
+
+        numInput = get_input(prompt="Which customer's records would you like to display? (x to cancel): ", 
+                             command=tuple([str(i) for i in range(1, len(names) + 1)] + ["x"]))
+        if (numInput == "x"):
+            return
+        return self.search_for_customer(names[int(numInput) - 1], mode="Display")
 
-    def search_for_package(self, packageName:str, mode:str="Edit") -> None:
+    def fuzzy_search_for_name(self, name:str, typeOfSearch:str="customer") -> Union[None, int]:
         """
-        Do a binary search on the database for the package name to satisfy the basic function c.6. criteria
+        Do a fuzzy search with the n-gram index of the customer/package names for the names that are similar
+        to the (possibly misspelt) name, ranked by their edit distance, and display the records of the name chosen by the user
+        
+        Requires 1 argument:
+        - name (string): e.g. "Hiroyki" to find "Hiroyuki"
         
-        Note: Depending on the user's preference, the package name can be searched using linear search algorithm if the user wish to perserve the order of the database.
+        Optional argument:
+        - typeOfSearch (string): "customer" or "package", defaults to "customer"
+        """
+        if (typeOfSearch not in ("customer", "package")):
+            raise ValueError(f"Invalid type of search, {typeOfSearch}, in fuzzy_search_for_name()")
+
+        field = "customerName" if (typeOfSearch == "customer") else "packageName"
+        if (self.__sql_con is not None or self.__columnar):
+            # compare with every unique name of the records in the SQL query mode and the columnar mode
+            if (self.__sql_con is not None):
+                names = query_names_with_prefix(self.__sql_con, field, "")
+            else:
+                names = self.__db.get_names_with_prefix(field, "")
+            matchedNames = rank_by_edit_distance(names, name)
+        else:
+            nameIndex = self.__customer_name_ngrams if (typeOfSearch == "customer") else self.__package_name_ngrams
+            matchedNames = fuzzy_search_for_name(nameIndex, name)
+
+        if (not matchedNames):
+            print(f"{F.LIGHTRED_EX}No {typeOfSearch} names found that are similar to \"{name}\"!")
+            S_reset(nl=True)
+            return -1
+
+        matchedNames = matchedNames[:AUTOCOMPLETE_LIMIT]
+        print(f"\n{F.LIGHTGREEN_EX}{typeOfSearch.title()} names similar to \"{name}\":")
+        S_reset()
+        for i, (matchedName, distance) in enumerate(matchedNames, start=1):
+            distanceInfo = "exact match" if (distance == 0) else f"{distance} typo{'s' if (distance > 1) else ''}"
+            print(f"{i}. {matchedName} ({distanceInfo})")
+        print()
+
+        if (len(matchedNames) == 1):
+            chosenName = matchedNames[0][0]
+        else:
+            numInput = get_input(prompt=f"Which {typeOfSearch}'s records would you like to display? (x to cancel): ", 
+                                 command=tuple([str(i) for i in range(1, len(matchedNames) + 1)] + ["x"]))
+            if (numInput == "x"):
+                return
+            chosenName = matchedNames[int(numInput) - 1][0]
+
+        if (typeOfSearch == "customer"):
+            return self.search_for_customer(chosenName, mode="Display")
+        return self.search_for_package(chosenName, mode="Display")
+
+    def search_for_package(self, packageName:str, mode:str="Edit", typeOfSearch:str="index") -> None:
+        """
+        Search the sorted index of the package names for the package name in O(log n + k)
+        to satisfy the basic function c.6. criteria without re-sorting the database
+        or do a binary search (after a heap sort)/fibonacci search (after an introsort) on the array of records
         
         Requires 2 arguments:
         - packageName (string)
         - mode (string): "Edit" or "Display" or "Delete", defaults to "Edit"
+        
+        Optional argument:
+        - typeOfSearch (string): "index", "binary", or "fibonacci", defaults to "index"
         """
+        if (typeOfSearch not in ("index", "binary", "fibonacci")):
+            raise ValueError(f"Invalid type of search, {typeOfSearch}, in search_for_package()")
+
         mode = mode.title()
         packageName = packageName.title()
 
-        if (self.__sort_order != PACKAGE_NAME and len(self.__db) > 1):
-            # sort and call itself again
-            reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package name as it is currently not sorted in the correct order!")
-            print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
-            S_reset()
-            if (mode == "Display"):
-                intro_sort(self.__db, reverse=reverseOrder)
-            else: # edit/delete
-                heap_sort(self.__db, reverse=reverseOrder)
-            self.__descending_order = reverseOrder
-            self.__sort_order = PACKAGE_NAME
-            print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package name in {'ascending' if (not reverseOrder) else 'descending'} order!")
-            S_reset(nl=True)
-            return self.search_for_package(packageName, mode=mode)
-        else:
-            if (mode == "Display"):
-                lowIndex, highIndex = fibonacci_search_for_package_name(self.__db, packageName, descendingOrder=self.__descending_order)
-            else: # edit/delete
-                lowIndex, highIndex = binary_search_for_name(self.__db, packageName, self.__descending_order, "packageName")
+        if (self.__sql_con is not None):
+            # indexed SQL query on the package name in the SQL query mode
+            records = self.__get_sql_pages(where=PACKAGE_NAME_CONDITION, params=(packageName,), orderBy=NOT_SORTED)
+            return self.__handle_search_results(records, mode, "package", packageName)
 
-            if (lowIndex == -1 and highIndex == -1):
-                print(f"{F.LIGHTRED_EX}No records found with the package name, {packageName}!")
-                S_reset(nl=True)
-                return -1
+        if (self.__columnar):
+            # scan the package name codes in the columnar mode
+            records = self.__db.search_for_name("packageName", packageName)
+            return self.__handle_search_results(records, mode, "package", packageName)
 
-            if (mode == "Display"):
-                return self.print_from_index(lowIndex, highIndex)
+        if (typeOfSearch == "index"):
+            records = self.__package_index.search(packageName)
+            return self.__handle_search_results(records, mode, "package", packageName)
 
-            # edit/delete
-            records = self.__db[lowIndex:highIndex + 1]
-            recordsOrigIndex = list(range(lowIndex, highIndex + 1))
+        if (self.__sort_order != PACKAGE_NAME and len(self.__db) > 1):
+            # sort and call itself again
+            reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package name as it is currently not sorted in the correct order!")
+            self.sort_by_package_name(reverseOrder, typeOfSort="heap" if (typeOfSearch == "binary") else "intro")
+            print()
+            return self.search_for_package(packageName, mode=mode, typeOfSearch=typeOfSearch)
 
-            index, dbIndex = self.get_index_from_list(data=records, dataOrigIndex=recordsOrigIndex, mode="package", typeOfOperations=mode, target=packageName)
-            if (index == -1):
-                return
+        if (typeOfSearch == "binary"):
+            lowIndex, highIndex = binary_search_for_name(self.__db, packageName, self.__descending_order, PACKAGE_NAME_KEY)
+        else:
+            lowIndex, highIndex = fibonacci_search_for_package_name(self.__db, packageName, descendingOrder=self.__descending_order)
 
-            record = records[index]
-            print(record)
-            userInput = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
-            if (userInput == "y" and mode == "Edit"):
-                oldCustName = record.get_customer_name()
-                self.edit_record(record)
-                if (oldCustName != record.get_customer_name()):
-                    self.__bst_root.move_node(record)
-            elif (userInput == "y" and mode == "Delete"):
-                self.delete_record(index=dbIndex)
-                self.__bst_root.delete(record)
+        records = self.__db[lowIndex:highIndex + 1] if (lowIndex != -1) else []
+        return self.__handle_search_results(records, mode, "package", packageName)
 
-    def search_for_range_of_cost(self, low:int, high:int) -> None:
+    def search_for_range_of_cost(self, low:int, high:int, typeOfSearch:str="index") -> None:
         """
-        Do a binary search or a linear search on the database for the range of cost specified by the user to satisfy the basic function c.7. criteria
+        Search for the records within the range of cost specified by the user to satisfy the basic function c.7. criteria
+        
+        The number of bookings in the range and their total and average revenue are found with the sorted index 
+        of the package costs in O(log m + b) and the pages of the records are only collected from the index by their position
+        when they are displayed without re-sorting the database (or with indexed SQL queries/a scan of the columns 
+        in the other modes). The records are displayed in ascending order of their cost.
+        
+        Alternatively, the array of records can be sorted with a radix sort and then binary searched for the range of cost,
+        in which case the records are displayed in the order of the array.
         
         Requires 2 arguments:
         - low (int)
         - high (int)
+        
+        Optional argument:
+        - typeOfSearch (string): "index" or "binary", defaults to "index"
         """
-        if (self.__sort_order != COST_PER_PAX and len(self.__db) > 1):
-            # sort and call itself again
-            reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package cost per pax as it is currently not sorted in the correct order!")
-            print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
+        if (typeOfSearch not in ("index", "binary")):
+            raise ValueError(f"Invalid type of search, {typeOfSearch}, in search_for_range_of_cost()")
+
+        # the range is converted to cents once so that it is compared with the stored integers directly
+        lowInCents, highInCents = convert_to_cents(low), convert_to_cents(high)
+        if (self.__sql_con is not None):
+            # indexed SQL queries on the cost per pax in the SQL query mode
+            records = self.__get_sql_pages(where=RANGE_OF_COST_CONDITION, params=(lowInCents, highInCents), orderBy=COST_PER_PAX)
+            totalRevenue = query_total_revenue(self.__sql_con, RANGE_OF_COST_CONDITION, (lowInCents, highInCents))
+        elif (self.__columnar):
+            # scan the cost per pax column in the columnar mode
+            records = self.__db.search_for_range_of_cost(lowInCents, highInCents)
+            totalRevenue = sum(map(total_cost_in_cents_key, records))
+        elif (typeOfSearch == "binary"):
+            if (self.__sort_order != COST_PER_PAX and len(self.__db) > 1):
+                # sort and call itself again
+                reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package cost per pax as it is currently not sorted in the correct order!")
+                self.sort_by_package_cost(reverseOrder, typeOfSort="radix")
+                print()
+                return self.search_for_range_of_cost(low, high, typeOfSearch=typeOfSearch)
+
+            lowIndex, highIndex = binary_search_for_range_of_cost(self.__db, lowInCents, highInCents, self.__descending_order)
+            records = self.__db[lowIndex:highIndex + 1] if (lowIndex != -1) else []
+            totalRevenue = sum(map(total_cost_in_cents_key, records))
+        else:
+            # the range of cost is mapped to the range of positions of the records in the sorted index of the package costs
+            start, stop = self.__cost_index.bisect_left(lowInCents), self.__cost_index.bisect_right(highInCents)
+            records = CostRangePages(self.__cost_index, start, stop)
+            totalRevenue = self.__cost_index.range_weight(start, stop)
+
+        if (not records):
+            if (low == high):
+                print(f"{F.LIGHTRED_EX}No packages found with the cost, {format_price(low)}!")
+            else:
+                print(f"{F.LIGHTRED_EX}No packages found with a cost between {format_price(low)} and {format_price(high)}!")
             S_reset()
-            radix_sort(self.__db, reverse=reverseOrder)
-            self.__descending_order = reverseOrder
+        else:
+            print(f"\n{F.LIGHTGREEN_EX}{'One record' if (len(records) == 1) else 'Multiple records'} found within the specified range of cost, {format_price(low)} to {format_price(high)}!")
+            S_reset()
+            print(f"Number of bookings: {len(records)}")
+            print(f"Total revenue: {format_price(totalRevenue / 100)}")
+            print(f"Average revenue per booking: {format_price(totalRevenue / 100 / len(records))}")
+            self.print_from_array(records)
+            print()
 
-            print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package cost per pax in {'ascending' if (not reverseOrder) else 'descending'} order!")
+    def __handle_search_results(self, records:Union[SQLRecordPages, list], mode:str, typeOfSearch:str, target:str) -> Union[None, int]:
+        """
+        Display, edit, or delete the records returned from a SQL query in the SQL query mode,
+        from a scan of the columns in the columnar mode, or from a search of the sorted indexes
+        
+        Requires 4 arguments:
+        - records (SQLRecordPages/list): the records that matched the SQL query, the ColumnarRecord views, or the RecordData objects
+        - mode (str): "Edit" or "Display" or "Delete"
+        - typeOfSearch (str): "customer" or "package"
+        - target (str): the customer/package name that was searched for
+        """
+        if (not records):
+            print(f"{F.LIGHTRED_EX}No records found with the {typeOfSearch} name, {target}!")
             S_reset(nl=True)
-            self.__sort_order = COST_PER_PAX
-            return self.search_for_range_of_cost(low, high)
-        else:
-            indexOne, indexTwo = binary_search_for_range_of_cost(self.__db, low, high, self.__descending_order)
-            if (indexOne == -1 and indexTwo == -1):
-                if (low == high):
-                    print(f"{F.LIGHTRED_EX}No packages found with the cost, {format_price(low)}!")
-                else:
-                    print(f"{F.LIGHTRED_EX}No packages found with a cost between {format_price(low)} and {format_price(high)}!")
-                S_reset()
-            else:
-                foundRecordsStr = "One record"
-                if (indexTwo - indexOne >= 1): 
-                    # >= 1 since if the difference is 0, it means there is only one record, 
-                    # but if the difference is 1 or more, there are 2 or more records matched
-                    foundRecordsStr = "Multiple records"
+            return -1
 
-                print(f"\n{F.LIGHTGREEN_EX}{foundRecordsStr} found within the specified range of cost, {format_price(low)} to {format_price(high)}!")
-                S_reset(nl=True)
-                self.print_from_index(indexOne, indexTwo)
+        if (mode == "Display"):
+            self.print_from_array(records)
+            return
+
+        _, recordId = self.get_index_from_list(data=records, mode=typeOfSearch, typeOfOperations=mode, target=target)
+        if (recordId == -1):
+            return
+
+        print(self.get_record(recordId))
+        userInput = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
+        if (userInput == "y" and mode == "Edit"):
+            self.edit_record(self.get_record(recordId))
+        elif (userInput == "y" and mode == "Delete"):
+            self.delete_record(recordId=recordId)
 
     def print_from_array(self, arr:list) -> None:
         """
@@ -720,7 +2141,7 @@ X. Exit
         Pagination is an added feature.
         
         Requires one argument:
-        - arr (list)
+        - arr (list): can also be a SQLRecordPages object in the SQL query mode
         """
         print()
         if (len(arr) > 0):
@@ -734,8 +2155,7 @@ X. Exit
 
             header = f"| {noHeader:^{noLen}} | {'Customer Name':^{self.__table_len[0]}} | {'Package Name':^{self.__table_len[1]}} | {'Cost Per Pax':^{self.__table_len[2]}} | {'Number of Pax':^{self.__table_len[3]}} |"
 
-            # default rows to print per page, change at own will
-            rowsToPrint = 10
+            rowsToPrint = ROWS_PER_PAGE
             
             # initialise some variables
             counter = 0 # used for the for loop range arguments
@@ -845,6 +2265,7 @@ X. Exit
         self.print_from_array(self.__db[startIndex:endIndex + 1])
         print()
 
+    @synchronised
     def easter_egg_sorts(self, typeOfSort:str=None) -> None:
         """
         Method to sort the database using different non-sensical sorts such as bogosort
@@ -855,6 +2276,11 @@ X. Exit
         if (not NOOB_SORTS_INFO_DICT.get(typeOfSort)):
             raise ValueError(f"Error: {typeOfSort} is not a valid sort type in easter_egg_sorts()")
 
+        if (self.__sql_con is not None or self.__columnar):
+            print(f"{F.LIGHTRED_EX}Notice: This sorting algorithm is not available in the {'SQL query' if (self.__sql_con is not None) else 'columnar'} mode...")
+            S_reset()
+            return
+
         reverseOrder = get_descending_flag(nl=True)
 
         if (NOOB_SORTS_INFO_DICT[typeOfSort] == self.__sort_order and self.__descending_order == reverseOrder):
@@ -880,7 +2306,16 @@ X. Exit
                 return
         elif (typeOfSort == "stalinsort"):
             # sorts by customer name
-            self.__db = stalin_sort(self.__db, reverse=reverseOrder)
+            sortedArr = stalin_sort(self.__db, reverse=reverseOrder)
+
+            # records that are not in the correct order are deleted by stalin sort,
+            # hence remove them from the record index and the sorted indexes and track them as deleted records
+            keptRecords = set(sortedArr)
+            for record in self.__db:
+                if (record not in keptRecords):
+                    self.__unindex_record(record)
+                    self.__mark_as_deleted(record)
+            self.__db = sortedArr
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by customer name in {'ascending' if (not reverseOrder) else 'descending'} order!")
             S_reset()
         elif (typeOfSort == "slowsort"):
@@ -909,6 +2344,7 @@ X. Exit
         self.__descending_order = reverseOrder
         self.__sort_order = NOOB_SORTS_INFO_DICT[typeOfSort]
 
+    @synchronised
     def pancake_sort_records(self, mode:str=None) -> None:
         """
         Method to sort the database using pancake sort
@@ -919,33 +2355,38 @@ X. Exit
         if (mode is None):
             raise ValueError(f"Error: {mode} is not a valid mode type in pancake_sort_records()")
 
+        if (self.__sql_con is not None or self.__columnar):
+            print(f"{F.LIGHTRED_EX}Notice: Pancake sort is not available in the {'SQL query' if (self.__sql_con is not None) else 'columnar'} mode...")
+            S_reset()
+            return
+
         reverseOrder = get_descending_flag(nl=True)
         print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
         S_reset()
         if (mode == "customerName"):
             # sorts by customer name
-            pancake_sort(self.__db, reverse=reverseOrder, mode="customerName")
+            pancake_sort(self.__db, reverse=reverseOrder, key=CUSTOMER_NAME_KEY)
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by customer name in {'ascending' if (not reverseOrder) else 'descending'} order!")
 
             self.__sort_order = CUST_NAME
 
         elif (mode == "packageName"):
             # sorts by package name
-            pancake_sort(self.__db, reverse=reverseOrder, mode="packageName")
+            pancake_sort(self.__db, reverse=reverseOrder, key=PACKAGE_NAME_KEY)
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package name in {'ascending' if (not reverseOrder) else 'descending'} order!")
 
             self.__sort_order = PACKAGE_NAME
 
         elif (mode == "costPerPax"):
             # sorts by package cost per pax
-            pancake_sort(self.__db, reverse=reverseOrder, mode="costPerPax")
+            pancake_sort(self.__db, reverse=reverseOrder, key=COST_IN_CENTS_KEY)
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package cost in {'ascending' if (not reverseOrder) else 'descending'} order!")
 
             self.__sort_order = COST_PER_PAX
 
         elif (mode == "paxNum"):
             # sorts by pax number
-            pancake_sort(self.__db, reverse=reverseOrder, mode="paxNum")
+            pancake_sort(self.__db, reverse=reverseOrder, key=PAX_NUM_KEY)
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by the number of pax in {'ascending' if (not reverseOrder) else 'descending'} order!")
 
             self.__sort_order = PAX_NUM
@@ -960,10 +2401,71 @@ X. Exit
         Return the database array
 
         Returns:
-        list: get the array of records
+        list: get the array of records (or the ColumnarRecords object in the columnar mode)
         """
         return self.__db
 
+    @property
+    def lock(self) -> RLock:
+        """
+        Return the lock of the database
+
+        Returns:
+        RLock: the lock to hold while reading or changing the records from another thread
+        """
+        return self.__lock
+
+    @property
+    def journal(self):
+        """
+        Return the attached journal of the changes
+
+        Returns:
+        MutationJournal: the journal or None if the changes are not journalled
+        """
+        return self.__journal
+
+    @property
+    def sql_query_mode(self) -> bool:
+        """
+        Return whether the database is in the SQL query mode
+
+        Returns:
+        bool: True if the records are queried from the sqlite3 database file instead of memory
+        """
+        return self.__sql_con is not None
+
+    @property
+    def columnar_mode(self) -> bool:
+        """
+        Return whether the database is in the columnar mode
+
+        Returns:
+        bool: True if the records are stored in packed columns instead of an array of RecordData objects
+        """
+        return self.__columnar
+
+    @property
+    def in_memory_mode(self) -> bool:
+        """
+        Return whether the database is in the SQL query mode on an in-memory sqlite3 database
+
+        Returns:
+        bool: True if the records are queried from an in-memory database which has to be backed up 
+              to the sqlite3 database file to save the changes
+        """
+        return self.__sql_con is not None and is_in_memory_db(self.__sql_con)
+
+    @property
+    def sql_con(self) -> sqlite3.Connection:
+        """
+        Return the sqlite3 connection of the SQL query mode
+
+        Returns:
+        sqlite3.Connection: the connection or None if not in the SQL query mode
+        """
+        return self.__sql_con
+
     @property
     def descending_flag(self) -> bool:
         """
@@ -1005,11 +2507,20 @@ X. Exit
         self.__sort_order = sort_order
 
     def __str__(self) -> str:
-        self.print_from_array(self.__db)
+        if (self.__sql_con is not None):
+            self.print_from_array(self.__get_sql_pages())
+        else:
+            self.print_from_array(self.__db)
         return ""
 
     def __len__(self) -> int:
-        return len(self.__db)
+        if (self.__sql_con is not None):
+            if (self.__sql_len is None):
+                self.__sql_len = count_records(self.__sql_con)
+            return self.__sql_len
+        if (self.__columnar):
+            return len(self.__db)
+        return len(self.__record_index)
 
 # test codes
 if (__name__ == "__main__"):
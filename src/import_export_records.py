@@ -0,0 +1,288 @@
+"""
+This file is not part of the main program.
+However, it is used to import records from or export records to CSV and JSONL files.
+
+The records are streamed in fixed-size chunks through generators so that millions of records
+can be imported or exported without holding all of them in memory at once.
+
+Usage:
+    python import_export_records.py import <file path> [--format csv|jsonl] [--chunk-size N] [--replace]
+    python import_export_records.py export <file path> [--format csv|jsonl] [--chunk-size N]
+
+Each record has the following fields (which are also the CSV header):
+    packageName, customerName, paxNum, costPerPax
+"""
+
+# import third-party libraries
+from colorama import init as coloramaInit
+from colorama import Fore as F
+
+# import local python files
+from hotel_record import NUM_REGEX, COST_REGEX
+from functions import replay_journal, promote_background_save, fetch_rows_in_batches, check_if_db_file_exists, \
+                      get_staycation_records_type, increment_db_file_version, write_db_tables, convert_to_cents, S_reset, \
+                      DB_CONNECTION, STAYCATION_RECORDS_TABLE, HOTEL_DATABASE_CONFIG_TABLE, DB_FETCH_BATCH_SIZE, NOT_SORTED
+
+# import standard libraries
+import re, csv, json, pathlib, platform, argparse
+from itertools import islice
+from sys import exit as sysExit
+
+# the fields of each record in the same order as the HotelDatabase's add_record arguments
+RECORD_FIELDS = ("packageName", "customerName", "paxNum", "costPerPax")
+
+# supported file formats
+FILE_FORMATS = ("csv", "jsonl")
+
+# maximum number of invalid rows to print when importing
+MAX_INVALID_ROWS_TO_PRINT = 10
+
+def get_file_format(filePath:pathlib.Path, fileFormat:str=None) -> str:
+    """
+    Returns the file format from the argument or the file extension
+
+    Requires one argument:
+    - filePath (pathlib.Path)
+
+    Optional argument:
+    - fileFormat (str): "csv" or "jsonl", defaults to None to use the file extension
+    """
+    if (fileFormat is None):
+        fileFormat = filePath.suffix.lstrip(".").lower()
+        if (fileFormat == "json" or fileFormat == "ndjson"):
+            fileFormat = "jsonl"
+
+    if (fileFormat not in FILE_FORMATS):
+        raise ValueError(f"Unsupported file format \"{fileFormat}\", please use one of {', '.join(FILE_FORMATS)}.")
+    return fileFormat
+
+def read_csv_rows(f):
+    """
+    Generator to yield (line number, row) from the CSV file where each row is a dictionary of the record fields
+
+    Requires one argument:
+    - f (file object): the opened CSV file
+    """
+    reader = csv.DictReader(f)
+    missingFields = set(RECORD_FIELDS).difference(reader.fieldnames or ())
+    if (missingFields):
+        raise ValueError(f"The CSV header is missing the field(s): {', '.join(sorted(missingFields))}")
+
+    for row in reader:
+        yield reader.line_num, row
+
+def read_jsonl_rows(f):
+    """
+    Generator to yield (line number, row) from the JSONL file where each row is a dictionary of the record fields
+
+    Requires one argument:
+    - f (file object): the opened JSONL file
+    """
+    for lineNum, line in enumerate(f, start=1):
+        if (not line.strip()):
+            continue
+        try:
+            row = json.loads(line)
+        except (json.JSONDecodeError):
+            row = None
+        yield lineNum, row if (isinstance(row, dict)) else {}
+
+def chunked(iterable, chunkSize:int):
+    """
+    Generator to yield lists of up to chunkSize elements from the iterable
+
+    Requires two arguments:
+    - iterable (iterable)
+    - chunkSize (int)
+    """
+    iterator = iter(iterable)
+    while (1):
+        chunk = list(islice(iterator, chunkSize))
+        if (not chunk):
+            return
+        yield chunk
+
+def validate_chunk(chunk:list) -> tuple:
+    """
+    Validate a chunk of rows in bulk
+
+    A row is valid if the package name and customer name are not empty,
+    the number of pax is an integer more than 0, and the cost per pax is a valid price.
+
+    Requires one argument:
+    - chunk (list): the array of (line number, row) tuples
+
+    Returns a tuple of (array of valid rows in the same order as the HotelDatabase's bulk_load rows,
+    array of the line numbers of the invalid rows)
+    where the names of the valid rows are title-cased like the RecordData objects' names
+    """
+    # convert the values to stripped strings first as the values in JSONL rows can be numbers
+    values = [(lineNum, [str(row.get(field, "")).strip() for field in RECORD_FIELDS]) for lineNum, row in chunk]
+
+    validRows = []
+    invalidLineNums = []
+    for lineNum, (packageName, customerName, paxNum, costPerPax) in values:
+        if (packageName and customerName and re.fullmatch(NUM_REGEX, paxNum) and int(paxNum) > 0 \
+            and re.fullmatch(COST_REGEX, costPerPax)):
+            validRows.append((packageName.title(), customerName.title(), int(paxNum), convert_to_cents(costPerPax), None))
+        else:
+            invalidLineNums.append(lineNum)
+    return validRows, invalidLineNums
+
+def import_records(filePath:pathlib.Path, fileFormat:str=None, chunkSize:int=DB_FETCH_BATCH_SIZE, replace:bool=False) -> int:
+    """
+    Import the records from the CSV or JSONL file into the database file
+
+    Each validated chunk is inserted into the staycation records table directly with executemany
+    instead of loading the records into a HotelDatabase object, hence only one chunk is held in memory.
+    All the chunks are inserted in a single transaction so that the database file is never left
+    with only some of the records if an error occurs while reading the file.
+
+    The journal is replayed into the database file first and the version of the database file is incremented
+    with the import so that a journal started on the previous version is never replayed over the imported records.
+
+    Requires one argument:
+    - filePath (pathlib.Path)
+
+    Optional arguments:
+    - fileFormat (str): "csv" or "jsonl", defaults to None to use the file extension
+    - chunkSize (int): the number of rows to validate and insert at a time, defaults to DB_FETCH_BATCH_SIZE
+    - replace (bool): to replace the existing records instead of adding to them, defaults to False
+
+    Returns the number of records imported.
+    """
+    fileFormat = get_file_format(filePath, fileFormat)
+
+    # fold the completed background save and the changes that were not saved 
+    # before the program was terminated into the database file (the journal files are deleted)
+    promote_background_save()
+    replay_journal()
+
+    numOfImported = 0
+    invalidLineNums = []
+    with DB_CONNECTION as con:
+        if (replace or get_staycation_records_type(con) is None):
+            # create the empty tables (or empty the existing ones while keeping the current schema)
+            write_db_tables(con, [], (NOT_SORTED, False))
+
+        with open(filePath, "r", encoding="utf-8", newline="") as f, con:
+            rows = read_csv_rows(f) if (fileFormat == "csv") else read_jsonl_rows(f)
+            for chunk in chunked(rows, chunkSize):
+                validRows, invalidChunkLineNums = validate_chunk(chunk)
+                con.executemany(
+                    f"INSERT INTO {STAYCATION_RECORDS_TABLE} (customerName, packageName, paxNum, costPerPax) VALUES (?, ?, ?, ?)",
+                    [(customerName, packageName, paxNum, costInCents) for packageName, customerName, paxNum, costInCents, _ in validRows]
+                )
+                numOfImported += len(validRows)
+                invalidLineNums.extend(invalidChunkLineNums[:MAX_INVALID_ROWS_TO_PRINT - len(invalidLineNums)])
+                if (len(invalidChunkLineNums) > 0):
+                    print(f"{F.LIGHTRED_EX}Skipped {len(invalidChunkLineNums)} invalid row(s) in the chunk ending at line {chunk[-1][0]}.")
+                    S_reset()
+
+            # the imported records are appended after the saved order of the records
+            con.execute(f"UPDATE {HOTEL_DATABASE_CONFIG_TABLE} SET sortingOrder = ?", (NOT_SORTED,))
+            increment_db_file_version(con)
+
+    if (invalidLineNums):
+        print(f"{F.LIGHTRED_EX}Invalid rows found at line(s): {', '.join(map(str, invalidLineNums))}{'...' if (len(invalidLineNums) == MAX_INVALID_ROWS_TO_PRINT) else ''}")
+        S_reset()
+
+    print(f"{F.LIGHTGREEN_EX}Imported {numOfImported} records from \"{filePath}\"!")
+    S_reset()
+    return numOfImported
+
+def write_csv_chunk(writer, chunk:list) -> None:
+    """
+    Write the chunk of (packageName, customerName, paxNum, costPerPax) rows to the CSV writer
+    """
+    writer.writerows((packageName, customerName, paxNum, f"{costPerPax:.2f}") \
+                     for packageName, customerName, paxNum, costPerPax in chunk)
+
+def write_jsonl_chunk(f, chunk:list) -> None:
+    """
+    Write the chunk of (packageName, customerName, paxNum, costPerPax) rows to the JSONL file
+    """
+    f.writelines(json.dumps(dict(zip(RECORD_FIELDS, (packageName, customerName, paxNum, round(costPerPax, 2)))), separators=(",", ":")) + "\n" \
+                 for packageName, customerName, paxNum, costPerPax in chunk)
+
+def export_records(filePath:pathlib.Path, fileFormat:str=None, chunkSize:int=DB_FETCH_BATCH_SIZE) -> int:
+    """
+    Export the records from the database file to the CSV or JSONL file in their saved order.
+
+    The records are streamed from the database file directly instead of loading them into a HotelDatabase object.
+
+    Requires one argument:
+    - filePath (pathlib.Path)
+
+    Optional arguments:
+    - fileFormat (str): "csv" or "jsonl", defaults to None to use the file extension
+    - chunkSize (int): the number of rows to fetch and write at a time, defaults to DB_FETCH_BATCH_SIZE
+
+    Returns the number of records exported.
+    """
+    fileFormat = get_file_format(filePath, fileFormat)
+    if (not check_if_db_file_exists()):
+        print(f"{F.LIGHTRED_EX}No database file found, there are no records to export!")
+        S_reset()
+        return 0
+
+    # fold the changes that were not saved before the program was terminated into the database file
+    replay_journal()
+
+    numOfExported = 0
+    with DB_CONNECTION as con:
+        cur = con.execute(f"SELECT packageName, customerName, paxNum, costPerPax / 100.0 FROM {STAYCATION_RECORDS_TABLE} ORDER BY ROWID ASC")
+        with open(filePath, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if (fileFormat == "csv"):
+                writer.writerow(RECORD_FIELDS)
+
+            for chunk in chunked(fetch_rows_in_batches(cur, chunkSize), chunkSize):
+                if (fileFormat == "csv"):
+                    write_csv_chunk(writer, chunk)
+                else:
+                    write_jsonl_chunk(f, chunk)
+                numOfExported += len(chunk)
+
+    print(f"{F.LIGHTGREEN_EX}Exported {numOfExported} records to \"{filePath}\"!")
+    S_reset()
+    return numOfExported
+
+def main() -> int:
+    """
+    This program helps to import and export the records as CSV or JSONL files!
+    """
+    parser = argparse.ArgumentParser(description="Import or export Waffle Hotel's staycation booking records as CSV or JSONL files.")
+    parser.add_argument("action", choices=("import", "export"))
+    parser.add_argument("filePath", type=pathlib.Path, help="the path of the CSV or JSONL file")
+    parser.add_argument("--format", dest="fileFormat", choices=FILE_FORMATS, default=None,
+                        help="the file format, defaults to the file extension")
+    parser.add_argument("--chunk-size", dest="chunkSize", type=int, default=DB_FETCH_BATCH_SIZE,
+                        help=f"the number of rows to process at a time, defaults to {DB_FETCH_BATCH_SIZE}")
+    parser.add_argument("--replace", action="store_true",
+                        help="replace the existing records instead of adding to them when importing")
+    args = parser.parse_args()
+
+    if (args.chunkSize < 1):
+        parser.error("--chunk-size must be at least 1")
+
+    try:
+        if (args.action == "import"):
+            import_records(args.filePath, fileFormat=args.fileFormat, chunkSize=args.chunkSize, replace=args.replace)
+        else:
+            export_records(args.filePath, fileFormat=args.fileFormat, chunkSize=args.chunkSize)
+    except (ValueError, OSError) as e:
+        print(f"{F.LIGHTRED_EX}Error: {e}")
+        S_reset()
+        return 1
+    return 0
+
+if (__name__ == "__main__"):
+    if (platform.system() == "Windows"):
+        # colorama to escape the ANSI escape sequences for Windows systems.
+        # Remove this block of code if it does not escape the ASNI escape sequences
+        # as some Windows systems may have in-built support for it
+        # which can interfere with the colorama initialise function
+        coloramaInit(autoreset=False, convert=True)
+
+    sysExit(main())
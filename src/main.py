@@ -16,22 +16,84 @@ import re, platform
 # import local python files
 from functions import S_reset, read_db_file, print_main_menu, print_sub_menu, get_input, log_error, \
                       countdown, shutdown, get_range, save_db_file, get_descending_flag, format_price, \
-                      dbFileError
+                      dbFileError, open_journal
 from hotel_record import print_record_data, NUM_REGEX, COST_REGEX
+from autosave import AutosaveThread
+from background_save import start_background_save
 
 DEBUG_FLAG = False
 PREINIT_TEN_RECORDS_FLAG = True
+SQL_QUERY_MODE_FLAG = False # if True, the records will stay in the database file and only the page of records
+                            # being displayed will be loaded into memory (for databases larger than memory)
+COLUMNAR_SNAPSHOT_FLAG = False # if True, a memory-mappable columnar snapshot of the records will be written 
+                               # besides the database file on save and loaded on startup if it is up to date
+MUTATION_JOURNAL_FLAG = True # if True, every change will be appended to a journal file so that the changes 
+                             # are restored on the next run even if the program is not exited with the menu
+AUTOSAVE_FLAG = False # if True, the changes will be saved to the database file periodically by a background thread
+NORMALISED_SCHEMA_FLAG = False # if True, the package and customer names will be stored once in lookup tables and the
+                               # records will only store their ids (the database file is converted when exiting)
+SHARDED_DB_FLAG = False # if True, the records will be saved to a directory of database files (shards) that are loaded
+                        # and saved in parallel instead (the SQL query mode, journal, and autosave are not used)
+BACKGROUND_SAVE_FLAG = False # if True, the journal will be compacted by a forked child process that writes a new database file
+                             # while the menu continues (only used if autosave is off and os.fork() is supported)
+IN_MEMORY_DB_FLAG = False # if True, the records will be kept in an in-memory SQLite database with the SQL query mode's
+                          # indexed queries and backed up to the database file on save (the journal is not used)
+COLUMNAR_STORE_FLAG = False # if True, the records will be stored in packed columns instead of RecordData objects
+                            # and sorted and searched on the columns (the easter egg and pancake sorts are not available)
+CUSTOMER_BLOOM_FILTER_FLAG = False # if True, a Bloom filter of the customer names will be built so that the searches for
+                                   # a customer name that no record has are answered without searching the records
 PANCAKE_MENU_HEADER = "Notice: You have opened the pancake sort menu!"
 
 def main() -> None:
-    hotelDB = read_db_file(preintialiseData=PREINIT_TEN_RECORDS_FLAG)
+    hotelDB = read_db_file(preintialiseData=PREINIT_TEN_RECORDS_FLAG, sqlQueryMode=SQL_QUERY_MODE_FLAG, \
+                           useSnapshot=COLUMNAR_SNAPSHOT_FLAG, sharded=SHARDED_DB_FLAG, inMemory=IN_MEMORY_DB_FLAG, \
+                           columnar=COLUMNAR_STORE_FLAG)
+    if (MUTATION_JOURNAL_FLAG and not hotelDB.sql_query_mode and not SHARDED_DB_FLAG):
+        # the changes are already written directly to the database file in the SQL query mode
+        open_journal(hotelDB)
+
+    if (CUSTOMER_BLOOM_FILTER_FLAG):
+        hotelDB.enable_customer_bloom_filter()
+
+    autosaveThread = None
+    if (AUTOSAVE_FLAG and not hotelDB.sql_query_mode and not SHARDED_DB_FLAG):
+        autosaveThread = AutosaveThread(hotelDB)
+        autosaveThread.start()
+
+    backgroundSave = None
     uInput = ""
     while (uInput != "x"):
+        if (backgroundSave is not None and backgroundSave.poll() is not None):
+            # the background save has finished and the database file has been replaced
+            backgroundSave = None
+
+        if (hotelDB.journal is not None and hotelDB.journal.needs_compaction and backgroundSave is None):
+            # compact the journal by saving its changes to the database file
+            if (autosaveThread is not None):
+                autosaveThread.flush()
+            elif (BACKGROUND_SAVE_FLAG):
+                backgroundSave = start_background_save(hotelDB)
+            else:
+                save_db_file(hotelDB, printSuccessMsg=False, writeSnapshot=COLUMNAR_SNAPSHOT_FLAG)
+
         print_main_menu(len(hotelDB), sortOrder=hotelDB.sort_order)
         uInput = get_input(prompt="Enter command: ", command=("1", "2", "3", "4", "5", "x"), warning="Invalid command input, please enter a valid command from the menu above...")
 
         if (uInput == "x"): 
-            save_db_file(hotelDB)
+            fullRewrite = False
+            if (autosaveThread is not None):
+                autosaveThread.stop()
+                fullRewrite = autosaveThread.rewrite_required
+                if (DEBUG_FLAG):
+                    print(f"Autosave metrics: {autosaveThread.get_metrics()}")
+            if (backgroundSave is not None):
+                # the database file must not be changed while the child process is writing the new database file
+                backgroundSave.wait()
+
+            save_db_file(hotelDB, fullRewrite=fullRewrite, writeSnapshot=COLUMNAR_SNAPSHOT_FLAG, \
+                         normalisedSchema=NORMALISED_SCHEMA_FLAG, sharded=SHARDED_DB_FLAG)
+            if (hotelDB.journal is not None):
+                hotelDB.journal.close()
             shutdown()
 
         elif (uInput == "1"):
@@ -43,15 +105,16 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(1)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "5", "6", "7", "8", "9", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
                     if (subInput == "1"):
                         # To satisfy basic function c.1
                         # display all records
                         print(hotelDB)
-                    elif (subInput == "2"):
+                    elif (subInput == "2" or subInput == "8"):
                         # To satisfy basic function c.7
                         # display records range from $X to $Y. e.g $100-200 (Not total cost 
                         # but the cost per pax range)
+                        typeOfSearch = "index" if (subInput == "2") else "binary"
                         print()
                         while (1):
                             print("Please enter the range of cost per pax number you want to display in the format, $100-200...")
@@ -63,7 +126,7 @@ def main() -> None:
                                 print(f"{F.LIGHTRED_EX}Invalid range input, please enter in a \"$10-100\" format...")
                                 S_reset(nl=True)
                             else:
-                                hotelDB.search_for_range_of_cost(formattedRange[0], formattedRange[1])
+                                hotelDB.search_for_range_of_cost(formattedRange[0], formattedRange[1], typeOfSearch=typeOfSearch)
 
                                 searchAgainPrompt = get_input(prompt="Would you like to search again? (y/n): ", command=("y", "n"))
                                 if (searchAgainPrompt == "n"):
@@ -89,9 +152,10 @@ def main() -> None:
                                         searchAgainPrompt = "x"
                             else:
                                 searchAgainPrompt = "x"
-                    elif (subInput == "4"):
+                    elif (subInput == "4" or subInput == "9"):
                         # newly added
                         # search for records that matches the specified package name
+                        typeOfSearch = "index" if (subInput == "4") else "fibonacci"
                         print()
                         searchAgainPrompt = ""
                         while (searchAgainPrompt != "x"):
@@ -101,7 +165,46 @@ def main() -> None:
                                 print(f"{F.LIGHTRED_EX}Error: Please provide a package name...")
                                 S_reset(nl=True)
                             elif (packageInput.lower() != "x"):
-                                success = hotelDB.search_for_package(packageInput, mode="Display")
+                                success = hotelDB.search_for_package(packageInput, mode="Display", typeOfSearch=typeOfSearch)
+                                if (success != -1):
+                                    searchAgainPrompt = get_input(prompt="Would you like to search again? (y/n): ", command=("y", "n"))
+                                    if (searchAgainPrompt == "n"):
+                                        searchAgainPrompt = "x"
+                            else:
+                                searchAgainPrompt = "x"
+                    elif (subInput == "5"):
+                        # newly added
+                        # suggest the customer names that start with the specified letters
+                        print()
+                        searchAgainPrompt = ""
+                        while (searchAgainPrompt != "x"):
+                            prefixInput = input("Enter the first letters of the customer name (x to cancel): ").strip()
+
+                            if (prefixInput == ""):
+                                print(f"{F.LIGHTRED_EX}Error: Please provide the first letters of a customer name...")
+                                S_reset(nl=True)
+                            elif (prefixInput.lower() != "x"):
+                                success = hotelDB.search_for_customer_prefix(prefixInput)
+                                if (success != -1):
+                                    searchAgainPrompt = get_input(prompt="Would you like to search again? (y/n): ", command=("y", "n"))
+                                    if (searchAgainPrompt == "n"):
+                                        searchAgainPrompt = "x"
+                            else:
+                                searchAgainPrompt = "x"
+                    elif (subInput == "6" or subInput == "7"):
+                        # newly added
+                        # search for records with a customer/package name that is similar to the specified name (e.g. with typos)
+                        typeOfSearch = "customer" if (subInput == "6") else "package"
+                        print()
+                        searchAgainPrompt = ""
+                        while (searchAgainPrompt != "x"):
+                            nameInput = input(f"Enter {typeOfSearch} name (x to cancel): ").strip()
+
+                            if (nameInput == ""):
+                                print(f"{F.LIGHTRED_EX}Error: Please provide a {typeOfSearch} name...")
+                                S_reset(nl=True)
+                            elif (nameInput.lower() != "x"):
+                                success = hotelDB.fuzzy_search_for_name(nameInput, typeOfSearch=typeOfSearch)
                                 if (success != -1):
                                     searchAgainPrompt = get_input(prompt="Would you like to search again? (y/n): ", command=("y", "n"))
                                     if (searchAgainPrompt == "n"):
@@ -207,7 +310,7 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(3)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
                     if (subInput == "1"):
                         # To satisfy basic function c.5
                         # Search record by Customer Name using Linear Search and update record
@@ -221,9 +324,10 @@ def main() -> None:
                             else:
                                 hotelDB.search_for_customer(customerName, mode="Edit", bonus=False)
 
-                    elif (subInput == "2"):
+                    elif (subInput == "2" or subInput == "3"):
                         # To satisfy basic function c.6
                         # Search record by Package Name using Binary Search and update record
+                        typeOfSearch = "index" if (subInput == "2") else "binary"
                         while (1):
                             packageName = input("Enter the package name (F to cancel): ").lower().strip()
                             if (packageName == "f"):
@@ -232,7 +336,7 @@ def main() -> None:
                                 print(f"{F.LIGHTRED_EX}Package name cannot be empty, please enter a valid package name...")
                                 S_reset()
                             else:
-                                hotelDB.search_for_package(packageName, mode="Edit")
+                                hotelDB.search_for_package(packageName, mode="Edit", typeOfSearch=typeOfSearch)
 
         elif (uInput == "4"):
             # sort options
@@ -243,34 +347,38 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(4)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "noob", "pancake", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
-                    if (subInput == "1"):
-                        # sort by customer name using bubble sort
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "5", "6", "7", "8", "noob", "pancake", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    if (subInput == "1" or subInput == "5"):
+                        # sort by customer name using tree sort on the AVL tree of the customer names
+                        # or using bubble sort on the array of records
                         sortConfirmation = get_input(prompt="Do you want to sort the records by customer name? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
                             # To satisfy basic function c.2
-                            hotelDB.sort_by_customer_name(get_descending_flag(nl=True), typeOfSort="bubble")
+                            hotelDB.sort_by_customer_name(get_descending_flag(nl=True), typeOfSort="tree" if (subInput == "1") else "bubble")
 
-                    elif (subInput == "2"):
+                    elif (subInput == "2" or subInput == "6"):
                         # To satisfy basic function c.3
-                        # sort by package name using selection sort
+                        # sort by package name using tree sort on the package name index
+                        # or using selection sort on the array of records
                         sortConfirmation = get_input(prompt="Do you want to sort the records by package name? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_package_name(get_descending_flag(nl=True))
+                            hotelDB.sort_by_package_name(get_descending_flag(nl=True), typeOfSort="tree" if (subInput == "2") else "selection")
 
-                    elif (subInput == "3"):
+                    elif (subInput == "3" or subInput == "7"):
                         # To satisfy basic function c.4
-                        # sort by package cost using insertion sort
+                        # sort by package cost using tree sort on the cost index
+                        # or using insertion sort on the array of records
                         sortConfirmation = get_input(prompt="Do you want to sort the records by package cost? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_package_cost(get_descending_flag(nl=True))
+                            hotelDB.sort_by_package_cost(get_descending_flag(nl=True), typeOfSort="tree" if (subInput == "3") else "insertion")
 
-                    elif (subInput == "4"):
+                    elif (subInput == "4" or subInput == "8"):
                         # newly added
-                        # sort by package's number of pax using shellsort
+                        # sort by package's number of pax using tree sort on the pax index
+                        # or using shellsort on the array of records
                         sortConfirmation = get_input(prompt="Do you want to sort the records by pax number? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_pax_num(get_descending_flag(nl=True))
+                            hotelDB.sort_by_pax_num(get_descending_flag(nl=True), typeOfSort="tree" if (subInput == "4") else "shell")
 
                     # easter egg menu (newly added)
                     elif (subInput == "noob"):
@@ -361,7 +469,7 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(5)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
                     
                     if (subInput == "1"):
                         # Delete record by customer name
@@ -382,8 +490,9 @@ def main() -> None:
                                     if (len(hotelDB) < 1):
                                         break
 
-                    elif (subInput == "2"):
+                    elif (subInput == "2" or subInput == "3"):
                         # Delete record by package name
+                        typeOfSearch = "index" if (subInput == "2") else "binary"
                         if (len(hotelDB) < 1):
                             print(f"{F.LIGHTRED_EX}Notice: There are no records to delete...")
                             S_reset(nl=True)
@@ -397,7 +506,7 @@ def main() -> None:
                                     print(f"{F.LIGHTRED_EX}Package name cannot be empty, please enter a valid package name...")
                                     S_reset()
                                 else:
-                                    hotelDB.search_for_package(packageName, mode="Delete")
+                                    hotelDB.search_for_package(packageName, mode="Delete", typeOfSearch=typeOfSearch)
                                     if (len(hotelDB) < 1):
                                         break
 
@@ -413,7 +522,8 @@ if (__name__ == "__main__"):
         try:
             main()
         except (KeyboardInterrupt, EOFError, dbFileError):
-            shutdown(nl=True, abrupt=True)
+            shutdown(nl=True, abrupt=True, journalled=(MUTATION_JOURNAL_FLAG and not SQL_QUERY_MODE_FLAG \
+                                                         and not SHARDED_DB_FLAG and not IN_MEMORY_DB_FLAG))
         except:
             print()
             print(f"{F.LIGHTRED_EX}Unexpected error caught and all changes will be LOST:\n{exc_info()}")
@@ -0,0 +1,257 @@
+"""
+This file contains the append-only journal of the changes made to the records of the HotelDatabase object.
+
+Every record that is added, edited, or deleted is appended to the journal file as a line of JSON
+so that the changes will not be lost if the program does not exit through the menu.
+Upon startup, the journal is folded (replayed) into the sqlite3 database file before the records are loaded.
+
+To keep the appends cheap, the journal file is only fsynced after every JOURNAL_FSYNC_BATCH_SIZE entries
+or if JOURNAL_FSYNC_INTERVAL seconds have passed since the last fsync. Each entry is still flushed
+to the operating system immediately, hence only a power loss can lose the unsynced entries.
+
+The first line of the journal records the version (PRAGMA user_version) of the sqlite3 database file
+that the journal was started on. Since the version is incremented whenever the database file is saved,
+a journal that was not truncated after a save will not be replayed again.
+
+When the changes are saved in the background (see autosave.py), the journal is rotated instead of truncated
+as the save is only committed after the HotelDatabase object is unlocked. The rotated journal is kept until
+the save is committed and the new journal starts on the version that the database file will have afterwards,
+hence the rotated journal and then the new journal will be replayed if the save was not committed.
+
+Journal entries:
+- {"op": "begin", "version": int}
+- {"op": "add", "rowId": int, "customerName": str, "packageName": str, "paxNum": int, "costPerPax": int (in cents)}
+- {"op": "edit", ...same fields as "add"}
+- {"op": "delete", "rowId": int}
+"""
+
+# import standard libraries
+import os, json, pathlib
+from time import monotonic
+
+# number of entries to append before the journal file is fsynced
+JOURNAL_FSYNC_BATCH_SIZE = 32
+
+# maximum number of seconds between each fsync of the journal file if there are unsynced entries
+JOURNAL_FSYNC_INTERVAL = 1.0
+
+# number of entries in the journal before it should be compacted into the sqlite3 database file
+JOURNAL_COMPACTION_THRESHOLD = 1000
+
+def record_to_entry(op:str, record) -> dict:
+    """
+    Returns the journal entry of the record with all of its fields
+
+    Requires two arguments:
+    - op (str): "add" or "edit"
+    - record (RecordData)
+    """
+    return {
+        "op": op,
+        "rowId": record.get_row_id(),
+        "customerName": record.get_customer_name(),
+        "packageName": record.get_package_name(),
+        "paxNum": record.get_pax_num(),
+        "costPerPax": record.get_cost_in_cents()
+    }
+
+def get_rotated_file_path(filePath:pathlib.Path) -> pathlib.Path:
+    """
+    Returns the path of the rotated journal file
+
+    Requires one argument:
+    - filePath (pathlib.Path): the path of the journal file
+    """
+    return filePath.with_name(filePath.name + ".old")
+
+def read_journal(filePath:pathlib.Path):
+    """
+    Generator to yield the entries in the journal file in the order that they were appended.
+
+    Stops at the first line that cannot be decoded as it can only be
+    the last entry that was partially written before the program was terminated.
+
+    Requires one argument:
+    - filePath (pathlib.Path): the path of the journal file
+    """
+    with open(filePath, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError):
+                return
+            if (not isinstance(entry, dict) or "op" not in entry):
+                return
+            yield entry
+
+class MutationJournal:
+    """
+    Creates a MutationJournal object that appends the changes made to the records to the journal file.
+
+    Requires three arguments:
+    - filePath (pathlib.Path): the path of the journal file
+    - dbVersion (int): the version (PRAGMA user_version) of the sqlite3 database file
+    - maxRowId (int): the largest ROWID of the records, used to give the newly added records a ROWID
+
+    Optional arguments:
+    - fsyncBatchSize (int): defaults to JOURNAL_FSYNC_BATCH_SIZE
+    - fsyncInterval (float): defaults to JOURNAL_FSYNC_INTERVAL
+    """
+    def __init__(self, filePath:pathlib.Path, dbVersion:int, maxRowId:int, \
+                 fsyncBatchSize:int=JOURNAL_FSYNC_BATCH_SIZE, fsyncInterval:float=JOURNAL_FSYNC_INTERVAL) -> None:
+        self.__file_path = filePath
+        self.__rotated_file_path = get_rotated_file_path(filePath)
+        self.__file = None
+        self.__fsync_batch_size = fsyncBatchSize
+        self.__fsync_interval = fsyncInterval
+        self.reset(dbVersion, maxRowId)
+
+    def reset(self, dbVersion:int, maxRowId:int=None) -> None:
+        """
+        Truncate the journal file after the changes have been saved to the sqlite3 database file
+
+        Requires one argument:
+        - dbVersion (int): the version of the sqlite3 database file after the save
+
+        Optional argument:
+        - maxRowId (int): the largest ROWID of the records after the save, 
+                          defaults to None to keep giving the ROWID after the last one given
+        """
+        if (self.__file is not None):
+            self.__file.close()
+        self.discard_rotated()
+        self.__start(dbVersion, maxRowId)
+
+    def rotate(self, dbVersion:int, maxRowId:int=None) -> None:
+        """
+        Move the current entries to the rotated journal file and start a new journal
+        on the version that the sqlite3 database file will have after the changes are saved.
+
+        If the rotated journal file still exists (the previous save was not committed),
+        the current entries are appended to it instead since they have to be replayed after it.
+
+        Requires one argument:
+        - dbVersion (int): the version of the sqlite3 database file after the save is committed
+
+        Optional argument:
+        - maxRowId (int): the largest ROWID of the records after the save, 
+                          defaults to None to keep giving the ROWID after the last one given
+        """
+        self.sync()
+        self.__file.close()
+        if (self.__rotated_file_path.is_file()):
+            with open(self.__file_path, "r", encoding="utf-8") as currentFile, \
+                 open(self.__rotated_file_path, "a", encoding="utf-8") as rotatedFile:
+                currentFile.readline() # skip the "begin" entry
+                rotatedFile.writelines(currentFile)
+                rotatedFile.flush()
+                os.fsync(rotatedFile.fileno())
+        else:
+            os.replace(self.__file_path, self.__rotated_file_path)
+        self.__start(dbVersion, maxRowId)
+
+    def discard_rotated(self) -> None:
+        """
+        Delete the rotated journal file after its changes have been committed to the sqlite3 database file
+        """
+        self.__rotated_file_path.unlink(missing_ok=True)
+
+    def __start(self, dbVersion:int, maxRowId:int=None) -> None:
+        """
+        Start a new journal file with the "begin" entry
+        """
+        self.__file = open(self.__file_path, "w", encoding="utf-8")
+        if (maxRowId is not None):
+            self.__max_row_id = maxRowId
+        self.__num_of_entries = 0
+        self.__unsynced_entries = 0
+        self.__last_fsync = monotonic()
+        self.__append({"op": "begin", "version": dbVersion})
+        self.sync()
+
+    def next_row_id(self) -> int:
+        """
+        Returns the ROWID for a newly added record which will be used
+        when the record is inserted into the sqlite3 database file
+        """
+        self.__max_row_id += 1
+        return self.__max_row_id
+
+    def log_add(self, record) -> None:
+        """
+        Append the added record to the journal
+
+        Requires one argument:
+        - record (RecordData): the record which must already have a ROWID from next_row_id()
+        """
+        self.__log(record_to_entry("add", record))
+
+    def log_edit(self, record) -> None:
+        """
+        Append the latest data of the edited record to the journal
+
+        Requires one argument:
+        - record (RecordData)
+        """
+        self.__log(record_to_entry("edit", record))
+
+    def log_delete(self, rowId:int) -> None:
+        """
+        Append the ROWID of the deleted record to the journal
+
+        Requires one argument:
+        - rowId (int)
+        """
+        self.__log({"op": "delete", "rowId": rowId})
+
+    def __append(self, entry:dict) -> None:
+        """
+        Append the entry to the journal file and fsync the file if the batch is full or the interval has passed
+        """
+        self.__file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.__file.flush()
+        self.__unsynced_entries += 1
+
+        if (self.__unsynced_entries >= self.__fsync_batch_size or \
+            monotonic() - self.__last_fsync >= self.__fsync_interval):
+            self.sync()
+
+    def __log(self, entry:dict) -> None:
+        """
+        Append the change to the journal file
+        """
+        self.__append(entry)
+        self.__num_of_entries += 1
+
+    def sync(self) -> None:
+        """
+        Fsync the unsynced entries in the journal file to the disk
+        """
+        if (self.__unsynced_entries > 0):
+            os.fsync(self.__file.fileno())
+            self.__unsynced_entries = 0
+        self.__last_fsync = monotonic()
+
+    def close(self) -> None:
+        """
+        Fsync and close the journal file
+        """
+        if (self.__file is not None):
+            self.sync()
+            self.__file.close()
+            self.__file = None
+
+    @property
+    def num_of_entries(self) -> int:
+        """
+        Returns the number of changes in the journal since it was last reset
+        """
+        return self.__num_of_entries
+
+    @property
+    def needs_compaction(self) -> bool:
+        """
+        Returns True if the journal has at least JOURNAL_COMPACTION_THRESHOLD changes
+        and should be compacted by saving the changes to the sqlite3 database file
+        """
+        return self.__num_of_entries >= JOURNAL_COMPACTION_THRESHOLD
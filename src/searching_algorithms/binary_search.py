@@ -1,16 +1,17 @@
 from .search_utility_functions import find_all_name_occurrences, cost_upper_index, cost_lower_index
+from field_keys import COST_IN_CENTS_KEY
 
 """---------------------- BINARY SEARCH FOR PACKAGE NAME ----------------------"""
 
-def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSearch:str, l:int=None, r:int=None) -> tuple:
+def binary_search_for_name(arr:list, target:str, descendingOrder:bool, key, l:int=None, r:int=None) -> tuple:
     """
     Do a binary search on the database for the package name
     
-    Requires 3 argument:
+    Requires 4 argument:
     - arr (list): The array of elements to search
     - target (string)
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
-    - typeOfSearch (str): indicates what to search by (customerName or packageName)
+    - key (function): the key extractor of the name to search by, e.g. CUSTOMER_NAME_KEY or PACKAGE_NAME_KEY from field_keys.py
     
     2 Optional arguments:
     - l (int): left index (defaults to 0)
@@ -27,21 +28,23 @@ def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSea
     while (l <= r):
         mid = (l + r) // 2
 
+        midKey = key(arr[mid])
+
         # return mid if the package name is found in the subarray
-        if (arr[mid].get_val(typeOfSearch) == target):
+        if (midKey == target):
             # will return the index of the first and last occurrence of the package name in a tuple
-            return find_all_name_occurrences(arr, mid, target, typeOfSearch) 
+            return find_all_name_occurrences(arr, mid, target, key) 
 
         if (not descendingOrder):
             # if the package name to find is greater than mid, search the right half
-            if (arr[mid].get_val(typeOfSearch) < target):
+            if (midKey < target):
                 l = mid + 1
             # if the package name to find is smaller than mid, search the left half
             else:
                 r = mid - 1
         else:
             # if the package name to find is smaller than mid, search the right half
-            if (arr[mid].get_val(typeOfSearch) > target):
+            if (midKey > target):
                 l = mid + 1
             # if the package name to find is greater than mid, search the left half
             else:
@@ -53,15 +56,16 @@ def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSea
 
 """---------------------- BINARY SEARCH FOR PACKAGE COST PER PAX ----------------------"""
 
-def binary_search_for_range_of_cost(arr:list, lowRange:float, highRange:float, descendingOrder:bool) -> tuple:
+def binary_search_for_range_of_cost(arr:list, lowRange:int, highRange:int, descendingOrder:bool, key=COST_IN_CENTS_KEY) -> tuple:
     """
-    Do a binary search on the database for the package name
+    Do a binary search on the database for the range of cost per pax
     
-    Requires 4 arguments:
+    Requires 5 arguments:
     - arr (list): The array of elements to search
-    - lowRange (float)
-    - highRange (float)
+    - lowRange (int): in cents
+    - highRange (int): in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
+    - key (function): the key extractor of the field to search by, see field_keys.py (Default: COST_IN_CENTS_KEY)
     
     Best time complexity: O(1)
     Worst time complexity: O(log(n))
@@ -72,29 +76,31 @@ def binary_search_for_range_of_cost(arr:list, lowRange:float, highRange:float, d
     while (l <= r):
         mid = (l + r) // 2
 
+        midKey = key(arr[mid])
+
         # return mid if the range is found in the subarray
-        if (arr[mid].get_cost_per_pax() >= lowRange and arr[mid].get_cost_per_pax() <= highRange):
+        if (midKey >= lowRange and midKey <= highRange):
             if (descendingOrder):
-                return cost_upper_index(arr, mid, highRange, descendingOrder),\
-                    cost_lower_index(arr, mid, lowRange, descendingOrder)
+                return cost_upper_index(arr, mid, highRange, descendingOrder, key=key),\
+                    cost_lower_index(arr, mid, lowRange, descendingOrder, key=key)
             else:
-                return cost_lower_index(arr, mid, lowRange, descendingOrder), \
-                    cost_upper_index(arr, mid, highRange, descendingOrder)
+                return cost_lower_index(arr, mid, lowRange, descendingOrder, key=key), \
+                    cost_upper_index(arr, mid, highRange, descendingOrder, key=key)
 
         # decide which side of the sub-array to search based on the lower range
         if (not descendingOrder):
             # if the lower range to find is greater than mid, search the right half
-            if (arr[mid].get_cost_per_pax() < lowRange):
+            if (midKey < lowRange):
                 l = mid + 1
             # if the lower range to find is less than mid, search the left half
-            else: # arr[mid].get_cost_per_pax() > lowRange
+            else: # midKey > lowRange
                 r = mid - 1
         else:
             # if the lower range to find is greater than mid, search the right half
-            if (arr[mid].get_cost_per_pax() > lowRange):
+            if (midKey > lowRange):
                 l = mid + 1
             # if the lower range to find is less than mid, search the left half
-            else: # arr[mid].get_cost_per_pax() < lowRange
+            else: # midKey < lowRange
                 r = mid - 1
 
     return -1, -1 # return -1 if the package name is not found
@@ -1,17 +1,19 @@
 from .binary_search import binary_search_for_name
 from .search_utility_functions import find_all_name_occurrences
+from field_keys import CUSTOMER_NAME_KEY
 
-def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=False) -> tuple:
+def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=False, key=CUSTOMER_NAME_KEY) -> tuple:
     """
     Do an exponential search on the database for customer name.
     
     Advantages over binary search:
     - If the element to be found is at the front of the array, it will be faster than binary search.
     
-    Requires 2 arguments:
+    Requires 4 arguments:
     - arr (list): The array of elements to search
     - target (int/float): The target to search for
     - descendingOrder (bool): Indicates the order of the array (True if descending order, defaults to False)
+    - key (function): the key extractor of the field to search by, see field_keys.py (defaults to CUSTOMER_NAME_KEY)
     
     Best time complexity: O(log(n))
     Worst time complexity: O(log(n))
@@ -26,8 +28,8 @@ def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=F
         return -1, -1
 
     # if the target is the first element of the array
-    if (arr[0] == target):
-        return find_all_name_occurrences(arr, 0, target, "customerName") 
+    if (key(arr[0]) == target):
+        return find_all_name_occurrences(arr, 0, target, key) 
 
     # find the range of the target for the binary search
     # e.g. arr=[1, 2, 3, 4, 5, 6], target=3
@@ -37,11 +39,11 @@ def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=F
     # which will be passed to the binary search function
     i = 1
     if (not descendingOrder):
-        while (i < len(arr) and arr[i].get_customer_name() <= target):
+        while (i < len(arr) and key(arr[i]) <= target):
             i *= 2
     else:
-        while (i < len(arr) and arr[i].get_customer_name() >= target):
+        while (i < len(arr) and key(arr[i]) >= target):
             i *= 2
 
     # if the range is found, do a binary search on the subarray
-    return binary_search_for_name(arr, target, descendingOrder, "customerName", l=i//2, r=min(i, len(arr)-1))
\ No newline at end of file
+    return binary_search_for_name(arr, target, descendingOrder, key, l=i//2, r=min(i, len(arr)-1))
\ No newline at end of file
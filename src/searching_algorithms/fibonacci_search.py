@@ -1,6 +1,7 @@
 from .search_utility_functions import find_all_name_occurrences
+from field_keys import PACKAGE_NAME_KEY
 
-def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool=False) -> tuple:
+def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool=False, key=PACKAGE_NAME_KEY) -> tuple:
     """
     Fibonacci search algorithm works by using the Fibonacci numbers to
     determine the next index to check.
@@ -21,10 +22,11 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     - Explanation and Python implementation
         - https://www.codespeedy.com/fibonacci-search-algorithm-in-python/
     
-    Requires 3 arguments:
+    Requires 4 arguments:
     - arr (list): The array of elements to search
     - target (string): The package name to search for
     - descendingOrder (bool): Indicates the order of the array (True if descending order, defaults to False)
+    - key (function): the key extractor of the field to search by, see field_keys.py (defaults to PACKAGE_NAME_KEY)
     
     Best case: O(1) when the element to be found is the first element to be compared
     Worst case: O(log(n))
@@ -45,12 +47,13 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     offset = -1 # to use for discarding elements from front of the array for searching
     while (fibM > 1):
         i = min(offset + fibMm2, n - 1) # min() is used to avoid index out of range error
-        if (arr[i].get_package_name() == target):
-            return find_all_name_occurrences(arr, i, target, "packageName")
+        iKey = key(arr[i])
+        if (iKey == target):
+            return find_all_name_occurrences(arr, i, target, key)
 
         if (not descendingOrder):
             # for ascending order
-            if (arr[i].get_package_name() < target):
+            if (iKey < target):
                 # if the target is greater than the current element,
                 # discard the first few elements from the front of the array by
                 # moving the offset to the current index (offset + fib(m)-2) and lowering the fib(m) by one
@@ -68,7 +71,7 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
                 fibMm2 = fibM - fibMm1
         else:
             # for descendingOrder
-            if (arr[i].get_package_name() > target):
+            if (iKey > target):
                 # if the target is less than the current element,
                 # discard the first few elements from the front of the array by
                 # moving the offset to the current index (offset + fib(m)-2) and lowering the fib(m) by one
@@ -95,7 +98,7 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     # Break out of loop since fibM is not more than 1, the loop stops 
     # and is unable to find the target in the last position
     # and thus the if statement below checks if the target is the last element
-    if (fibMm1 and arr[n-1].get_package_name() == target):
-        return find_all_name_occurrences(arr, n-1, target, "packageName")
+    if (fibMm1 and key(arr[n-1]) == target):
+        return find_all_name_occurrences(arr, n-1, target, key)
 
     return -1, -1
\ No newline at end of file
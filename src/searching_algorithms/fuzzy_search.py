@@ -0,0 +1,118 @@
+"""
+This file contains the fuzzy search algorithms to find the names that are similar to a
+(possibly misspelt) name, e.g. "Hiroyuki" for "Hiroyki", ranked by their edit distance.
+"""
+
+# the maximum number of typos (insertions, deletions, or substitutions) allowed by default
+FUZZY_MAX_DISTANCE = 2
+
+def bounded_levenshtein_distance(a:str, b:str, maxDistance:int) -> int:
+    """
+    Returns the Levenshtein (edit) distance between the two strings, i.e. the minimum number of
+    insertions, deletions, or substitutions of a character to change one string into the other,
+    or maxDistance + 1 if the distance is more than maxDistance.
+
+    Only the diagonal band of width 2 * maxDistance + 1 of the dynamic programming table is computed
+    since the cells outside of the band are always more than maxDistance, and the computation stops
+    early once every cell in a row is more than maxDistance.
+
+    Requires 3 arguments:
+    - a (str)
+    - b (str)
+    - maxDistance (int)
+
+    Time complexity: O(k * m) where k is maxDistance and m is the length of the longer string
+
+    References:
+    - https://en.wikipedia.org/wiki/Levenshtein_distance
+    """
+    if (abs(len(a) - len(b)) > maxDistance):
+        return maxDistance + 1
+
+    tooFar = maxDistance + 1
+    prevRow = [j if (j <= maxDistance) else tooFar for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        charA = a[i - 1]
+        lowJ, highJ = max(1, i - maxDistance), min(len(b), i + maxDistance)
+
+        # the cells outside of the band are left as tooFar
+        row = [tooFar] * (len(b) + 1)
+        row[0] = i if (i <= maxDistance) else tooFar
+        rowMin = row[0]
+        for j in range(lowJ, highJ + 1):
+            cost = prevRow[j - 1] + (charA != b[j - 1]) # substitution (or a match)
+            cost = min(cost, prevRow[j] + 1, row[j - 1] + 1) # deletion or insertion
+            row[j] = cost if (cost <= maxDistance) else tooFar
+            rowMin = min(rowMin, row[j])
+
+        if (rowMin > maxDistance):
+            return tooFar
+        prevRow = row
+    return prevRow[len(b)]
+
+def rank_by_edit_distance(names, target:str, maxDistance:int=FUZZY_MAX_DISTANCE) -> list:
+    """
+    Returns the names within maxDistance of the target (case-insensitive) in a list of
+    (name, distance) tuples in ascending order of the distance and then the name
+
+    Requires 2 arguments:
+    - names (iterable): the names to compare with the target
+    - target (str)
+
+    Optional argument:
+    - maxDistance (int): defaults to FUZZY_MAX_DISTANCE
+    """
+    target = target.lower()
+    matchedNames = []
+    for name in names:
+        distance = bounded_levenshtein_distance(target, name.lower(), maxDistance)
+        if (distance <= maxDistance):
+            matchedNames.append((name, distance))
+
+    matchedNames.sort(key=lambda match: (match[1], match[0]))
+    return matchedNames
+
+def fuzzy_search_for_name(nameIndex, target:str, maxDistance:int=FUZZY_MAX_DISTANCE) -> list:
+    """
+    Do a fuzzy search for the names that are similar to the target with the n-gram index of the names
+    instead of comparing the target with every name (unlike linear_search_for_name)
+
+    Since each edit changes at most n of the n-grams, a name within maxDistance edits of the target
+    must share at least (number of n-grams of the target - maxDistance * n) of its n-grams. Hence, only
+    the names that share enough n-grams with the target are ranked by their bounded Levenshtein distance.
+
+    Note: A short name (with at most maxDistance * n n-grams) must still share at least one n-gram with the target.
+
+    Requires 2 arguments:
+    - nameIndex (NGramIndex): the n-gram index of the names, e.g. the customer names
+    - target (str): the (possibly misspelt) name to search for
+
+    Optional argument:
+    - maxDistance (int): the maximum edit distance of the names to return, defaults to FUZZY_MAX_DISTANCE
+
+    Returns a list of (name, distance) tuples in ascending order of the distance and then the name.
+    """
+    minSharedNGrams = max(1, len(nameIndex.get_ngrams(target)) - maxDistance * nameIndex.n)
+    return rank_by_edit_distance(nameIndex.get_candidates(target, minSharedNGrams), target, maxDistance)
+
+# test codes for the fuzzy search
+if (__name__ == "__main__"):
+    from random import choice, randint
+    def levenshtein_distance(a:str, b:str) -> int:
+        # the full dynamic programming table to test the bounded version against
+        prevRow = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            row = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                row[j] = min(prevRow[j - 1] + (a[i - 1] != b[j - 1]), prevRow[j] + 1, row[j - 1] + 1)
+            prevRow = row
+        return prevRow[-1]
+
+    for _ in range(10000):
+        a = "".join(choice("abc") for _ in range(randint(0, 8)))
+        b = "".join(choice("abc") for _ in range(randint(0, 8)))
+        k = randint(0, 4)
+        assert bounded_levenshtein_distance(a, b, k) == min(levenshtein_distance(a, b), k + 1), (a, b, k)
+
+    print("Distance between \"Hiroyki\" and \"Hiroyuki\":", bounded_levenshtein_distance("hiroyki", "hiroyuki", FUZZY_MAX_DISTANCE))
+    print("All tests passed!")
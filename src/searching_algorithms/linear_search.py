@@ -1,13 +1,16 @@
 from typing import Union
 
-def linear_search_for_name(arr:list, target:str, typeOfSearch:str) -> Union[int, tuple]:
+# import local python files
+from field_keys import CUSTOMER_NAME_KEY
+
+def linear_search_for_name(arr:list, target:str, key=CUSTOMER_NAME_KEY) -> Union[int, tuple]:
     """
     Do a linear search on the database for the customer name
     
     Requires 3 arguments:
     - arr (list): The array of elements to search
     - target (string): The name to search for
-    - typeOfSearch (string):"customerName" or "packageName"
+    - key (function): the key extractor of the name to search by, e.g. CUSTOMER_NAME_KEY or PACKAGE_NAME_KEY from field_keys.py (Default: CUSTOMER_NAME_KEY)
     
     Best time complexity: O(n)
     Worst time complexity: O(n)
@@ -15,11 +18,8 @@ def linear_search_for_name(arr:list, target:str, typeOfSearch:str) -> Union[int,
     
     Space complexity: O(n) for matched elements
     """
-    if (typeOfSearch not in ("customerName", "packageName")):
-        raise ValueError(f"Invalid search type, {typeOfSearch}, Must be either 'customerName' or 'packageName'!")
-
     matchedArr = []
     for i, record in enumerate(arr):
-        if (record.get_val(typeOfSearch) == target):
+        if (key(record) == target):
             matchedArr.append((record, i))
     return -1 if (len(matchedArr) == 0) else matchedArr
\ No newline at end of file
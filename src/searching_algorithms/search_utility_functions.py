@@ -4,7 +4,10 @@ or within the specified range of cost after the binary search algorithm has
 been used to find the index of the target.
 """
 
-def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str) -> tuple:
+# import local python files
+from field_keys import COST_IN_CENTS_KEY
+
+def find_all_name_occurrences(arr:list, i:int, target:str, key) -> tuple:
     """
     Search for all occurrences of the target name specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by target name type
@@ -13,7 +16,7 @@ def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str) ->
     - arr (list): The array of elements to search
     - i (int): refers to the index obtained from a search algorithm
     - target (string): package name or customer name
-    - typeOfSearch (str): indicates what to search by (customerName or packageName)
+    - key (function): the key extractor of the name to search by, e.g. CUSTOMER_NAME_KEY or PACKAGE_NAME_KEY from field_keys.py
     
     Best time complexity: O(n)
     Worst time complexity: O(n)
@@ -21,57 +24,59 @@ def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str) ->
     """
     iCopy = i
     # search the right
-    while (i < len(arr) - 1 and arr[i + 1].get_val(typeOfSearch) == target):
+    while (i < len(arr) - 1 and key(arr[i + 1]) == target):
         i += 1
 
     # search the left
-    while (iCopy > 0 and arr[iCopy - 1].get_val(typeOfSearch) == target):
+    while (iCopy > 0 and key(arr[iCopy - 1]) == target):
         iCopy -= 1
 
     return iCopy, i
 
-def cost_lower_index(arr:list, i:int, lowerRange:int, descendingOrder:bool) -> int:
+def cost_lower_index(arr:list, i:int, lowerRange:int, descendingOrder:bool, key=COST_IN_CENTS_KEY) -> int:
     """
     Search for any records within the lowerRange of the cost specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by package cost per pax
     
-    Requires 4 arguments:
+    Requires 5 arguments:
     - arr (list): The array of elements to search
     - i (int): refers to the index obtained from a search algorithm
-    - lowerRange (int)
+    - lowerRange (int): in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
+    - key (function): the key extractor of the field to search by, see field_keys.py (Default: COST_IN_CENTS_KEY)
     
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
     """
     if (not descendingOrder):
-        while (i > 0 and arr[i - 1].get_cost_per_pax() >= lowerRange):
+        while (i > 0 and key(arr[i - 1]) >= lowerRange):
             i -= 1
     else:
-        while (i < len(arr) - 1 and arr[i + 1].get_cost_per_pax() >= lowerRange):
+        while (i < len(arr) - 1 and key(arr[i + 1]) >= lowerRange):
             i += 1
     return i
 
-def cost_upper_index(arr:list, i:int, upperRange:int, descendingOrder:int) -> int:
+def cost_upper_index(arr:list, i:int, upperRange:int, descendingOrder:bool, key=COST_IN_CENTS_KEY) -> int:
     """
     Search for any records within the upperRange of the cost specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by package cost per pax
     
-    Requires 4 arguments:
+    Requires 5 arguments:
     - arr (list): The array of elements to search
     - i (int) <-- refers to the index obtained from a search algorithm
-    - upperRange (int)
+    - upperRange (int): in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
+    - key (function): the key extractor of the field to search by, see field_keys.py (Default: COST_IN_CENTS_KEY)
     
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
     """
     if (not descendingOrder):
-        while (i < len(arr) - 1 and arr[i + 1].get_cost_per_pax() <= upperRange):
+        while (i < len(arr) - 1 and key(arr[i + 1]) <= upperRange):
             i += 1
     else:
-        while (i > 0 and arr[i - 1].get_cost_per_pax() <= upperRange):
+        while (i > 0 and key(arr[i - 1]) <= upperRange):
             i -= 1
     return i
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""
+This file contains the functions to load and save the records of the HotelDatabase object
+as a directory of sqlite3 database files (shards) so that the shards can be read and written
+in parallel by a pool of processes (one worker per shard) instead of on a single core.
+
+Each record is stored in the shard given by the hash of its customer name. Since the built-in hash()
+of a string is randomised for every process, the CRC32 checksum of the customer name is used instead.
+The records keep their ROWID in their shard so that the records of all the shards can be merged
+back into their original order when they are loaded.
+
+The records are sent between the processes as dictionary-encoded columns (see columnar_snapshot.py)
+instead of an array of tuples as the arrays of integers are much faster to pickle.
+
+The shards are written to a temporary directory first which then replaces the directory of the shards
+so that a directory with only some of the shards written will never be read.
+"""
+
+# import standard libraries
+import os, shutil, sqlite3, pathlib, zlib
+from array import array
+from itertools import chain
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+# import local python files
+from columnar_snapshot import dictionary_encode
+
+# default number of shards to save the records into
+NUM_OF_SHARDS = 4
+
+SHARD_FILE_NAME_FORMAT = "shard-{:03d}.db"
+SHARD_FILE_GLOB = "shard-*.db"
+
+# the tables in each shard which are the same as the tables in the sqlite3 database file
+SHARD_RECORDS_TABLE = "StaycationRecords"
+SHARD_CONFIG_TABLE = "HotelDatabaseConfig"
+
+def get_shard_index(customerName:str, numOfShards:int) -> int:
+    """
+    Returns the index of the shard that the record with the customer name is stored in
+
+    Requires two arguments:
+    - customerName (str)
+    - numOfShards (int)
+    """
+    return zlib.crc32(customerName.encode("utf-8")) % numOfShards
+
+def get_shard_file_paths(dirPath:pathlib.Path) -> list:
+    """
+    Returns the paths of the shards in the directory sorted by their index
+
+    Requires one argument:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+    """
+    return sorted(dirPath.glob(SHARD_FILE_GLOB))
+
+def get_temporary_dir_paths(dirPath:pathlib.Path) -> tuple:
+    """
+    Returns the paths of the directory that the new shards are written to
+    and the directory that the old shards are moved to when saving, (new directory path, old directory path)
+
+    Requires one argument:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+    """
+    return dirPath.with_name(dirPath.name + ".tmp"), dirPath.with_name(dirPath.name + ".old")
+
+def recover_sharded_dir(dirPath:pathlib.Path) -> None:
+    """
+    Restore the old shards if the program was terminated after they were moved
+    but before the new shards replaced them and delete any partially written shards
+
+    Requires one argument:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+    """
+    newDirPath, oldDirPath = get_temporary_dir_paths(dirPath)
+    if (oldDirPath.is_dir()):
+        if (dirPath.is_dir()):
+            shutil.rmtree(oldDirPath)
+        else:
+            oldDirPath.rename(dirPath)
+
+    if (newDirPath.is_dir()):
+        shutil.rmtree(newDirPath)
+
+def map_shards(func, *iterables) -> list:
+    """
+    Call the function on each shard with a pool of processes (one worker per shard, up to the number of CPUs)
+    and return the results in the same order as the shards.
+
+    The function is called in this process instead if there is only one shard or one CPU
+    as the pool would only add the overhead of starting the workers and pickling the shards.
+
+    Requires two arguments:
+    - func (function): a module-level function so that it can be pickled, e.g. read_shard
+    - iterables: the arguments of each call like the built-in map function
+    """
+    iterables = [list(iterable) for iterable in iterables]
+    numOfWorkers = min(len(iterables[0]), os.cpu_count() or 1)
+    if (numOfWorkers <= 1):
+        return list(map(func, *iterables))
+
+    with ProcessPoolExecutor(max_workers=numOfWorkers) as executor:
+        return list(executor.map(func, *iterables))
+
+def read_sharded_config(dirPath:pathlib.Path):
+    """
+    Returns the configuration tuple (sorting order and descending flag) saved in the first shard
+    or None if there are no shards
+
+    Requires one argument:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+    """
+    shardFilePaths = get_shard_file_paths(dirPath)
+    if (not shardFilePaths):
+        return None
+
+    con = sqlite3.connect(shardFilePaths[0])
+    try:
+        return con.execute(f"SELECT * FROM {SHARD_CONFIG_TABLE}").fetchone()
+    except (sqlite3.DatabaseError):
+        return None
+    finally:
+        con.close()
+
+def read_shard(shardFilePath:pathlib.Path) -> tuple:
+    """
+    Read the records in the shard in ascending order of their ROWID as dictionary-encoded columns.
+
+    Run in the worker processes.
+
+    Requires one argument:
+    - shardFilePath (pathlib.Path)
+
+    Returns a tuple of (package names, package name codes, customer names, customer name codes,
+    array of the number of pax, array of the cost per pax in cents, array of the ROWID, configuration tuple)
+    """
+    con = sqlite3.connect(shardFilePath)
+    try:
+        rows = con.execute(f"SELECT packageName, customerName, paxNum, costPerPax, ROWID FROM {SHARD_RECORDS_TABLE} ORDER BY ROWID ASC").fetchall()
+        configTuple = con.execute(f"SELECT * FROM {SHARD_CONFIG_TABLE}").fetchone()
+    finally:
+        con.close()
+
+    packageNames, packageCodes = dictionary_encode([row[0] for row in rows])
+    customerNames, customerCodes = dictionary_encode([row[1] for row in rows])
+    return packageNames, packageCodes, customerNames, customerCodes, array("I", [row[2] for row in rows]), \
+           array("q", [row[3] for row in rows]), array("q", [row[4] for row in rows]), configTuple
+
+def iter_shard_rows(shard:tuple):
+    """
+    Generator to yield the rows of the shard returned by read_shard() in the same order as the
+    HotelDatabase's bulk_load rows, (packageName, customerName, paxNum, costInCents, rowId)
+
+    Requires one argument:
+    - shard (tuple)
+    """
+    packageNames, packageCodes, customerNames, customerCodes, paxNums, costsInCents, rowIds, _ = shard
+    yield from zip(
+        map(packageNames.__getitem__, packageCodes),
+        map(customerNames.__getitem__, customerCodes),
+        paxNums,
+        costsInCents,
+        rowIds
+    )
+
+def write_shard(shardFilePath:pathlib.Path, shard:tuple, configTuple:tuple) -> int:
+    """
+    Write the dictionary-encoded columns of the records to a new shard in a single transaction.
+
+    Run in the worker processes.
+
+    Requires three arguments:
+    - shardFilePath (pathlib.Path): the path of the new shard which must not exist yet
+    - shard (tuple): (package names, package name codes, customer names, customer name codes,
+                      array of the number of pax, array of the cost per pax in cents, array of the ROWID)
+    - configTuple (tuple): the HotelDatabase object's configuration (sorting order and descending flag)
+
+    Returns the number of records written.
+    """
+    packageNames, packageCodes, customerNames, customerCodes, paxNums, costsInCents, rowIds = shard
+    con = sqlite3.connect(shardFilePath)
+    try:
+        with con:
+            con.execute(f"""CREATE TABLE {SHARD_RECORDS_TABLE} (
+                customerName TEXT NOT NULL,
+                packageName TEXT NOT NULL,
+                paxNum INTEGER NOT NULL,
+                costPerPax INTEGER NOT NULL
+                )""")
+            con.executemany(
+                f"INSERT INTO {SHARD_RECORDS_TABLE} (ROWID, customerName, packageName, paxNum, costPerPax) VALUES (?, ?, ?, ?, ?)",
+                zip(rowIds, map(customerNames.__getitem__, customerCodes), map(packageNames.__getitem__, packageCodes), paxNums, costsInCents)
+            )
+            con.execute(f"CREATE TABLE {SHARD_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
+            con.execute(f"INSERT INTO {SHARD_CONFIG_TABLE} VALUES (?, ?)", configTuple)
+    finally:
+        con.close()
+    return len(rowIds)
+
+def split_into_shards(rows:list, numOfShards:int) -> list:
+    """
+    Split the rows into the shards by the hash of their customer name and dictionary-encode the columns of each shard
+
+    Requires two arguments:
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+                   where the cost per pax is in cents, e.g. from prepare_rewrite() in functions.py
+    - numOfShards (int)
+
+    Returns an array of (package names, package name codes, customer names, customer name codes,
+    array of the number of pax, array of the cost per pax in cents, array of the ROWID) tuples
+    """
+    # the customer names repeat, hence the shard index of each unique name is only computed once
+    shardIndexes = {}
+    shardRows = [[] for _ in range(numOfShards)]
+    for row in rows:
+        shardIndex = shardIndexes.get(row[1])
+        if (shardIndex is None):
+            shardIndex = shardIndexes[row[1]] = get_shard_index(row[1], numOfShards)
+        shardRows[shardIndex].append(row)
+
+    shards = []
+    for rowsInShard in shardRows:
+        packageNames, packageCodes = dictionary_encode([row[2] for row in rowsInShard])
+        customerNames, customerCodes = dictionary_encode([row[1] for row in rowsInShard])
+        shards.append((
+            packageNames, packageCodes, customerNames, customerCodes,
+            array("I", [row[3] for row in rowsInShard]),
+            array("q", [row[4] for row in rowsInShard]),
+            array("q", [row[0] for row in rowsInShard])
+        ))
+    return shards
+
+def read_sharded_db(dirPath:pathlib.Path) -> tuple:
+    """
+    Read all the shards in the directory in parallel
+
+    Requires one argument:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+
+    Returns a tuple of (array of the rows of all the shards merged in ascending order of their ROWID
+    in the same order as the HotelDatabase's bulk_load rows, configuration tuple or None)
+
+    Raises sqlite3.DatabaseError (or its subclasses) if any of the shards has some errors.
+    """
+    shards = map_shards(read_shard, get_shard_file_paths(dirPath))
+    configTuple = shards[0][-1] if (shards) else None
+
+    # since the rows of each shard are already sorted, timsort only has to merge the sorted runs of the shards
+    rows = sorted(chain.from_iterable(iter_shard_rows(shard) for shard in shards), key=itemgetter(4))
+    return rows, configTuple
+
+def write_sharded_db(dirPath:pathlib.Path, rows:list, configTuple:tuple, numOfShards:int=NUM_OF_SHARDS) -> None:
+    """
+    Write the rows to new shards in parallel which will then replace the shards in the directory
+
+    Requires three arguments:
+    - dirPath (pathlib.Path): the path of the directory of the shards
+    - rows (list): the array of (rowId, customerName, packageName, paxNum, costPerPax) tuples
+                   where the cost per pax is in cents, e.g. from prepare_rewrite() in functions.py
+    - configTuple (tuple): the HotelDatabase object's configuration (sorting order and descending flag)
+
+    Optional argument:
+    - numOfShards (int): defaults to NUM_OF_SHARDS
+    """
+    recover_sharded_dir(dirPath)
+    newDirPath, oldDirPath = get_temporary_dir_paths(dirPath)
+    newDirPath.mkdir(parents=True)
+
+    shards = split_into_shards(rows, numOfShards)
+    shardFilePaths = [newDirPath.joinpath(SHARD_FILE_NAME_FORMAT.format(i)) for i in range(numOfShards)]
+    map_shards(write_shard, shardFilePaths, shards, [configTuple] * numOfShards)
+
+    # replace the old shards with the new shards
+    if (dirPath.is_dir()):
+        dirPath.rename(oldDirPath)
+    newDirPath.rename(dirPath)
+    if (oldDirPath.is_dir()):
+        shutil.rmtree(oldDirPath)
@@ -1,10 +1,14 @@
-def bubble_sort(arr:list, reverse:bool=False) -> None:
+# import local python files
+from field_keys import CUSTOMER_NAME_KEY
+
+def bubble_sort(arr:list, reverse:bool=False, key=CUSTOMER_NAME_KEY) -> None:
     """
     Do a bubble sort (optimised ver) on the database by customer name
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr (list): The array of elements to sort by customer name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: CUSTOMER_NAME_KEY)
     
     Best time complexity: O(n)
     Worst time complexity: O(n^2)
@@ -15,12 +19,12 @@ def bubble_sort(arr:list, reverse:bool=False) -> None:
         for j in range(len(arr) - i - 1): # -i to stop at last i element since they are already sorted and -1 to account for the indexing starting from 0
             if (reverse):
                 # swap the elements if the jth customer name is smaller than the next customer name
-                if (arr[j].get_customer_name() < arr[j + 1].get_customer_name()):
+                if (key(arr[j]) < key(arr[j + 1])):
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
                     swapFlag = 1
             else:
                 # swap the elements if the jth customer name is greater than the next customer name
-                if (arr[j].get_customer_name() > arr[j + 1].get_customer_name()):
+                if (key(arr[j]) > key(arr[j + 1])):
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
                     swapFlag = 1
 
@@ -0,0 +1,48 @@
+def counting_sort(arr:list, numOfKeys:int, key, reverse:bool=False) -> None:
+    """
+    Do a counting sort on the database by an integer key in the range [0, numOfKeys),
+    e.g. the ranks of the package name codes in the columnar mode (see ColumnarRecords in hotel_record.py).
+
+    Counting sort is a non-comparison sort that counts the number of elements with each key
+    and uses the cumulative counts to place each element directly at its sorted position.
+    The sort is stable, i.e. the elements with the same key remain in their original order,
+    in both the ascending and descending order.
+
+    Requires 4 arguments:
+    - arr (list): The array of elements to sort
+    - numOfKeys (int): The number of possible keys, k
+    - key (function): the key extractor of the integer key to sort by
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Best time complexity: O(n+k)
+    Worst time complexity: O(n+k)
+    Average time complexity: O(n+k)
+
+    Space complexity: O(n+k)
+
+    References:
+    - https://en.wikipedia.org/wiki/Counting_sort
+    """
+    # get the key of each element once instead of in every pass
+    keys = list(map(key, arr))
+
+    # Calculate the number of occurrences of each key
+    countArr = [0] * numOfKeys
+    for k in keys:
+        countArr[k] += 1
+
+    # Calculate the starting index of each key in the output array...
+    keyOrder = range(numOfKeys - 1, -1, -1) if (reverse) else range(numOfKeys)
+    startIdx = 0
+    for k in keyOrder:
+        startIdx, countArr[k] = startIdx + countArr[k], startIdx
+
+    # place each element at the next free index of its key
+    # (the elements are iterated from the front to keep the sort stable)
+    outputArr = [None] * len(arr)
+    for el, k in zip(arr, keys):
+        outputArr[countArr[k]] = el
+        countArr[k] += 1
+
+    # Copy the sorted elements into original array
+    arr[:] = outputArr
@@ -1,4 +1,7 @@
-def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None: 
+# import local python files
+from field_keys import PACKAGE_NAME_KEY
+
+def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None: 
     """
     To heapify subtree rooted at index idx. 
     
@@ -14,11 +17,12 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         - at any node, the value of the node is less than or equal to the values of its children
         - the value of the root node is the smallest value in the subtree
     
-    Requires 4 arguments:
+    Requires 5 arguments:
     - arr (list): The array of elements to heapify
     - heapSize (int): the size of the array/heap
     - idx (int): the index of the root of the subtree
     - reverse (bool): whether to make it a max-heap or a min-heap (Default: False)
+    - key (function): the key extractor of the field to heapify by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Best time complexity: O(log n)
     Worst time complexity: O(log n)
@@ -48,11 +52,11 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         smallest = idx # Initialise smallest as root
 
         # if left child of root exists and is smaller than root 
-        if (l < heapSize and arr[l].get_package_name() < arr[smallest].get_package_name()): 
+        if (l < heapSize and key(arr[l]) < key(arr[smallest])): 
             smallest = l 
 
         # if right child of root exists and is smaller than smallest 
-        if (r < heapSize and arr[r].get_package_name() < arr[smallest].get_package_name()): 
+        if (r < heapSize and key(arr[r]) < key(arr[smallest])): 
             smallest = r
         
         # Swap with smallest element and continue heapifying if the root is not the smallest
@@ -60,7 +64,7 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
             arr[idx], arr[smallest] = arr[smallest], arr[idx] 
             
             # recursively heapify the affected sub-tree
-            heapify(arr, heapSize, smallest, reverse)
+            heapify(arr, heapSize, smallest, reverse, key)
     else:
         # e.g. of valid max heap:
         #   3
@@ -78,11 +82,11 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         largest = idx # Initialise largest as root 
 
         # See if left child of root exists and is greater than root 
-        if (l < heapSize and arr[largest].get_package_name() < arr[l].get_package_name()): 
+        if (l < heapSize and key(arr[largest]) < key(arr[l])): 
             largest = l 
 
         # See if right child of root exists and is greater than largest 
-        if (r < heapSize and arr[largest].get_package_name() < arr[r].get_package_name()): 
+        if (r < heapSize and key(arr[largest]) < key(arr[r])): 
             largest = r 
 
         # Swap with largest element and continue heapifying if the root is not the largest
@@ -90,15 +94,16 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
             arr[idx], arr[largest] = arr[largest],arr[idx]
 
             # recursively heapify the affected sub-tree
-            heapify(arr, heapSize, largest, reverse) 
+            heapify(arr, heapSize, largest, reverse, key) 
 
-def heap_sort(arr:list, reverse:bool=False) -> None:
+def heap_sort(arr:list, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None:
     """
     Do a heap sort on the database by package name
     
-    Requires two arguments:
+    Requires three arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Best time complexity: O(n log n)
     Worst time complexity: O(n log n)
@@ -124,7 +129,7 @@ def heap_sort(arr:list, reverse:bool=False) -> None:
     # from the last non-leaf node
     # and heapify each node
     for i in range(n // 2, -1, -1): 
-        heapify(arr, n, i, reverse=reverse) 
+        heapify(arr, n, i, reverse=reverse, key=key) 
 
     # extract elements individually starting from the end of the heap
     for i in range(n-1, 0, -1): 
@@ -135,4 +140,4 @@ def heap_sort(arr:list, reverse:bool=False) -> None:
         arr[i], arr[0] = arr[0], arr[i]
 
         # call heapify on the reduced heap
-        heapify(arr, i, 0, reverse=reverse) 
\ No newline at end of file
+        heapify(arr, i, 0, reverse=reverse, key=key) 
\ No newline at end of file
@@ -1,4 +1,7 @@
-def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=None, mode:str="costPerPax") -> None:
+# import local python files
+from field_keys import COST_IN_CENTS_KEY
+
+def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=None, key=COST_IN_CENTS_KEY) -> None:
     """
     Do a insertion sort by package cost per pax, package name, and more.
     However, this function is used in the program to sort by cost per pax and package name
@@ -11,8 +14,8 @@ def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=N
         - Default: 0
     - endIdx (int): The index to stop at when sorting (exclusive of endIdx, i.e. [...endIdx-1])
         - Default: len(arr)
-    - mode (str): The mode of sorting. Can be "costPerPax" or "packageName", etc.
-        - default: "costPerPax"
+    - key (function): The key extractor of the field to sort by, e.g. COST_IN_CENTS_KEY or PACKAGE_NAME_KEY from field_keys.py
+        - default: COST_IN_CENTS_KEY
     
     Best time complexity: O(n)
     Worst time complexity: O(n^2)
@@ -29,19 +32,20 @@ def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=N
 
     for i in range(startIdx+1, endIdx):
         el = arr[i] # save the element to be positioned
+        elKey = key(el)
 
         # now find the position where el fits in the ordered part of the array
         j = i
         if (not reverse):
             # Compare el with each element on the left of it and
             # shift the bigger element to the right of their current position
-            while (j > startIdx and el.get_val(mode) < arr[j-1].get_val(mode)):
+            while (j > startIdx and elKey < key(arr[j-1])):
                 arr[j] = arr[j-1]
                 j -= 1
         else:
             # Compare el with each element on the left of it and
             # shift the smaller element to the right of their current position
-            while (j > startIdx and el.get_val(mode) > arr[j-1].get_val(mode)):
+            while (j > startIdx and elKey > key(arr[j-1])):
                 arr[j] = arr[j-1]
                 j -= 1
 
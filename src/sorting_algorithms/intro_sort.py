@@ -5,13 +5,14 @@ from math import floor, log2
 from .insertion_sort import insertion_sort
 from .heap_sort import heap_sort
 from .quicksort_utility_functions import median_of_3, partition
+from field_keys import PACKAGE_NAME_KEY
 
 # define the maximum length of the array before using insertion sort
 SIZE_THRESHOLD = 16 # if less than or equal to 16 elements, introsort will use insertion sort.
                     # I used the integer 16 as the threshold because GNU Standard C++ library also uses it;
                     # https://gcc.gnu.org/onlinedocs/gcc-12.1.0/libstdc++/api/a00650_source.html#l01838
 
-def intro_sort(arr:list, reverse:bool=False) -> None:
+def intro_sort(arr:list, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None:
     """
     Introsort or introspective sort is a hybrid sorting algorithm that consists of quick sort, 
     heap sort, and insertion sort.
@@ -29,9 +30,10 @@ def intro_sort(arr:list, reverse:bool=False) -> None:
     - Hence, introsort combines quick sort for its efficiency and 
       heap sort to avoid quick sort's worst time complexity of O(n^2)
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the array is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Best time complexity: O(n log n)
     Worst time complexity: O(n log n)
@@ -62,20 +64,21 @@ def intro_sort(arr:list, reverse:bool=False) -> None:
     # to avoid the worse case complexity of O(n^2) when using quick sort
     maxDepth = 2 * floor(log2(len(arr)))
 
-    intro_sort_process(arr, 0, len(arr), maxDepth, reverse=reverse)
+    intro_sort_process(arr, 0, len(arr), maxDepth, reverse=reverse, key=key)
 
-def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=False) -> None:
+def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None:
     """
     The main function that implements the introsort algorithm with reference to
     C++ Standard Library's std::sort();
     https://gcc.gnu.org/onlinedocs/gcc-12.1.0/libstdc++/api/a00650_source.html#l01908
     
-    Requires 5 arguments:
+    Requires 6 arguments:
     - arr (list): The array of elements to sort by package name
     - start (int): The starting index of the array
     - end (int): The ending index of the array
     - maxDepth (int): The max recursion depth of the algorithm before using heap sort
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     """
     while (end - start > SIZE_THRESHOLD):
         if (maxDepth == 0):
@@ -83,7 +86,7 @@ def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=
             # start using heap sort on the sub-array if the max recursion depth is 0
             # as to avoid the worst case of O(n^2) when using quick sort
             arrCopy = arr[start:end+1]
-            heap_sort(arrCopy, reverse=reverse)
+            heap_sort(arrCopy, reverse=reverse, key=key)
             arr[start:end+1] = arrCopy
 
             # explicitly delete the copy of the array for garbage collector to free up memory
@@ -93,16 +96,16 @@ def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=
         maxDepth -= 1
 
         # get the pivot for quick sort using the median of three concept
-        pivot = median_of_3(arr, start, start + ((end - start) // 2), end - 1).get_package_name()
+        pivot = key(median_of_3(arr, start, start + ((end - start) // 2), end - 1, key=key))
 
         # partition the array around the pivot
-        partitionRes = partition(arr, start, end, pivot, reverse=reverse)
+        partitionRes = partition(arr, start, end, pivot, reverse=reverse, key=key)
 
         # recursive case:
         # use the returned value from the partition function and recursively
         # sort the RIGHT side of the array by changing the start argument
         # to the returned value from the partition function
-        intro_sort_process(arr, partitionRes, end, maxDepth, reverse=reverse)
+        intro_sort_process(arr, partitionRes, end, maxDepth, reverse=reverse, key=key)
 
         # change the end pointer to partitionRes after the recursive call process 
         # of sorting the right side of the array to sort the LEFT side of the array
@@ -111,4 +114,4 @@ def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=
 
     # base case 2
     # use insertion sort to sort the array/sub-array for smaller arrays as it is faster
-    return insertion_sort(arr, startIdx=start, endIdx=end, reverse=reverse, mode="packageName")
\ No newline at end of file
+    return insertion_sort(arr, startIdx=start, endIdx=end, reverse=reverse, key=key)
\ No newline at end of file
@@ -5,67 +5,74 @@ The functions here are basically functions for the quicksort algorithm to be use
 in the introsort algorithm.
 """
 
-def median_of_3(arr:list, firstIndex:int, middleIndex:int, lastIndex:int) -> str:
+# import local python files
+from field_keys import PACKAGE_NAME_KEY
+
+def median_of_3(arr:list, firstIndex:int, middleIndex:int, lastIndex:int, key=PACKAGE_NAME_KEY):
     """
     Find the median of three elements in the array (comparing the first, middle, and last elements).
     Helps to reduce the chance of picking a bad pivot to partition around which can make
     quicksort slow.
     
-    Requires four arguments:
+    Requires five arguments:
     - arr (list): the array to find the median of three elements in
     - firstIndex (int): the index of the first element in the array
     - middleIndex (int): the index of the middle element in the array
     - lastIndex (int): the index of the last element in the array
+    - key (function): the key extractor of the field to compare, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Returns the element in the array which is the median of the three elements.
     """
+    first, middle, last = key(arr[firstIndex]), key(arr[middleIndex]), key(arr[lastIndex])
+
     # if the first element is larger than the middle but smaller than the last element
     # or if the first element is smaller than the middle but larger than the last element
     # Note: using the bitwise XOR operator
-    if ((arr[firstIndex].get_package_name() > arr[middleIndex].get_package_name()) ^ (arr[firstIndex].get_package_name() > arr[lastIndex].get_package_name())):
+    if ((first > middle) ^ (first > last)):
         return arr[firstIndex]
 
     # if the middle element is larger than the first element but smaller than the last element
     # or if the middle element is smaller than the last element but larger than the last element
     # Note: using the bitwise XOR operator
-    if ((arr[middleIndex].get_package_name() > arr[firstIndex].get_package_name()) ^ (arr[middleIndex].get_package_name() > arr[lastIndex].get_package_name())):
+    if ((middle > first) ^ (middle > last)):
         return arr[middleIndex]
 
     # if the last element is larger than the first element but smaller than the middle element
     # or if the last element is smaller than the first element but larger than the middle element
     return arr[lastIndex]
 
-def partition(arr:list, l:int, r:int, pivot:str, reverse:bool=False) -> int:
+def partition(arr:list, l:int, r:int, pivot, reverse:bool=False, key=PACKAGE_NAME_KEY) -> int:
     """
     Partition the array into two parts using the pivot:
     - The elements smaller than the pivot will be on the left of the pivot
     - The elements larger than the pivot will be on the right of the pivot
     
-    Requires five arguments:
+    Requires six arguments:
     - arr (list): the array to partition
     - l (int): the starting index of the array
     - r (int): the ending index of the array
-    - pivot (str): the package name to partition the array around
+    - pivot: the key (e.g. the package name) to partition the array around
     - reverse (bool): if True, the array will be sorted in a descending order (default: False)
+    - key (function): the key extractor of the field to compare, see field_keys.py (default: PACKAGE_NAME_KEY)
     """
     i = l
     j = r - 1 # - 1 to avoid the index out of range error
     while (1):
         if (not reverse):
             # find the first element in the array which is smaller than the pivot
-            while (arr[i].get_package_name() < pivot):
+            while (key(arr[i]) < pivot):
                 i += 1
 
             # find the first element in the array which is larger than the pivot
-            while (arr[j].get_package_name() > pivot):
+            while (key(arr[j]) > pivot):
                 j -= 1
         else:
             # find the first element in the array which is larger than the pivot
-            while (arr[i].get_package_name() > pivot):
+            while (key(arr[i]) > pivot):
                 i += 1
 
             # find the first element in the array which is smaller than the pivot
-            while (arr[j].get_package_name() < pivot):
+            while (key(arr[j]) < pivot):
                 j -= 1
 
         # if the two pointers have crossed, return i
@@ -1,11 +1,15 @@
-def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False) -> None:
+# import local python files
+from field_keys import COST_IN_CENTS_KEY
+
+def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False, key=COST_IN_CENTS_KEY) -> None:
     """
     Counting sort for radix sort.
     
-    Requires 3 arguments:
+    Requires 4 arguments:
     - arr (list): The array of elements to sort by package cost per pax
     - place (int): The current digit number
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the non-negative integer field to sort by, see field_keys.py (Default: COST_IN_CENTS_KEY)
     
     Best time complexity: O(n+b)
     Worst time complexity: O(n+b)
@@ -20,7 +24,7 @@ def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False) -> Non
 
     # Calculate the number of occurrences of each digit
     for i in range(n):
-        index = int(arr[i].get_cost_per_pax() * 100) // place
+        index = key(arr[i]) // place
         countArr[index % 10] += 1
 
     # Calculate cumulative count...
@@ -36,7 +40,7 @@ def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False) -> Non
     for i in range(n-1, -1, -1):
         # finding the index of the element in the count array by calculating the cost divided by the 
         # place value modulo 10 to get the remainder as to avoid index out of range error
-        countArrIdx = (int(arr[i].get_cost_per_pax() * 100) // place) % 10
+        countArrIdx = (key(arr[i]) // place) % 10
 
         # we will retrieve the element from the countArr using the countArrIdx we calculated above.
         # the retrieved element minus one (to account for indexing) will be the index of the element 
@@ -50,7 +54,7 @@ def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False) -> Non
     for i in range(n):
         arr[i] = outputArr[i]
 
-def radix_sort(arr:list, reverse:bool=False) -> None:
+def radix_sort(arr:list, reverse:bool=False, key=COST_IN_CENTS_KEY) -> None:
     """
     Do a radix sort (base 10) on the database by cost per pax.
     
@@ -62,9 +66,10 @@ def radix_sort(arr:list, reverse:bool=False) -> None:
     Its time complexity is linear in nature which can be significantly faster than other sorting
     algorithms for larger arrays, but it is also slower for smaller arrays.
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr (list): The array of elements to sort by package cost per pax
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the non-negative integer field to sort by, see field_keys.py (Default: COST_IN_CENTS_KEY)
     
     Best time complexity: O(d(n+b))
     Worst time complexity: O(d(n+b))
@@ -72,19 +77,18 @@ def radix_sort(arr:list, reverse:bool=False) -> None:
     where d is the number of digits in the largest number
     and b is the base number, 10. 
     
-    Note that I multiplied the cost per pax by 100 as 
-    it is a float with a decimal place of 2
+    Note that the cost per pax is sorted by its integer number of cents
+    which is stored in each record so that it does not have to be converted in every pass
     
     References:
     - Radix Sort Algorithm Introduction in 5 Minutes
         - https://www.youtube.com/watch?v=XiuSW_mEn7g&feature=youtu.be
     """
     # Find the maximum number to know number of digits
-    maxCostEl = max(arr, key=lambda x : x.get_cost_per_pax())
-    maxCost = int(maxCostEl.get_cost_per_pax() * 100)
+    maxCost = max(map(key, arr))
 
     # Do counting sort for every digit based on palce value
     place = 1
     while (maxCost // place > 0):
-        counting_sort_for_radix_sort(arr, place, reverse=reverse)
+        counting_sort_for_radix_sort(arr, place, reverse=reverse, key=key)
         place *= 10
\ No newline at end of file
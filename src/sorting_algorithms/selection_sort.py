@@ -1,10 +1,14 @@
-def selection_sort(arr:list, reverse:bool=False) -> None:
+# import local python files
+from field_keys import PACKAGE_NAME_KEY
+
+def selection_sort(arr:list, reverse:bool=False, key=PACKAGE_NAME_KEY) -> None:
     """
     Do a selection sort by package name
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: PACKAGE_NAME_KEY)
     
     Best time complexity: O(n^2)
     Worst time complexity: O(n^2)
@@ -19,11 +23,11 @@ def selection_sort(arr:list, reverse:bool=False) -> None:
         for j in range(i + 1, dbSize):
             if (reverse):
                 # find the next biggest element to compare with index
-                if (arr[j].get_package_name() > arr[index].get_package_name()):
+                if (key(arr[j]) > key(arr[index])):
                     index = j
             else:
                 # find the next smallest element to compare with index
-                if (arr[j].get_package_name() < arr[index].get_package_name()):
+                if (key(arr[j]) < key(arr[index])):
                     index = j
 
         if (index != i):
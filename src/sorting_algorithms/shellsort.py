@@ -1,4 +1,7 @@
-def shellsort(arr:list, reverse:bool=False) -> None:
+# import local python files
+from field_keys import PAX_NUM_KEY
+
+def shellsort(arr:list, reverse:bool=False, key=PAX_NUM_KEY) -> None:
     """
     Shellsort algorithm works like the insertion sort algorithm but
     shellsort will sort the elements that are far apart from each other,
@@ -7,9 +10,10 @@ def shellsort(arr:list, reverse:bool=False) -> None:
     
     Sorts by pax number
     
-    Requires 2 arguments:
-    - arr (list): The array of elements to sort by package cost per pax
+    Requires 3 arguments:
+    - arr (list): The array of elements to sort by pax number
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+    - key (function): the key extractor of the field to sort by, see field_keys.py (Default: PAX_NUM_KEY)
     
     Best Time Complexity: O(n log n)
     Average Time Complexity: O(n log n)
@@ -29,6 +33,7 @@ def shellsort(arr:list, reverse:bool=False) -> None:
         # loop through the elements in the array in intervals of the gap
         for i in range(gap, len(arr)):
             temp = arr[i] # save the current element as temp
+            tempKey = key(temp)
 
             # rearrange the elements at n/2, n/4, n/8,... intervals
             j = i
@@ -36,13 +41,13 @@ def shellsort(arr:list, reverse:bool=False) -> None:
                 # if j is still greater or equal to the gap,
                 # checks if the element at j-gap is greater than temp,
                 # where j - gap is the element at the first element of the gap
-                while (j >= gap and arr[j - gap].get_pax_num() > temp.get_pax_num()):
+                while (j >= gap and key(arr[j - gap]) > tempKey):
                     arr[j] = arr[j - gap] # if it is, shift the elements by replacing the 
                                           # element at j with the element at j-gap
                     j -= gap
             else:
                 # same as the previous while loop, but checks if the element at j-gap is less than temp
-                while (j >= gap and arr[j - gap].get_pax_num() < temp.get_pax_num()):
+                while (j >= gap and key(arr[j - gap]) < tempKey):
                     arr[j] = arr[j - gap]
                     j -= gap
 
@@ -0,0 +1,259 @@
+"""
+This file contains the sqlite3 queries used by the HotelDatabase object
+when it is in the SQL query mode.
+
+In the SQL query mode, the records are not loaded into memory. Instead, the searches
+are done as indexed SQL queries on the sqlite3 database file and only the page of records
+being displayed will be loaded. Sorting is done with an ORDER BY clause instead of reordering
+the records. Changes to the records are also written directly to the database file.
+
+The queries are the same if the records are kept in an in-memory sqlite3 database instead
+which is then backed up to the database file when it is saved (see read_db_file() in functions.py).
+
+All rows returned are in the same order as the HotelDatabase's bulk_load rows,
+(packageName, customerName, paxNum, costInCents, rowId)
+"""
+
+# import standard libraries
+import sqlite3
+
+# import local python files
+from functions import STAYCATION_RECORDS_TABLE, STAYCATION_BOOKINGS_TABLE, is_normalised_schema
+
+# the columns to select in the same order as the HotelDatabase's bulk_load rows,
+# the cost is kept in cents since the cost is stored as an INTEGER
+RECORD_COLUMNS = "packageName, customerName, paxNum, costPerPax, ROWID"
+
+# the indexes on the staycation records table for the searches and sorting in the SQL query mode
+INDEXED_COLUMNS = ("customerName", "packageName", "costPerPax", "paxNum")
+
+# the indexes on the staycation bookings table in the normalised schema
+# (the names are already indexed by the UNIQUE constraints of the lookup tables)
+NORMALISED_INDEXED_COLUMNS = ("customerId", "packageId", "costPerPax", "paxNum")
+
+# the conditions used for the searches in the SQL query mode
+CUSTOMER_NAME_CONDITION = "customerName = ?"
+PACKAGE_NAME_CONDITION = "packageName = ?"
+RANGE_OF_COST_CONDITION = "costPerPax BETWEEN ? AND ?"
+
+def create_index_statements(normalisedSchema:bool=False) -> list:
+    """
+    Returns the CREATE INDEX statements for the indexes on the staycation records table
+
+    Optional argument:
+    - normalisedSchema (bool): to return the statements for the staycation bookings table 
+                               of the normalised schema instead, defaults to False
+    """
+    table, columns = (STAYCATION_BOOKINGS_TABLE, NORMALISED_INDEXED_COLUMNS) if (normalisedSchema) \
+                     else (STAYCATION_RECORDS_TABLE, INDEXED_COLUMNS)
+    return [f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})" for column in columns]
+
+def create_indexes(con:sqlite3.Connection) -> None:
+    """
+    Create the indexes on the customer name, package name, cost per pax, and number of pax columns
+    if they do not exist yet. The indexes are persisted in the sqlite3 database file.
+
+    Note: The indexes will be dropped together with the table if the table is dropped.
+
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    with con:
+        for statement in create_index_statements(is_normalised_schema(con)):
+            con.execute(statement)
+
+def is_in_memory_db(con:sqlite3.Connection) -> bool:
+    """
+    Returns True if the main database of the connection is an in-memory database (":memory:")
+    instead of a sqlite3 database file
+
+    Requires one argument:
+    - con (sqlite3.Connection)
+    """
+    # the main database is always listed first and its file name is an empty string for an in-memory database
+    # (all the rows are fetched so that the statement is not left active)
+    return not con.execute("PRAGMA database_list").fetchall()[0][2]
+
+def build_where_clause(conditions:list) -> str:
+    """
+    Returns the WHERE clause by joining the conditions with AND or an empty string if there are no conditions
+
+    Requires one argument:
+    - conditions (list): the array of SQL conditions
+    """
+    if (not conditions):
+        return ""
+    return "WHERE " + " AND ".join(conditions)
+
+def count_records(con:sqlite3.Connection, where:str=None, params:tuple=()) -> int:
+    """
+    Returns the number of records in the staycation records table
+
+    Requires one argument:
+    - con (sqlite3.Connection)
+
+    Optional arguments:
+    - where (str): the SQL condition that the records must match, e.g. CUSTOMER_NAME_CONDITION, defaults to None
+    - params (tuple): the parameters for the condition, defaults to an empty tuple
+    """
+    whereClause = build_where_clause([where] if (where) else [])
+    return con.execute(f"SELECT COUNT(*) FROM {STAYCATION_RECORDS_TABLE} {whereClause}", params).fetchone()[0]
+
+def query_total_revenue(con:sqlite3.Connection, where:str=None, params:tuple=()) -> int:
+    """
+    Returns the total revenue in cents (the cost per pax multiplied by the number of pax) of the records
+
+    Requires one argument:
+    - con (sqlite3.Connection)
+
+    Optional arguments:
+    - where (str): the SQL condition that the records must match, e.g. RANGE_OF_COST_CONDITION, defaults to None
+    - params (tuple): the parameters for the condition, defaults to an empty tuple
+    """
+    whereClause = build_where_clause([where] if (where) else [])
+    return con.execute(f"SELECT COALESCE(SUM(costPerPax * paxNum), 0) FROM {STAYCATION_RECORDS_TABLE} {whereClause}", params).fetchone()[0]
+
+def query_names_with_prefix(con:sqlite3.Connection, column:str, prefix:str, limit:int=-1) -> list:
+    """
+    Returns the distinct names in the column that start with the prefix (case-insensitive for ASCII letters)
+    in ascending order
+
+    Requires three arguments:
+    - con (sqlite3.Connection)
+    - column (str): "customerName" or "packageName"
+    - prefix (str)
+
+    Optional argument:
+    - limit (int): the maximum number of names to return, defaults to -1 for all the names
+    """
+    # escape the wildcards of the LIKE pattern so that they are matched literally
+    pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    rows = con.execute(
+        f"SELECT DISTINCT {column} FROM {STAYCATION_RECORDS_TABLE} WHERE {column} LIKE ? ESCAPE '\\' ORDER BY {column} LIMIT ?",
+        (pattern, limit)
+    ).fetchall()
+    return [row[0] for row in rows]
+
+def query_max_values(con:sqlite3.Connection, where:str=None, params:tuple=()) -> tuple:
+    """
+    Returns the length of the longest customer name and package name, the largest cost per pax,
+    and the largest number of pax in a tuple which are used for the table padding when displaying the records.
+
+    Requires one argument:
+    - con (sqlite3.Connection)
+
+    Optional arguments:
+    - where (str): the SQL condition that the records must match, defaults to None
+    - params (tuple): the parameters for the condition, defaults to an empty tuple
+    """
+    whereClause = build_where_clause([where] if (where) else [])
+    return con.execute(
+        f"SELECT MAX(LENGTH(customerName)), MAX(LENGTH(packageName)), MAX(costPerPax) / 100.0, MAX(paxNum) FROM {STAYCATION_RECORDS_TABLE} {whereClause}",
+        params
+    ).fetchone()
+
+def query_page(con:sqlite3.Connection, orderColumn:str, descendingOrder:bool, limit:int, where:str=None, params:tuple=(), \
+               afterKey:tuple=None, beforeKey:tuple=None, fromEnd:bool=False, offset:int=0) -> list:
+    """
+    Returns a page of rows ordered by the orderColumn and then by the ROWID to break ties.
+    Each row has the value of the orderColumn appended to the back, e.g. (..., rowId, orderColumnValue)
+    so that it can be used as the key for the next/previous page.
+
+    Keyset pagination is used if afterKey or beforeKey is defined, which will seek 
+    directly to the page using the index instead of skipping all rows before it like OFFSET does.
+
+    Requires four arguments:
+    - con (sqlite3.Connection)
+    - orderColumn (str): the column to order the rows by, e.g. "customerName" or "ROWID"
+    - descendingOrder (bool): True if the rows are to be ordered in descending order
+    - limit (int): the number of rows in the page
+
+    Optional arguments:
+    - where (str): the SQL condition that the rows must match, defaults to None
+    - params (tuple): the parameters for the condition, defaults to an empty tuple
+    - afterKey (tuple): the (orderColumnValue, rowId) of the row before the page, defaults to None
+    - beforeKey (tuple): the (orderColumnValue, rowId) of the row after the page, defaults to None
+    - fromEnd (bool): to get the last rows instead of the first rows, defaults to False
+    - offset (int): the number of rows to skip, only used when there is no afterKey or beforeKey, defaults to 0
+    """
+    conditions = [where] if (where) else []
+    queryParams = list(params)
+
+    # scan in the opposite order when getting the page before the beforeKey or the last page
+    # and reverse the rows back to the correct order afterwards
+    reverseScan = (fromEnd or beforeKey is not None)
+    scanInDescendingOrder = (descendingOrder != reverseScan)
+    direction = "DESC" if (scanInDescendingOrder) else "ASC"
+    comparison = "<" if (scanInDescendingOrder) else ">"
+
+    seekKey = beforeKey if (beforeKey is not None) else afterKey
+    if (seekKey is not None):
+        conditions.append(f"({orderColumn}, ROWID) {comparison} (?, ?)")
+        queryParams.extend(seekKey)
+        offset = 0
+
+    rows = con.execute(
+        f"SELECT {RECORD_COLUMNS}, {orderColumn} FROM {STAYCATION_RECORDS_TABLE} {build_where_clause(conditions)} " \
+        f"ORDER BY {orderColumn} {direction}, ROWID {direction} LIMIT ? OFFSET ?",
+        queryParams + [limit, offset]
+    ).fetchall()
+
+    if (reverseScan):
+        rows.reverse()
+    return rows
+
+def query_record(con:sqlite3.Connection, rowId:int) -> tuple:
+    """
+    Returns the row with the ROWID or None if there is no such row (e.g. it was deleted)
+
+    Requires two arguments:
+    - con (sqlite3.Connection)
+    - rowId (int)
+    """
+    return con.execute(f"SELECT {RECORD_COLUMNS} FROM {STAYCATION_RECORDS_TABLE} WHERE ROWID = ?", (rowId,)).fetchone()
+
+def insert_record(con:sqlite3.Connection, record) -> None:
+    """
+    Insert the record into the staycation records table and set the record's ROWID
+
+    Requires two arguments:
+    - con (sqlite3.Connection)
+    - record (RecordData)
+    """
+    with con:
+        cur = con.execute(
+            f"INSERT INTO {STAYCATION_RECORDS_TABLE} (customerName, packageName, paxNum, costPerPax) VALUES (?, ?, ?, ?)",
+            (record.get_customer_name(), record.get_package_name(), record.get_pax_num(), record.get_cost_in_cents())
+        )
+        rowId = cur.lastrowid
+        if (not rowId):
+            # the ROWID of a row inserted by the trigger of the normalised schema's view is not returned, 
+            # but it is the largest ROWID as the new row is given the ROWID after the last row
+            rowId = con.execute(f"SELECT MAX(ROWID) FROM {STAYCATION_RECORDS_TABLE}").fetchone()[0]
+    record.set_row_id(rowId)
+
+def update_record(con:sqlite3.Connection, record) -> None:
+    """
+    Update the row of the record in the staycation records table
+
+    Requires two arguments:
+    - con (sqlite3.Connection)
+    - record (RecordData)
+    """
+    with con:
+        con.execute(
+            f"UPDATE {STAYCATION_RECORDS_TABLE} SET customerName = ?, packageName = ?, paxNum = ?, costPerPax = ? WHERE ROWID = ?",
+            (record.get_customer_name(), record.get_package_name(), record.get_pax_num(), \
+             record.get_cost_in_cents(), record.get_row_id())
+        )
+
+def delete_record(con:sqlite3.Connection, rowId:int) -> None:
+    """
+    Delete the row with the ROWID from the staycation records table
+
+    Requires two arguments:
+    - con (sqlite3.Connection)
+    - rowId (int)
+    """
+    with con:
+        con.execute(f"DELETE FROM {STAYCATION_RECORDS_TABLE} WHERE ROWID = ?", (rowId,))
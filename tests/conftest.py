@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the tests of the files in src.
+
+The tests are run from the root of the repository with "python -m pytest -q".
+"""
+
+# import standard libraries
+import sys, pathlib, builtins
+
+# the files in src import each other by their file names
+SRC_DIR_PATH = pathlib.Path(__file__).parent.parent.joinpath("src").resolve()
+if (str(SRC_DIR_PATH) not in sys.path):
+    sys.path.insert(0, str(SRC_DIR_PATH))
+
+# import third-party libraries
+import pytest
+
+# import local python files
+import functions, autosave, background_save, import_export_records
+from db_connection import ConnectionManager
+
+# the files that import the paths or the connection from functions.py directly
+MODULES_USING_DB_FILES = (functions, autosave, background_save, import_export_records)
+
+@pytest.fixture
+def db_files(tmp_path, monkeypatch):
+    """
+    Point the sqlite3 database file, the journal, the background save, the shards, and the snapshot
+    at a temporary directory with its own connection so that the tests never touch the files in src.
+
+    Returns a dictionary of the patched names to their values, e.g. db_files["DB_FILE_PATH"].
+    """
+    dbFilePath = tmp_path.joinpath(functions.DB_FILE_NAME)
+    patchedNames = {
+        "FILE_PATH": tmp_path,
+        "DB_FILE_PATH": dbFilePath,
+        "DB_WAL_FILE_PATH": tmp_path.joinpath(functions.DB_FILE_NAME + "-wal"),
+        "DB_CONNECTION": ConnectionManager(dbFilePath),
+        "SHARDED_DB_DIR_PATH": tmp_path.joinpath(functions.SHARDED_DB_DIR_NAME),
+        "SNAPSHOT_FILE_PATH": tmp_path.joinpath(functions.SNAPSHOT_FILE_NAME),
+        "JOURNAL_FILE_PATH": tmp_path.joinpath(functions.JOURNAL_FILE_NAME),
+        "BGSAVE_FILE_PATH": tmp_path.joinpath(functions.BGSAVE_FILE_NAME)
+    }
+    for module in MODULES_USING_DB_FILES:
+        for name, value in patchedNames.items():
+            if (hasattr(module, name)):
+                monkeypatch.setattr(module, name, value)
+
+    yield patchedNames
+    patchedNames["DB_CONNECTION"].close()
+
+@pytest.fixture
+def scripted_input(monkeypatch):
+    """
+    Returns a function to answer the input() prompts with the given answers in order,
+    e.g. scripted_input("3", "7", "y", "x") to change the number of pax of a record to 7 in edit_record().
+    """
+    def answer(*answers):
+        remainingAnswers = iter(answers)
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(remainingAnswers))
+    return answer
+
+def query_rows(dbFiles:dict) -> list:
+    """
+    Returns the (ROWID, customerName, packageName, paxNum, costPerPax) rows in the
+    sqlite3 database file of the db_files fixture in ascending order of their ROWID
+    """
+    with dbFiles["DB_CONNECTION"] as con:
+        return con.execute(
+            f"SELECT ROWID, customerName, packageName, paxNum, costPerPax FROM {functions.STAYCATION_RECORDS_TABLE} ORDER BY ROWID"
+        ).fetchall()
+
+def get_rows(db) -> list:
+    """
+    Returns the (ROWID, customerName, packageName, paxNum, costPerPax) rows of the HotelDatabase object's records in their order
+    """
+    return functions.get_record_rows(db.get_array())
@@ -0,0 +1,58 @@
+"""
+Tests for the background autosave thread (see autosave.py)
+"""
+
+# import standard libraries
+from threading import Thread
+
+# import local python files
+import autosave
+from conftest import query_rows, get_rows
+from functions import save_db_file, open_journal
+from mutation_journal import get_rotated_file_path
+from hotel_record import HotelDatabase
+
+def test_records_can_be_changed_while_the_flush_is_writing(db_files, monkeypatch):
+    db = HotelDatabase()
+    for i in range(3):
+        db.add_record(f"Package {i}", f"Customer {i}", i + 1, 100 + i)
+    save_db_file(db, printSuccessMsg=False)
+    open_journal(db)
+    db.add_record("Package 3", "Customer 3", 4, 103)
+    rowsBeforeFlush = get_rows(db)
+
+    # add a record from another thread while the changes are being written after the snapshot handoff
+    lockAcquired = []
+    def add_record_during_write():
+        acquired = db.lock.acquire(timeout=5)
+        lockAcquired.append(acquired)
+        if (acquired):
+            try:
+                db.add_record("Package 4", "Customer 4", 5, 104)
+            finally:
+                db.lock.release()
+
+    write_changes_to_db_file = autosave.write_changes_to_db_file
+    def write_changes_with_concurrent_add(con, changes):
+        concurrentThread = Thread(target=add_record_during_write)
+        concurrentThread.start()
+        concurrentThread.join()
+        write_changes_to_db_file(con, changes)
+    monkeypatch.setattr(autosave, "write_changes_to_db_file", write_changes_with_concurrent_add)
+
+    autosaveThread = autosave.AutosaveThread(db)
+    assert autosaveThread.flush()
+    assert lockAcquired == [True]
+
+    # only the changes copied in the handoff are written and the rotated journal is discarded after the commit
+    assert query_rows(db_files) == rowsBeforeFlush
+    assert not get_rotated_file_path(db_files["JOURNAL_FILE_PATH"]).exists()
+
+    # the record added during the write is kept as an unsaved change for the next flush
+    addedRecords = db.get_unsaved_changes()[0]
+    assert [record.get_customer_name() for record in addedRecords] == ["Customer 4"]
+    monkeypatch.setattr(autosave, "write_changes_to_db_file", write_changes_to_db_file)
+    assert autosaveThread.flush()
+    assert query_rows(db_files) == get_rows(db)
+    assert not autosaveThread.flush()
+    assert autosaveThread.get_metrics()["flushes"] == 2
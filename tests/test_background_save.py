@@ -0,0 +1,59 @@
+"""
+Tests for the fork-based background saves (see background_save.py)
+"""
+
+# import standard libraries
+import os
+
+# import third-party libraries
+import pytest
+
+# import local python files
+from conftest import query_rows, get_rows
+from functions import save_db_file, read_db_file, promote_background_save, get_db_file_version
+from background_save import write_background_save, start_background_save
+from hotel_record import HotelDatabase
+
+def make_saved_db(numOfRecords:int=3) -> HotelDatabase:
+    db = HotelDatabase()
+    for i in range(numOfRecords):
+        db.add_record(f"Package {i}", f"Customer {i}", i + 1, 100 + i)
+    save_db_file(db, printSuccessMsg=False)
+    return db
+
+def test_finished_background_save_is_promoted_on_startup(db_files):
+    make_saved_db()
+    with db_files["DB_CONNECTION"] as con:
+        dbVersion = get_db_file_version(con)
+
+    # the child process finished writing the new database file but the program
+    # was terminated before the parent process replaced the old database file
+    newRows = [(1, "Customer 0", "Package 0", 1, 100), (2, "Customer 5", "Package 5", 6, 1999)]
+    write_background_save(newRows, ("Not Sorted", 0), False, dbVersion + 1)
+    assert db_files["BGSAVE_FILE_PATH"].is_file()
+
+    db = read_db_file()
+    assert not db_files["BGSAVE_FILE_PATH"].exists()
+    assert get_rows(db) == newRows
+    with db_files["DB_CONNECTION"] as con:
+        assert get_db_file_version(con) == dbVersion + 1
+
+def test_nothing_is_promoted_without_a_background_save(db_files):
+    db = make_saved_db()
+    assert not promote_background_save()
+    assert query_rows(db_files) == get_rows(db)
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="background saves need os.fork()")
+def test_background_save_replaces_the_database_file(db_files):
+    db = make_saved_db()
+    db.add_record("Package 9", "Customer 9", 2, 50)
+    db.sort_by_customer_name(reverse=True)
+
+    backgroundSave = start_background_save(db)
+    assert backgroundSave is not None
+    assert backgroundSave.wait()
+    assert not db_files["BGSAVE_FILE_PATH"].exists()
+
+    # the records were renumbered in their sorted order in the new database file
+    assert query_rows(db_files) == get_rows(db)
+    assert [row[0] for row in query_rows(db_files)] == [1, 2, 3, 4]
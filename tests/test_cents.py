@@ -0,0 +1,49 @@
+"""
+Tests for storing the cost per pax as an integer number of cents (see convert_to_cents() in functions.py)
+"""
+
+# import third-party libraries
+import pytest
+
+# import local python files
+from conftest import query_rows
+from functions import convert_to_cents, format_price, save_db_file, read_db_file
+from hotel_record import HotelDatabase, RecordData
+
+@pytest.mark.parametrize("price, expectedCents", [
+    (0, 0),
+    (19.99, 1999),
+    ("19.99", 1999),
+    (0.1 + 0.2, 30),
+    (1.005, 100), # 1.005 is stored as 1.00499999... in binary
+    ("1000", 100000),
+    (999.999, 100000),
+    (4.35, 435) # 4.35 * 100 is 434.99999999999994
+])
+def test_convert_to_cents(price, expectedCents):
+    cents = convert_to_cents(price)
+    assert cents == expectedCents
+    assert isinstance(cents, int)
+
+def test_record_stores_the_cost_in_cents():
+    record = RecordData("Package", "Customer", "3", "4.35")
+    assert record.get_cost_in_cents() == 435
+    assert record.get_cost_per_pax() == 4.35
+
+    record.set_cost_per_pax(0.1 + 0.2)
+    assert record.get_cost_in_cents() == 30
+    assert format_price(record.get_cost_per_pax()) == "$0.30"
+
+def test_cents_are_saved_as_integers(db_files):
+    db = HotelDatabase()
+    for cost in (0.1, 0.2, 4.35, 19.99):
+        db.add_record("Package", "Customer", 1, cost)
+    save_db_file(db, printSuccessMsg=False)
+
+    assert [row[4] for row in query_rows(db_files)] == [10, 20, 435, 1999]
+    with db_files["DB_CONNECTION"] as con:
+        assert con.execute("SELECT DISTINCT typeof(costPerPax) FROM StaycationRecords").fetchall() == [("integer",)]
+
+    # the total is summed exactly in cents instead of accumulating the float rounding errors
+    reloadedDB = read_db_file()
+    assert sum(record.get_cost_in_cents() for record in reloadedDB.get_array()) == 2464
@@ -0,0 +1,61 @@
+"""
+Tests for only saving the records that were added, edited, or deleted since the last save (see save_db_file() in functions.py)
+"""
+
+# import local python files
+from conftest import query_rows, get_rows
+from functions import save_db_file, read_db_file
+from hotel_record import HotelDatabase
+
+def make_db(numOfRecords:int) -> HotelDatabase:
+    db = HotelDatabase()
+    for i in range(numOfRecords):
+        db.add_record(f"Package {i % 3}", f"Customer {i}", i % 9 + 1, 100 + i)
+    return db
+
+def test_new_records_are_given_the_rowids_after_the_last_row(db_files):
+    db = make_db(5)
+    save_db_file(db, printSuccessMsg=False)
+    assert [row[0] for row in query_rows(db_files)] == [1, 2, 3, 4, 5]
+
+    # delete the last row so that the next ROWIDs still have to follow the largest ROWID in the table
+    db.delete_record(record=db.get_array()[2])
+    db.add_record("Package 9", "Customer 9", 2, 50)
+    db.add_record("Package 10", "Customer 10", 3, 60)
+    save_db_file(db, printSuccessMsg=False)
+
+    assert [row[0] for row in query_rows(db_files)] == [1, 2, 4, 5, 6, 7]
+    assert query_rows(db_files) == get_rows(db)
+
+def test_incremental_save_keeps_the_order_of_the_records_after_reloading(db_files, scripted_input):
+    db = make_db(6)
+    save_db_file(db, printSuccessMsg=False)
+
+    db.delete_record(record=db.get_array()[0])
+    record = db.get_array()[1]
+    scripted_input("3", "8", "y", "x") # change the number of pax to 8
+    db.edit_record(record)
+    db.add_record("Package 1", "Customer 6", 4, 75)
+    save_db_file(db, printSuccessMsg=False)
+
+    # the records keep their ROWID as the table is not rewritten
+    expectedRows = get_rows(db)
+    assert [row[0] for row in expectedRows] == [2, 3, 4, 5, 6, 7]
+    assert expectedRows[1][3] == 8
+    assert query_rows(db_files) == expectedRows
+
+    reloadedDB = read_db_file()
+    assert get_rows(reloadedDB) == expectedRows
+
+def test_sorted_records_are_rewritten_in_their_new_order(db_files):
+    db = make_db(6)
+    save_db_file(db, printSuccessMsg=False)
+
+    db.sort_by_customer_name(reverse=True)
+    save_db_file(db, printSuccessMsg=False)
+
+    # the whole table is rewritten and the records are renumbered in their sorted order
+    rows = query_rows(db_files)
+    assert [row[0] for row in rows] == list(range(1, 7))
+    assert [row[1] for row in rows] == sorted((f"Customer {i}" for i in range(6)), reverse=True)
+    assert rows == get_rows(db)
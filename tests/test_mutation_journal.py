@@ -0,0 +1,53 @@
+"""
+Tests for replaying the journal of the changes into the sqlite3 database file (see mutation_journal.py)
+"""
+
+# import local python files
+from conftest import query_rows, get_rows
+from functions import save_db_file, read_db_file, open_journal, replay_journal
+from mutation_journal import read_journal
+from hotel_record import HotelDatabase
+
+def make_journalled_db(db_files, numOfRecords:int=4) -> HotelDatabase:
+    db = HotelDatabase()
+    for i in range(numOfRecords):
+        db.add_record(f"Package {i}", f"Customer {i}", i + 1, 100 + i)
+    save_db_file(db, printSuccessMsg=False)
+    open_journal(db)
+    return db
+
+def test_truncated_last_entry_is_ignored_on_replay(db_files, scripted_input):
+    db = make_journalled_db(db_files)
+    db.add_record("Package 9", "Customer 9", 2, 19.99)
+    db.delete_record(record=db.get_array()[0])
+    scripted_input("3", "7", "y", "x") # change the number of pax to 7
+    db.edit_record(db.get_array()[0])
+    expectedRows = get_rows(db)
+
+    # the program is terminated in the middle of writing the next entry
+    db.journal.close()
+    with open(db_files["JOURNAL_FILE_PATH"], "a", encoding="utf-8") as f:
+        f.write('{"op":"add","rowId":6,"customerName":"Trunc')
+
+    assert [entry["op"] for entry in read_journal(db_files["JOURNAL_FILE_PATH"])] == ["begin", "add", "delete", "edit"]
+    assert replay_journal() == 3
+    assert not db_files["JOURNAL_FILE_PATH"].exists()
+    assert query_rows(db_files) == expectedRows
+
+    reloadedDB = read_db_file()
+    assert get_rows(reloadedDB) == expectedRows
+
+def test_journal_is_not_replayed_after_the_changes_were_saved(db_files):
+    db = make_journalled_db(db_files)
+    db.add_record("Package 9", "Customer 9", 2, 50)
+    journalFilePath = db_files["JOURNAL_FILE_PATH"]
+    savedJournal = journalFilePath.read_bytes()
+
+    # the changes are saved but the program is terminated before the journal is truncated
+    save_db_file(db, printSuccessMsg=False)
+    db.journal.close()
+    journalFilePath.write_bytes(savedJournal)
+
+    assert replay_journal() == 0
+    assert not journalFilePath.exists()
+    assert query_rows(db_files) == get_rows(db)
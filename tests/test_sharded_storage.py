@@ -0,0 +1,45 @@
+"""
+Tests for saving and loading the records as a directory of sqlite3 database files (see sharded_storage.py)
+"""
+
+# import local python files
+from conftest import get_rows
+from functions import save_db_file, read_db_file
+from sharded_storage import write_sharded_db, read_sharded_db, get_shard_file_paths
+from hotel_record import HotelDatabase
+
+def test_rows_round_trip_through_the_shards(tmp_path):
+    dirPath = tmp_path.joinpath("records.shards")
+    rows = [(rowId, f"Customer {rowId % 7}", f"Package {rowId % 3}", rowId % 9 + 1, 1000 + rowId) for rowId in range(1, 101)]
+    write_sharded_db(dirPath, rows, ("Not Sorted", 0), numOfShards=3)
+
+    shardFilePaths = get_shard_file_paths(dirPath)
+    assert len(shardFilePaths) == 3
+
+    readRows, configTuple = read_sharded_db(dirPath)
+    assert configTuple == ("Not Sorted", 0)
+    assert readRows == [(packageName, customerName, paxNum, costPerPax, rowId) \
+                        for rowId, customerName, packageName, paxNum, costPerPax in rows]
+
+def test_saving_the_shards_again_replaces_the_old_shards(tmp_path):
+    dirPath = tmp_path.joinpath("records.shards")
+    rows = [(rowId, f"Customer {rowId % 5}", "Package", 1, 100) for rowId in range(1, 21)]
+    write_sharded_db(dirPath, rows, ("Not Sorted", 0), numOfShards=4)
+    write_sharded_db(dirPath, rows[:10], ("Not Sorted", 0), numOfShards=4)
+    assert len(read_sharded_db(dirPath)[0]) == 10
+
+    # the temporary directories of the new and old shards are removed afterwards
+    assert [path.name for path in dirPath.parent.iterdir()] == [dirPath.name]
+
+def test_hotel_database_round_trips_through_the_shards(db_files):
+    db = HotelDatabase()
+    for i in range(50):
+        db.add_record(f"Package {i % 4}", f"Customer {i % 11}", i % 9 + 1, 50.5 + i)
+    db.sort_by_package_cost(reverse=True)
+    save_db_file(db, printSuccessMsg=False, sharded=True)
+    assert get_shard_file_paths(db_files["SHARDED_DB_DIR_PATH"])
+
+    reloadedDB = read_db_file(sharded=True)
+    assert get_rows(reloadedDB) == get_rows(db)
+    assert reloadedDB.sort_order == db.sort_order
+    assert reloadedDB.descending_flag == db.descending_flag
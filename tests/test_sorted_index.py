@@ -0,0 +1,86 @@
+"""
+Tests for the range totals of the sorted index of the package costs which are kept in Fenwick trees
+(see SortedIndex.py and FenwickTree.py in data_structures)
+"""
+
+# import standard libraries
+import random
+
+# import local python files
+from data_structures.FenwickTree import FenwickTree
+from data_structures.SortedIndex import SortedIndex
+from field_keys import COST_IN_CENTS_KEY, total_cost_in_cents_key
+from functions import format_price
+from hotel_record import HotelDatabase, RecordData
+
+def brute_force_range(records:dict, lowInCents:int, highInCents:int) -> tuple:
+    inRange = [record for record in records.values() if (lowInCents <= record.get_cost_in_cents() <= highInCents)]
+    return len(inRange), sum(map(total_cost_in_cents_key, inRange))
+
+def test_fenwick_tree_prefix_sums_match_brute_force():
+    rng = random.Random(7)
+    values = [rng.randint(0, 100) for _ in range(200)]
+    tree = FenwickTree(values)
+    for _ in range(500):
+        index, delta = rng.randrange(len(values)), rng.randint(-50, 50)
+        tree.add(index, delta)
+        values[index] += delta
+
+        low = rng.randrange(len(values))
+        high = rng.randrange(low, len(values))
+        assert tree.prefix_sum(high) == sum(values[:high + 1])
+        assert tree.range_sum(low, high) == sum(values[low:high + 1])
+    assert tree.get_values() == values
+
+def test_cost_range_totals_match_brute_force():
+    rng = random.Random(22)
+    records = {}
+    # a small block size so that the blocks are split and removed many times
+    costIndex = SortedIndex(COST_IN_CENTS_KEY, records.__getitem__, weight=total_cost_in_cents_key, blockSize=4)
+    nextRecordId = 0
+    for step in range(2000):
+        operation = rng.random()
+        if (operation < 0.5 or len(records) < 10):
+            record = RecordData("Package", "Customer", rng.randint(1, 9), rng.randint(1, 300))
+            record.set_record_id(nextRecordId)
+            records[nextRecordId] = record
+            nextRecordId += 1
+            costIndex.insert(record)
+        elif (operation < 0.75):
+            record = records.pop(rng.choice(list(records)))
+            costIndex.delete(record)
+        else:
+            # change the cost per pax or only the number of pax of a booking
+            record = records[rng.choice(list(records))]
+            oldKey, oldWeight = COST_IN_CENTS_KEY(record), total_cost_in_cents_key(record)
+            if (rng.random() < 0.5):
+                record.set_cost_per_pax(rng.randint(1, 300))
+            else:
+                record.set_pax_num(rng.randint(1, 9))
+            costIndex.move_node(record, oldKey, oldWeight)
+
+        if (step % 10 == 0):
+            assert len(costIndex) == len(records)
+            lowInCents = rng.randint(0, 300) * 100
+            highInCents = lowInCents + rng.randint(0, 150) * 100
+            start, stop = costIndex.bisect_left(lowInCents), costIndex.bisect_right(highInCents)
+            assert (stop - start, costIndex.range_weight(start, stop)) == brute_force_range(records, lowInCents, highInCents)
+            assert costIndex.range_weight(0, len(costIndex)) == sum(map(total_cost_in_cents_key, records.values()))
+
+def test_hotel_database_reports_the_total_revenue_of_the_range(monkeypatch, capsys, scripted_input):
+    monkeypatch.setattr(HotelDatabase, "print_from_array", lambda self, arr: None)
+    db = HotelDatabase()
+    for i in range(30):
+        db.add_record(f"Package {i % 4}", f"Customer {i}", i % 5 + 1, 10 + i * 2.5)
+
+    # change the number of pax of a booking in the range so that its total cost changes
+    scripted_input("3", "9", "y", "x")
+    db.edit_record(db.get_array()[5]) # $22.50 per pax
+    capsys.readouterr()
+
+    db.search_for_range_of_cost(20, 50)
+    records = {record.get_record_id(): record for record in db.get_array()}
+    numOfBookings, totalRevenue = brute_force_range(records, 2000, 5000)
+    output = capsys.readouterr().out
+    assert f"Number of bookings: {numOfBookings}" in output
+    assert f"Total revenue: {format_price(totalRevenue / 100)}" in output